@@ -0,0 +1,46 @@
+"""
+Микробенчмарки накладных расходов YougileAPIClient
+"""
+import json
+from typing import Callable, Dict
+
+import requests
+
+from config.settings import settings
+from utils.api_client import YougileAPIClient
+from utils.api_contract import validate_response
+from utils.stub_server import YougileAPIStubServer
+
+
+def build_benchmarks(server: YougileAPIStubServer) -> Dict[str, Callable[[], object]]:
+    """Подготовить клиент против локальной заглушки API и вернуть замеряемые вызовы"""
+    settings.API_URL = server.base_url
+    settings.API_TOKEN = settings.API_TOKEN or "benchmark-token"
+    client = YougileAPIClient()
+    project_data = {"title": "Benchmark Project", "description": "x" * 200}
+    project_id = client.create_project_and_get_id(project_data)
+
+    response = client.get_project(project_id)
+    paging = {"count": 100, "limit": 100, "offset": 0, "next": False}
+    payload = json.dumps({"paging": paging, "content": [dict(project_data, id=str(i))
+                                                        for i in range(100)]}).encode()
+    canned = requests.Response()
+    canned.status_code = 200
+    canned._content = payload
+    canned.encoding = "utf-8"
+
+    request = requests.Request("POST", f"{client.base_url}/projects", json=project_data)
+
+    return {
+        "api.validate_project_data": lambda: client._validate_project_data(project_data),
+        "api.validate_project_id": lambda: client._validate_project_id(project_id),
+        "api.allure_step_wrapper": lambda: client.is_successful_response(response, [200]),
+        "api.status_check_raw": lambda: response.status_code in [200],
+        "api.prepare_request": lambda: client.session.prepare_request(request),
+        "api.json_decode_100_projects": lambda: canned.json(),
+        "api.contract_project_list_100": lambda: validate_response("GET", "/projects", canned),
+        "api.contract_project": lambda: validate_response("GET", f"/projects/{project_id}",
+                                                          response),
+        "api.get_project_roundtrip": lambda: client.get_project(project_id),
+        "api.mirror_find_by_title": lambda: client.mirror.find_by_title("Benchmark Project"),
+    }
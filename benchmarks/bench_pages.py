@@ -0,0 +1,69 @@
+"""
+Микробенчмарки примитивов ожидания и поиска BasePage
+"""
+from typing import Callable, Dict
+
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.projects_page import ProjectsPage
+
+
+class FakeElement:
+    """Элемент-заглушка, сразу доступный для взаимодействия"""
+
+    text = "Benchmark Project"
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def send_keys(self, *value) -> None:
+        pass
+
+
+class FakeDriver:
+    """WebDriver-заглушка без браузера: измеряется только накладной расход Python"""
+
+    title = "Benchmark"
+    current_url = "http://localhost/projects"
+
+    def __init__(self, elements: int = 50):
+        self._element = FakeElement()
+        self._elements = [FakeElement() for _ in range(elements)]
+
+    def find_element(self, by=By.ID, value=None) -> FakeElement:
+        return self._element
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        return self._elements
+
+    def execute(self, driver_command, params=None) -> dict:
+        return {}
+
+
+def build_benchmarks() -> Dict[str, Callable[[], object]]:
+    """Вернуть замеряемые вызовы BasePage поверх драйвера-заглушки"""
+    driver = FakeDriver()
+    page = BasePage(driver)
+    projects_page = ProjectsPage(driver)
+    locator = ProjectsPage.PROJECT_ITEM
+
+    return {
+        "page.find_element": lambda: page.find_element(locator),
+        "page.find_elements": lambda: page.find_elements(locator),
+        "page.is_element_present": lambda: page.is_element_present(locator),
+        "page.wait_for_element_visible": lambda: page.wait_for_element_visible(locator),
+        "page.click_element": lambda: page.click_element(locator),
+        "page.send_keys": lambda: page.send_keys(locator, "text"),
+        "page.get_text": lambda: page.get_text(locator),
+        "page.find_project_by_title": lambda: projects_page.find_project_by_title("missing"),
+    }
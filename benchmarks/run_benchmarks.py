@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Запуск микробенчмарков, сохранение базовой линии и сравнение с ней
+
+    python -m benchmarks.run_benchmarks --save      # записать базовую линию
+    python -m benchmarks.run_benchmarks --compare   # сравнить с базовой линией
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict
+
+from benchmarks import bench_api_client, bench_pages
+from utils.stub_server import YougileAPIStubServer
+
+# Базовая линия хранится в репозитории: каталог reports/ очищается между прогонами
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Минимальное время одного вызова в микросекундах"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def run_all(filter_text: str = "") -> Dict[str, float]:
+    """Выполнить все бенчмарки и вернуть {имя: мкс на вызов}"""
+    server = YougileAPIStubServer().start()
+    try:
+        benchmarks = {}
+        benchmarks.update(bench_api_client.build_benchmarks(server))
+        benchmarks.update(bench_pages.build_benchmarks())
+        results = {}
+        for name, func in benchmarks.items():
+            if filter_text in name:
+                results[name] = measure(func)
+                print(f"{name:<40} {results[name]:>12.2f} мкс")
+        return results
+    finally:
+        server.stop()
+
+
+def save_baseline(results: Dict[str, float], path: str) -> None:
+    """Сохранить результаты как базовую линию"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results_us": results,
+        }, baseline_file, indent=2, sort_keys=True)
+    print(f"Базовая линия сохранена: {path}")
+
+
+def compare_with_baseline(results: Dict[str, float], path: str, threshold: float) -> bool:
+    """Сравнить с базовой линией; вернуть False при регрессии больше порога"""
+    with open(path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["results_us"]
+
+    regressions = []
+    print(f"\n{'бенчмарк':<40} {'база, мкс':>12} {'сейчас, мкс':>12} {'изменение':>10}")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        change = current / baseline[name] - 1
+        marker = "  <-- регрессия" if change > threshold else ""
+        print(f"{name:<40} {baseline[name]:>12.2f} {current:>12.2f} {change:>+9.0%}{marker}")
+        if change > threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nРегрессии (> {threshold:.0%}): {', '.join(regressions)}")
+        return False
+    print("\nРегрессий не обнаружено")
+    return True
+
+
+def main():
+    """Главная функция"""
+    parser = argparse.ArgumentParser(description="Микробенчмарки клиента и Page Object")
+    parser.add_argument("--save", action="store_true", help="Сохранить базовую линию")
+    parser.add_argument("--compare", action="store_true", help="Сравнить с базовой линией")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Файл базовой линии")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Допустимое замедление (доля), по умолчанию 0.2")
+    parser.add_argument("--filter", default="", help="Запускать бенчмарки с подстрокой в имени")
+    args = parser.parse_args()
+    if args.compare and not args.save and not os.path.exists(args.baseline):
+        sys.exit(f"Базовая линия не найдена: {args.baseline} (сохраните ее через --save)")
+
+    results = run_all(args.filter)
+    if args.save:
+        save_baseline(results, args.baseline)
+    if args.compare and not compare_with_baseline(results, args.baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
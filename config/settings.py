@@ -1,8 +1,10 @@
 """
 Конфигурационные настройки для автоматизации тестирования
 """
+import json
 import os
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 
 class Settings:
@@ -12,10 +14,26 @@ class Settings:
     BASE_URL: str = os.getenv("BASE_URL", "https://ru.yougile.com")
     API_URL: str = os.getenv("API_URL", "https://ru.yougile.com/api-v2")
 
+    # Локальная заглушка UI вместо живого сайта
+    LOCAL_STUB: bool = os.getenv("LOCAL_STUB", "false").lower() == "true"
+    STUB_DELAY: float = float(os.getenv("STUB_DELAY", "0"))
+    STUB_PROJECT_COUNT: int = int(os.getenv("STUB_PROJECT_COUNT", "10"))
+    STUB_PADDING_NODES: int = int(os.getenv("STUB_PADDING_NODES", "0"))
+
     # Настройки браузера
     BROWSER: str = os.getenv("BROWSER", "chrome")
+    # Матрица браузеров, например "chrome,firefox": UI тесты параметризуются по браузеру
+    BROWSERS: List[str] = [b.strip() for b in os.getenv("BROWSERS", "").split(",") if b.strip()]
+    # Внешний Selenium Grid или локальные remote-узлы (по одному на браузер)
+    SELENIUM_REMOTE_URL: Optional[str] = os.getenv("SELENIUM_REMOTE_URL")
+    LOCAL_GRID: bool = os.getenv("LOCAL_GRID", "false").lower() == "true"
     HEADLESS: bool = os.getenv("HEADLESS", "false").lower() == "true"
     WINDOW_SIZE: tuple = (1920, 1080)
+    # Разрешить захват сети (только Chrome); performance-лог включается
+    # лишь для драйверов тестов, запрашивающих фикстуру network
+    NETWORK_CAPTURE: bool = os.getenv("NETWORK_CAPTURE", "true").lower() == "true"
+    # Количество браузеров, прогреваемых в фоне при старте pytest (0 - без пула)
+    BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "0"))
 
     # Таймауты
     IMPLICIT_WAIT: int = 10
@@ -29,11 +47,57 @@ class Settings:
     # API настройки
     API_TOKEN: Optional[str] = os.getenv("YOUGILE_TOKEN")
     API_TIMEOUT: int = 30
+    # Источник вариантов данных для data-driven тестов: путь к .jsonl/.csv
+    # или generated:<seed>:<count> (пусто - data-driven тесты пропускаются)
+    DATA_CASES: str = os.getenv("DATA_CASES", "")
+    # Проверка запросов и ответов /projects по контракту (utils/api_contract.py)
+    CONTRACT_VALIDATION: bool = os.getenv("CONTRACT_VALIDATION", "true").lower() == "true"
+    # Доля проверяемых вызовов (1.0 - все; меньше - для нагрузочных прогонов)
+    CONTRACT_SAMPLE_RATE: float = float(os.getenv("CONTRACT_SAMPLE_RATE", "1.0"))
+    # Реакция на нарушение контракта ответа: "fail" или "warn"
+    CONTRACT_MODE: str = os.getenv("CONTRACT_MODE", "fail")
+
+    # Быстрый отказ при недоступности YouGile
+    PREFLIGHT_CHECK: bool = os.getenv("PREFLIGHT_CHECK", "true").lower() == "true"
+    PREFLIGHT_TIMEOUT: int = int(os.getenv("PREFLIGHT_TIMEOUT", "5"))
+    CIRCUIT_BREAKER_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+    # Через сколько секунд разомкнутый по сбоям предохранитель пропускает пробный вызов
+    CIRCUIT_BREAKER_COOLDOWN_S: float = float(os.getenv("CIRCUIT_BREAKER_COOLDOWN_S", "30"))
+    # Что делать с оставшимися тестами при разомкнутом предохранителе: "skip" или "fail"
+    CIRCUIT_BREAKER_MODE: str = os.getenv("CIRCUIT_BREAKER_MODE", "skip")
+
+    # Наполнение рабочего пространства (проекты, доски, колонки, задачи)
+    SEED_WORKERS: int = int(os.getenv("SEED_WORKERS", "16"))
+    SEED_STATE_DIR: str = os.getenv("SEED_STATE_DIR", "reports/seed")
 
     # Пути к файлам
     SCREENSHOTS_DIR: str = "screenshots"
     REPORTS_DIR: str = "reports"
     ALLURE_RESULTS_DIR: str = "allure-results"
+    TRENDS_ENABLED: bool = os.getenv("TRENDS", "true").lower() == "true"
+    TRENDS_DB: str = os.getenv("TRENDS_DB", "reports/trends.sqlite3")
+    TEST_HISTORY_FILE: str = os.getenv("TEST_HISTORY_FILE", "reports/test_history.json")
+
+    # Профилирование локаторов и методов Page Object
+    LOCATOR_PROFILING: bool = os.getenv("LOCATOR_PROFILING", "false").lower() == "true"
+
+    # Пороги soak-прогона
+    SOAK_HEAP_GROWTH_KB_PER_HOUR: float = float(os.getenv("SOAK_HEAP_GROWTH_KB_PER_HOUR", "1024"))
+    SOAK_FD_GROWTH_PER_HOUR: float = float(os.getenv("SOAK_FD_GROWTH_PER_HOUR", "5"))
+    SOAK_P95_DRIFT_RATIO: float = float(os.getenv("SOAK_P95_DRIFT_RATIO", "1.5"))
+    # Снимки первых N секунд (прогрев) не входят в тренды и дрейф
+    SOAK_WARMUP_S: float = float(os.getenv("SOAK_WARMUP_S", "120"))
+
+    # Идентификатор запуска (общий для всех записей одного прогона)
+    RUN_ID: str = os.getenv("TEST_RUN_ID", datetime.now().strftime("%Y%m%d-%H%M%S"))
+
+    # Метрики производительности страниц
+    PERF_METRICS_ENABLED: bool = os.getenv("PERF_METRICS", "true").lower() == "true"
+    PERF_TREND_FILE: str = os.getenv("PERF_TREND_FILE", "reports/perf_trend.jsonl")
+    # Бюджеты по страницам в мс, например: {"login": {"domContentLoaded": 1500}}
+    PERF_BUDGETS: Dict[str, Dict[str, float]] = json.loads(os.getenv("PERF_BUDGETS", "{}"))
+    # Реакция на превышение бюджета: "warn" или "fail"
+    PERF_BUDGET_MODE: str = os.getenv("PERF_BUDGET_MODE", "warn")
 
 
 # Экземпляр настроек
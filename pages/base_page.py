@@ -5,38 +5,77 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import allure
-from typing import Optional
+import time
+from typing import Callable, Optional
+
+from config.settings import settings
+from utils.circuit_breaker import ui_circuit
+from utils.locator_profiler import profiler
+from utils.perf_metrics import record_page_metrics
 
 
 class BasePage:
     """Базовый класс для всех страниц"""
 
+    # Имя страницы для метрик производительности и бюджетов
+    page_name: str = "base"
+
+    def __init_subclass__(cls, **kwargs):
+        """Обернуть публичные методы страниц профилировщиком, если он включен"""
+        super().__init_subclass__(**kwargs)
+        if not settings.LOCATOR_PROFILING:
+            return
+        for name, attr in list(vars(cls).items()):
+            if callable(attr) and not name.startswith("_"):
+                setattr(cls, name, profiler.profile_method(f"{cls.__name__}.{name}", attr))
+
     def __init__(self, driver: WebDriver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 20)
+        if settings.LOCATOR_PROFILING:
+            profiler.instrument(driver)
+
+    def _wait_until(self, locator: tuple, condition: Callable, timeout: int):
+        """Дождаться условия для локатора с учетом профилирования"""
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return WebDriverWait(self.driver, timeout).until(condition(locator))
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            if settings.LOCATOR_PROFILING:
+                profiler.record_lookup(locator, time.perf_counter() - start, timed_out)
 
     def open(self, url: str) -> None:
         """Открыть страницу по URL"""
         with allure.step(f"Открыть страницу {url}"):
-            self.driver.get(url)
+            ui_circuit.check()
+            try:
+                self.driver.get(url)
+            except WebDriverException as e:
+                # Таймаут загрузки и сетевые ошибки (net::ERR_*) - сбой уровня соединения
+                if isinstance(e, TimeoutException) or "net::ERR_" in str(e):
+                    ui_circuit.record_failure(e.msg or type(e).__name__)
+                raise
+            ui_circuit.record_success()
+            if settings.PERF_METRICS_ENABLED:
+                record_page_metrics(self.driver, self.page_name, url)
 
     def find_element(self, locator: tuple, timeout: int = 10) -> Optional[object]:
         """Найти элемент с ожиданием"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            return self._wait_until(locator, EC.presence_of_element_located, timeout)
         except TimeoutException:
             return None
 
     def find_elements(self, locator: tuple, timeout: int = 10) -> list:
         """Найти элементы с ожиданием"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self._wait_until(locator, EC.presence_of_element_located, timeout)
             return self.driver.find_elements(*locator)
         except TimeoutException:
             return []
@@ -45,9 +84,7 @@ class BasePage:
         """Кликнуть по элементу"""
         with allure.step(f"Кликнуть по элементу {locator}"):
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable(locator)
-                )
+                element = self._wait_until(locator, EC.element_to_be_clickable, timeout)
                 element.click()
                 return True
             except TimeoutException:
@@ -57,9 +94,7 @@ class BasePage:
         """Ввести текст в поле"""
         with allure.step(f"Ввести текст '{text}' в поле {locator}"):
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(locator)
-                )
+                element = self._wait_until(locator, EC.presence_of_element_located, timeout)
                 element.clear()
                 element.send_keys(text)
                 return True
@@ -69,9 +104,7 @@ class BasePage:
     def get_text(self, locator: tuple, timeout: int = 10) -> str:
         """Получить текст элемента"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            element = self._wait_until(locator, EC.presence_of_element_located, timeout)
             return element.text
         except TimeoutException:
             return ""
@@ -79,9 +112,7 @@ class BasePage:
     def is_element_present(self, locator: tuple, timeout: int = 5) -> bool:
         """Проверить наличие элемента"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self._wait_until(locator, EC.presence_of_element_located, timeout)
             return True
         except TimeoutException:
             return False
@@ -89,9 +120,7 @@ class BasePage:
     def wait_for_element_visible(self, locator: tuple, timeout: int = 10) -> bool:
         """Дождаться видимости элемента"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self._wait_until(locator, EC.visibility_of_element_located, timeout)
             return True
         except TimeoutException:
             return False
@@ -4,12 +4,15 @@ Page Object модель для страницы авторизации YouGile
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 import allure
+from config.settings import settings
 from .base_page import BasePage
 
 
 class LoginPage(BasePage):
     """Страница авторизации YouGile"""
 
+    page_name = "login"
+
     EMAIL_INPUT = (By.NAME, "email")
     PASSWORD_INPUT = (By.NAME, "password")
     LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
@@ -19,7 +22,7 @@ class LoginPage(BasePage):
 
     def __init__(self, driver: WebDriver):
         super().__init__(driver)
-        self.url = "https://ru.yougile.com/login"
+        self.url = f"{settings.BASE_URL}/login"
 
     @allure.step("Открыть страницу авторизации")
     def open_login_page(self) -> None:
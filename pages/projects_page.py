@@ -4,12 +4,15 @@ Page Object модель для страницы проектов YouGile
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 import allure
+from config.settings import settings
 from .base_page import BasePage
 
 
 class ProjectsPage(BasePage):
     """Страница проектов YouGile"""
 
+    page_name = "projects"
+
     CREATE_PROJECT_BUTTON = (By.CSS_SELECTOR, "button[data-testid='create-project']")
     PROJECT_TITLE_INPUT = (By.CSS_SELECTOR, "input[name='title']")
     PROJECT_DESCRIPTION_INPUT = (By.CSS_SELECTOR, "textarea[name='description']")
@@ -23,9 +26,13 @@ class ProjectsPage(BasePage):
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".success-message")
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-message")
 
+    # XHR страницы к API проектов (для проверок через фикстуру network)
+    CREATE_PROJECT_REQUEST = r"/api-v2/projects$"
+    UPDATE_PROJECT_REQUEST = r"/api-v2/projects/[^/?]+$"
+
     def __init__(self, driver: WebDriver):
         super().__init__(driver)
-        self.url = "https://ru.yougile.com/projects"
+        self.url = f"{settings.BASE_URL}/projects"
 
     @allure.step("Открыть страницу проектов")
     def open_projects_page(self) -> None:
@@ -2,44 +2,436 @@
 """
 Скрипт для запуска тестов в разных режимах
 """
+import ast
+import os
 import sys
+import shutil
 import subprocess
 import argparse
+import tempfile
+import threading
+
+ALLURE_RESULTS_DIR = "allure-results"
+
+
+def start_command(command, env_overrides=None):
+    """Запустить команду с построчной передачей вывода"""
+    env = dict(os.environ, PYTHONUNBUFFERED="1", **(env_overrides or {}))
+    return subprocess.Popen(
+        command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1, env=env
+    )
+
+
+def stream_output(process, prefix=""):
+    """Печатать вывод процесса по мере поступления"""
+    for line in process.stdout:
+        print(f"{prefix}{line}", end="", flush=True)
+    process.stdout.close()
 
 
 def run_command(command):
-    """Выполнить команду и вернуть результат"""
-    try:
-        result = subprocess.run(
-            command, shell=True, check=True, capture_output=True, text=True
-        )
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Ошибка выполнения команды: {e}")
-        print(f"Stderr: {e.stderr}")
+    """Выполнить команду, транслируя вывод, и вернуть результат"""
+    process = start_command(command)
+    stream_output(process)
+    return_code = process.wait()
+    if return_code != 0:
+        print(f"Ошибка выполнения команды (код {return_code}): {command}")
         return False
+    return True
 
 
-def run_ui_tests():
+def run_commands_concurrently(commands, envs=None):
+    """Запустить несколько команд параллельно; вернуть успешность каждой"""
+    envs = envs or {}
+    processes = {
+        name: start_command(command, envs.get(name)) for name, command in commands.items()
+    }
+    threads = [
+        threading.Thread(target=stream_output, args=(process, f"[{name}] "))
+        for name, process in processes.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    results = {}
+    for name, process in processes.items():
+        results[name] = process.wait() == 0
+        if not results[name]:
+            print(f"[{name}] завершился с ошибкой (код {process.returncode})")
+    return results
+
+
+def merge_allure_results(sources, target=ALLURE_RESULTS_DIR):
+    """Объединить результаты Allure из нескольких каталогов"""
+    os.makedirs(target, exist_ok=True)
+    for source in sources:
+        if not os.path.isdir(source):
+            continue
+        for name in os.listdir(source):
+            path = os.path.join(source, name)
+            if os.path.isfile(path):
+                shutil.copy2(path, os.path.join(target, name))
+
+
+def run_ui_tests(extra_args=""):
     """Запустить только UI тесты"""
     print("Запуск UI тестов...")
-    command = "pytest tests/test_ui.py -v --alluredir=allure-results"
+    command = f"pytest tests/test_ui.py -v --alluredir=allure-results {extra_args}"
     return run_command(command)
 
 
-def run_api_tests():
+def run_api_tests(extra_args=""):
     """Запустить только API тесты"""
     print("Запуск API тестов...")
-    command = "pytest tests/test_api.py -v --alluredir=allure-results"
+    command = f"pytest tests/test_api.py -v --alluredir=allure-results {extra_args}"
     return run_command(command)
 
 
-def run_all_tests():
-    """Запустить все тесты"""
-    print("Запуск всех тестов...")
-    command = "pytest tests/ -v --alluredir=allure-results"
-    return run_command(command)
+def run_all_tests(extra_args="", test_files=None):
+    """Запустить API, UI и офлайн-тесты параллельно и объединить результаты Allure"""
+    print("Запуск всех тестов (API, UI и офлайн-тесты утилит параллельно)...")
+    suites = {"api": "tests/test_api.py", "ui": "tests/test_ui.py", "unit": "tests/unit"}
+    if test_files is not None:
+        # Офлайн-тесты выполняются за секунды и не входят в граф импортов --changed-only
+        suites = {name: path for name, path in suites.items()
+                  if path in test_files or name == "unit"}
+    commands = {
+        name: (f"pytest {path} -v --alluredir={ALLURE_RESULTS_DIR}/{name} "
+               f"--clean-alluredir {extra_args}")
+        for name, path in suites.items()
+    }
+    results = run_commands_concurrently(commands)
+    merge_allure_results([f"{ALLURE_RESULTS_DIR}/{name}" for name in suites])
+    return all(results.values())
+
+
+def run_browser_matrix(browsers, extra_args=""):
+    """Запустить UI тесты параллельно в нескольких браузерах и объединить отчеты"""
+    print(f"Запуск UI тестов в браузерах: {', '.join(browsers)}...")
+    commands = {
+        browser: (f"pytest tests/test_ui.py -v --alluredir={ALLURE_RESULTS_DIR}/ui-{browser} "
+                  f"--clean-alluredir {extra_args}")
+        for browser in browsers
+    }
+    # BROWSER тоже: по нему прогревается пул и помечаются тренды и метрики запуска
+    envs = {browser: {"BROWSERS": browser, "BROWSER": browser} for browser in browsers}
+    results = run_commands_concurrently(commands, envs)
+    merge_allure_results([f"{ALLURE_RESULTS_DIR}/ui-{browser}" for browser in browsers])
+    return all(results.values())
+
+
+def show_trends():
+    """Показать значимые замедления тестов и шагов относительно базовой линии"""
+    from utils.trend_store import TrendStore, detect_slowdowns
+
+    print("Анализ трендов длительности...")
+    store = TrendStore()
+    try:
+        slowdowns = {
+            "Тесты": detect_slowdowns(store.series("test_results")),
+            "Шаги Allure": detect_slowdowns(store.series("step_results")),
+        }
+    finally:
+        store.close()
+
+    found = False
+    for title, items in slowdowns.items():
+        if not items:
+            continue
+        found = True
+        print(f"\n{title}:")
+        for item in items:
+            print(f"  {item['key']}: {item['baseline_mean']:.2f} с -> "
+                  f"{item['recent_mean']:.2f} с (x{item['ratio']:.2f}, t={item['t']:.1f})")
+    if not found:
+        print("Значимых замедлений не обнаружено")
+    return not found
+
+
+def report_import_time(modules, top=10):
+    """Показать время импорта модулей набора тестов (python -X importtime)"""
+    statement = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        timings.append((int(cumulative_us), name.rstrip()))
+    print(f"Время импорта ({', '.join(modules)}):")
+    for module in modules:
+        total = next((us for us, name in timings if name.strip() == module), 0)
+        print(f"  {module}: {total / 1000:.1f} мс")
+    print("  Самые долгие импорты (кумулятивно):")
+    for cumulative_us, name in sorted(timings, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:>8.1f} мс {name}")
+
+
+def run_soak(target, duration_min, sample_interval, offline):
+    """Длительный прогон API клиента или WebDriver сессии с отчетом об утечках"""
+    from config.settings import settings
+    from utils import soak
+    from utils.stub_server import StubProcess, YougileAPIStubServer, YougileStubServer
+
+    from utils.circuit_breaker import api_circuit, ui_circuit
+
+    print(f"Soak-прогон {target} на {duration_min} мин...")
+    runner = soak.SoakRunner(target, duration_min * 60, sample_interval,
+                             circuit=api_circuit if target == "api" else ui_circuit)
+    server = None
+    driver = None
+    try:
+        if target == "api":
+            from utils.api_client import YougileAPIClient
+
+            # Заглушки работают в отдельном процессе, чтобы их память и сокеты
+            # не смешивались с замерами клиента
+            if offline:
+                server = StubProcess(YougileAPIStubServer).start()
+                settings.API_URL = server.base_url
+                settings.API_TOKEN = settings.API_TOKEN or "soak-token"
+            from utils.api_contract import contract_validator
+
+            client = YougileAPIClient()
+            report = runner.run(soak.api_cycle(runner, client))
+            report["contract"] = contract_validator.summary()
+        else:
+            from pages.login_page import LoginPage
+            from pages.projects_page import ProjectsPage
+            from utils.driver_factory import create_driver
+
+            if offline:
+                server = StubProcess(
+                    YougileStubServer, project_count=settings.STUB_PROJECT_COUNT
+                ).start()
+                settings.BASE_URL = server.base_url
+            settings.PERF_METRICS_ENABLED = False
+            driver = create_driver(settings.BROWSER, settings.HEADLESS, settings.WINDOW_SIZE)
+            LoginPage(driver).login(settings.TEST_EMAIL, settings.TEST_PASSWORD)
+            projects_page = ProjectsPage(driver)
+            report = runner.run(soak.webdriver_cycle(runner, projects_page),
+                                soak.browser_metrics(driver))
+    finally:
+        if driver is not None:
+            driver.quit()
+        if server is not None:
+            server.stop()
+
+    print(f"Отчет: {soak.save_report(report)}")
+    print(f"Рост heap: {report['heap_growth_kb_per_hour']:.0f} КБ/ч, "
+          f"дескрипторов: {report['fd_growth_per_hour']:.1f}/ч, "
+          f"сокетов: {report['socket_growth_per_hour']:.1f}/ч")
+    for operation, ratio in report["p95_drift"].items():
+        print(f"Дрейф p95 {operation}: x{ratio:.2f}")
+    for name, count in report["errors"].items():
+        print(f"Ошибки {name}: {count}")
+    for message, count in report.get("contract", {}).get("violations", {}).items():
+        print(f"Нарушение контракта ({count}): {message}")
+    for finding in report["findings"]:
+        print(f"ПРОБЛЕМА: {finding}")
+    return not report["findings"]
+
+
+def run_seed(spec_text, name, teardown, offline):
+    """Наполнить рабочее пространство деревом сущностей или удалить его"""
+    from config.settings import settings
+    from utils.stub_server import YougileAPIStubServer
+    from utils.workspace_seeder import WorkspaceSeeder, WorkspaceSpec
+
+    spec = WorkspaceSpec.parse(spec_text)
+    server = None
+    offline_state_dir = None
+    try:
+        if offline:
+            server = YougileAPIStubServer().start()
+            settings.API_URL = server.base_url
+            settings.API_TOKEN = settings.API_TOKEN or "seed-token"
+            # ID из заглушки не должны попасть в состояние реального дерева (и наоборот)
+            offline_state_dir = tempfile.TemporaryDirectory(prefix="seed-offline-")
+            seeder = WorkspaceSeeder(
+                spec, name, state_path=os.path.join(offline_state_dir.name, f"{name}.json"),
+                resume=False
+            )
+        else:
+            seeder = WorkspaceSeeder(spec, name)
+        print(f"Дерево {spec} ({spec.total} сущностей), потоков: {seeder.workers}, "
+              f"состояние: {seeder.state_path}")
+        if teardown:
+            seeder.teardown()
+        else:
+            seeder.seed()
+            # Офлайн-заглушка живет только в этом процессе - сразу убираем за собой
+            if offline:
+                seeder.teardown()
+    finally:
+        if server is not None:
+            server.stop()
+        if offline_state_dir is not None:
+            offline_state_dir.cleanup()
+
+    for key, error in list(seeder.errors.items())[:10]:
+        print(f"Ошибка {key}: {error}")
+    return not seeder.errors
+
+
+def get_changed_files():
+    """Список измененных и новых файлов относительно HEAD"""
+    changed = set()
+    for command in (["git", "diff", "--name-only", "HEAD"],
+                    ["git", "ls-files", "--others", "--exclude-standard"]):
+        result = subprocess.run(command, capture_output=True, text=True)
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return changed
+
+
+# Фикстура, которой принадлежат отложенные импорты хуков conftest.py: по соглашению
+# в хуках лениво импортируется только браузерный стек (пул, драйверы, профилировщик)
+BROWSER_FIXTURE = "driver"
+
+
+def _resolve_imports(nodes, module, files):
+    """Файлы проекта, импортируемые узлами AST"""
+    imports = set()
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = ".".join(module.split(".")[:-node.level] + ([base] if base else []))
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        imports.update(files[name] for name in names if name in files)
+    return imports
+
+
+def _fixture_decorator(function):
+    """Декоратор фикстуры pytest (None, если функция не фикстура)"""
+    for decorator in function.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if getattr(target, "attr", getattr(target, "id", None)) == "fixture":
+            return decorator
+    return None
+
+
+def _is_autouse(decorator):
+    return isinstance(decorator, ast.Call) and any(
+        keyword.arg == "autouse" and getattr(keyword.value, "value", False)
+        for keyword in decorator.keywords
+    )
+
+
+def _function_args(function):
+    """Аргументы функции и фикстуры, запрашиваемые через request.getfixturevalue("...")"""
+    names = {arg.arg for arg in function.args.args + function.args.kwonlyargs}
+    for node in ast.walk(function):
+        if (isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "getfixturevalue"
+                and node.args and isinstance(node.args[0], ast.Constant)):
+            names.add(node.args[0].value)
+    return names
+
+
+def _conftest_dependencies(tree, module, files):
+    """
+    Зависимости conftest.py: импорты уровня модуля (общие для всех тестов) и
+    отложенные импорты каждой фикстуры вместе с фикстурами, которые она запрашивает
+    """
+    functions = [node for node in tree.body
+                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    shared = _resolve_imports(
+        [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))],
+        module, files
+    )
+    fixture_imports, fixture_args, autouse = {}, {}, set()
+    for function in functions:
+        lazy = _resolve_imports(ast.walk(function), module, files)
+        decorator = _fixture_decorator(function)
+        name = function.name if decorator is not None else BROWSER_FIXTURE
+        fixture_imports.setdefault(name, set()).update(lazy)
+        if decorator is not None:
+            fixture_args[name] = _function_args(function)
+            if _is_autouse(decorator):
+                autouse.add(name)
+    # Autouse-фикстуры (и то, что они запрашивают) выполняются для каждого теста
+    for fixture in _requested_fixtures(autouse, fixture_args):
+        shared |= fixture_imports.get(fixture, set())
+    return shared, fixture_imports, fixture_args
+
+
+def _test_file_fixtures(tree):
+    """Имена, запрашиваемые функциями тестового файла (тесты и локальные фикстуры)"""
+    requested = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            requested |= _function_args(node)
+    return requested
+
+
+def _requested_fixtures(names, fixture_args):
+    """Фикстуры conftest.py, запрашиваемые прямо или через другие фикстуры"""
+    requested = set(names)
+    pending = list(requested)
+    while pending:
+        for name in fixture_args.get(pending.pop(), ()):
+            if name not in requested:
+                requested.add(name)
+                pending.append(name)
+    return requested
+
+
+def build_import_graph(packages=("config", "pages", "utils", "tests")):
+    """
+    Построить граф импортов модулей проекта: {файл: {импортируемые файлы}};
+    тестовые файлы зависят от conftest.py и от отложенных импортов запрошенных фикстур
+    """
+    files = {}
+    for package in packages:
+        for name in os.listdir(package):
+            if name.endswith(".py"):
+                path = f"{package}/{name}"
+                files[path[:-3].replace("/", ".")] = path
+
+    trees = {}
+    for module, path in files.items():
+        with open(path, encoding="utf-8") as source:
+            trees[path] = (module, ast.parse(source.read()))
+
+    graph, fixture_imports, fixture_args = {}, {}, {}
+    for path, (module, tree) in trees.items():
+        if path == "tests/conftest.py":
+            graph[path], fixture_imports, fixture_args = _conftest_dependencies(
+                tree, module, files
+            )
+        else:
+            graph[path] = _resolve_imports(ast.walk(tree), module, files)
+
+    for path, (_, tree) in trees.items():
+        if path.startswith("tests/test_"):
+            graph[path].add("tests/conftest.py")
+            for fixture in _requested_fixtures(_test_file_fixtures(tree), fixture_args):
+                graph[path] |= fixture_imports.get(fixture, set())
+    return graph
+
+
+def select_tests_for_changes(changed_files, graph=None):
+    """Сопоставить измененные модули с тестовыми файлами, которые от них зависят"""
+    graph = graph or build_import_graph()
+    test_files = {path for path in graph if path.startswith("tests/test_")}
+
+    affected = {path for path in changed_files if path in graph}
+    while True:
+        dependents = {path for path, imports in graph.items() if imports & affected}
+        if dependents <= affected:
+            break
+        affected |= dependents
+    return test_files & affected
 
 
 def generate_allure_report():
@@ -61,8 +453,11 @@ def main():
     parser = argparse.ArgumentParser(description="Запуск тестов YouGile")
     parser.add_argument(
         "mode",
-        choices=["ui", "api", "all"],
-        help="Режим запуска: ui (только UI), api (только API), all (все)"
+        choices=["ui", "api", "all", "matrix", "trends", "soak", "seed"],
+        help=("Режим запуска: ui (только UI), api (только API), all (все), "
+              "matrix (UI во всех браузерах параллельно), "
+              "trends (анализ замедлений по истории), soak (длительный прогон), "
+              "seed (наполнение рабочего пространства)")
     )
     parser.add_argument(
         "--report",
@@ -74,12 +469,124 @@ def main():
         action="store_true",
         help="Открыть существующий Allure отчет"
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Разбить тесты на N шардов по исторической длительности"
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="Номер запускаемого шарда (с нуля)"
+    )
+    parser.add_argument(
+        "--failed-first",
+        action="store_true",
+        help="Сначала запускать тесты, упавшие в прошлый раз"
+    )
+    parser.add_argument(
+        "--browsers",
+        default=os.getenv("BROWSERS", "chrome,firefox"),
+        help="Браузеры для режима matrix через запятую (по умолчанию chrome,firefox)"
+    )
+    parser.add_argument(
+        "--soak-target",
+        choices=["api", "ui"],
+        default="api",
+        help="Цель soak-прогона: api (YougileAPIClient) или ui (сессия WebDriver)"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=60,
+        help="Длительность soak-прогона в минутах"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=60,
+        help="Интервал снимков памяти и задержек в секундах"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Soak-прогон или наполнение против локальных заглушек UI и API"
+    )
+    parser.add_argument(
+        "--spec",
+        default="10x2x3x5",
+        help="Форма дерева для seed: проекты x доски x колонки x задачи, например 200x5x1x50"
+    )
+    parser.add_argument(
+        "--seed-name",
+        default="default",
+        help="Имя набора данных seed (по нему сохраняется состояние для возобновления)"
+    )
+    parser.add_argument(
+        "--teardown",
+        action="store_true",
+        help="Удалить ранее созданный набор данных seed"
+    )
+    parser.add_argument(
+        "--data-cases",
+        default=os.getenv("DATA_CASES", ""),
+        help=("Источник вариантов для data-driven API тестов: путь к .jsonl/.csv "
+              "или generated:<seed>:<count>")
+    )
+    parser.add_argument(
+        "--import-report",
+        action="store_true",
+        help="Показать время импорта conftest и тестовых модулей перед запуском"
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Запускать только тесты, импортирующие измененные модули"
+    )
 
     args = parser.parse_args()
+    if args.shards < 1 or not 0 <= args.shard_index < args.shards:
+        parser.error(f"--shard-index должен быть в диапазоне 0..{args.shards - 1}, "
+                     f"а --shards >= 1")
+
+    if args.mode == "trends":
+        sys.exit(0 if show_trends() else 1)
+    if args.mode == "soak":
+        success = run_soak(args.soak_target, args.duration, args.sample_interval, args.offline)
+        sys.exit(0 if success else 1)
+    if args.mode == "seed":
+        success = run_seed(args.spec, args.seed_name, args.teardown, args.offline)
+        sys.exit(0 if success else 1)
+
+    if args.import_report:
+        suite_modules = {
+            "ui": ["tests.conftest", "tests.test_ui"],
+            "api": ["tests.conftest", "tests.test_api"],
+            "all": ["tests.conftest", "tests.test_api", "tests.test_ui"],
+        }
+        report_import_time(suite_modules[args.mode])
+
+    extra_args = ""
+    if args.shards > 1:
+        extra_args += f" --shards={args.shards} --shard-index={args.shard_index}"
+    if args.failed_first:
+        extra_args += " --history-failed-first"
+    if args.data_cases:
+        # Дочерние процессы pytest наследуют окружение
+        os.environ["DATA_CASES"] = args.data_cases
+
+    test_files = None
+    if args.changed_only:
+        test_files = select_tests_for_changes(get_changed_files())
+        print(f"Затронутые изменениями тесты: {', '.join(sorted(test_files)) or 'нет'}")
+        if not test_files:
+            print("Нет тестов, затронутых изменениями")
+            return
 
     # Проверка наличия токена для API тестов
     if args.mode in ["api", "all"]:
-        import os
         if not os.getenv("YOUGILE_TOKEN"):
             print("Ошибка: Не установлен YOUGILE_TOKEN")
             print("Установите токен: export YOUGILE_TOKEN=your_token_here")
@@ -88,11 +595,20 @@ def main():
     # Запуск тестов
     success = False
     if args.mode == "ui":
-        success = run_ui_tests()
+        if test_files is None or "tests/test_ui.py" in test_files:
+            success = run_ui_tests(extra_args)
+        else:
+            success = True
     elif args.mode == "api":
-        success = run_api_tests()
+        if test_files is None or "tests/test_api.py" in test_files:
+            success = run_api_tests(extra_args)
+        else:
+            success = True
     elif args.mode == "all":
-        success = run_all_tests()
+        success = run_all_tests(extra_args, test_files)
+    elif args.mode == "matrix":
+        browsers = [browser.strip() for browser in args.browsers.split(",") if browser.strip()]
+        success = run_browser_matrix(browsers, extra_args)
 
     if not success:
         print("Тесты завершились с ошибками")
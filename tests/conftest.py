@@ -1,68 +1,200 @@
 """
 Конфигурация pytest для автоматизации тестирования
 """
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import pytest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
+import allure_commons
 
 from config.settings import settings
+from utils.api_client import YougileAPIClient
+from utils.api_contract import contract_validator
+from utils.circuit_breaker import api_circuit, run_preflight_checks, ui_circuit
+from utils.data_cases import case_id, open_source, shard_refs
+from utils.run_history import (
+    failed_first_key, load_history, save_history, split_into_shards
+)
+from utils.stub_server import YougileStubServer
+from utils.trend_store import AllureStepTimer, TrendStore
+
+# Selenium, webdriver-manager, pages и зависящие от них утилиты импортируются
+# внутри фикстур и хуков: API-only запуски не загружают браузерный стек
+
+BROWSER_POOL_KEY = pytest.StashKey["BrowserPool"]()
+DATA_SOURCE_KEY = pytest.StashKey[object]()
+REQUIRED_CIRCUITS_KEY = pytest.StashKey[set]()
+# Фикстуры, которым нужен performance-лог Chrome
+NETWORK_FIXTURES = {"network", "network_capture"}
+# Длительности и результаты тестов текущего запуска: {nodeid: {...}}
+_run_results = {}
+# Замер длительности шагов Allure для хранилища трендов
+_step_timer = AllureStepTimer()
+# Причины пропуска тестов из-за разомкнутых предохранителей (с xdist - и из отчетов воркеров)
+_circuit_skip_reasons = set()
+
+
+def pytest_addoption(parser):
+    """Опции шардирования и порядка запуска по истории"""
+    group = parser.getgroup("history", "Запуск по истории длительностей")
+    group.addoption("--shards", type=int, default=1,
+                    help="Количество шардов, сбалансированных по длительности")
+    group.addoption("--shard-index", type=int, default=0,
+                    help="Номер шарда для запуска (с нуля)")
+    group.addoption("--history-failed-first", action="store_true",
+                    help="Сначала запускать тесты, упавшие в прошлый раз")
 
 
 @pytest.fixture(scope="session")
-def browser_config():
+def browser_name():
+    """Браузер для тестов (параметризуется матрицей BROWSERS)"""
+    return settings.BROWSER
+
+
+@pytest.fixture(scope="session")
+def browser_config(browser_name):
     """Конфигурация браузера для тестов"""
     return {
-        "browser": settings.BROWSER,
+        "browser": browser_name,
         "headless": settings.HEADLESS,
         "window_size": settings.WINDOW_SIZE
     }
 
 
+def pytest_generate_tests(metafunc):
+    """Параметризовать UI тесты по браузерам матрицы, data-driven тесты - по вариантам данных"""
+    if settings.BROWSERS and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", settings.BROWSERS, scope="session")
+
+    if "payload_case" in metafunc.fixturenames:
+        config = metafunc.config
+        refs = []
+        if settings.DATA_CASES:
+            if DATA_SOURCE_KEY not in config.stash:
+                config.stash[DATA_SOURCE_KEY] = open_source(settings.DATA_CASES)
+            # В параметры попадают только номера/смещения вариантов шарда, сами данные
+            # читаются из источника в фикстуре payload_case
+            refs = list(shard_refs(config.stash[DATA_SOURCE_KEY].refs(),
+                                   config.getoption("shards"), config.getoption("shard_index")))
+        metafunc.parametrize("payload_case", refs, ids=case_id, indirect=True)
+
+
+@pytest.fixture
+def payload_case(request):
+    """Вариант данных {"payload": dict, "valid": bool}, загружаемый по требованию"""
+    return request.config.stash[DATA_SOURCE_KEY].load(request.param)
+
+
+@pytest.fixture(scope="session")
+def local_grid():
+    """Локальные remote-узлы WebDriver для всех браузеров матрицы"""
+    from utils.local_grid import LocalGrid
+
+    grid = LocalGrid(settings.BROWSERS or [settings.BROWSER]).start()
+    yield grid
+    grid.stop()
+
+
+@pytest.fixture(scope="session")
+def local_yougile():
+    """Локальная заглушка UI YouGile; перенаправляет BASE_URL на неё"""
+    server = YougileStubServer(
+        delay=settings.STUB_DELAY,
+        project_count=settings.STUB_PROJECT_COUNT,
+        padding_nodes=settings.STUB_PADDING_NODES
+    ).start()
+    original_base_url = settings.BASE_URL
+    settings.BASE_URL = server.base_url
+
+    yield server
+
+    settings.BASE_URL = original_base_url
+    server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _local_stub_autostart(request):
+    """Запустить заглушку UI для всей сессии, если LOCAL_STUB=true"""
+    if settings.LOCAL_STUB:
+        request.getfixturevalue("local_yougile")
+
+
 @pytest.fixture(scope="function")
-def driver(browser_config):
+def driver(request, browser_config):
     """Фикстура для создания драйвера браузера"""
-    browser = browser_config["browser"].lower()
-
-    if browser == "chrome":
-        options = ChromeOptions()
-        if browser_config["headless"]:
-            options.add_argument("--headless")
-        w, h = browser_config['window_size']
-        window_size = f"{w},{h}"
-        options.add_argument(f"--window-size={window_size}")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-    elif browser == "firefox":
-        options = FirefoxOptions()
-        if browser_config["headless"]:
-            options.add_argument("--headless")
-        width = browser_config['window_size'][0]
-        height = browser_config['window_size'][1]
-        options.add_argument(f"--width={width}")
-        options.add_argument(f"--height={height}")
-
-        service = Service(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
-
-    else:
-        raise ValueError(f"Неподдерживаемый браузер: {browser}")
-
-    # Настройка таймаутов
-    driver.implicitly_wait(settings.IMPLICIT_WAIT)
-    driver.set_page_load_timeout(settings.PAGE_LOAD_TIMEOUT)
+    from utils.driver_factory import create_driver
+
+    ui_circuit.check()
+    browser = browser_config["browser"]
+    allure.dynamic.tag(browser)
 
+    remote_url = settings.SELENIUM_REMOTE_URL
+    if not remote_url and settings.LOCAL_GRID:
+        remote_url = request.getfixturevalue("local_grid").nodes[browser.lower()]
+
+    # Performance-лог нужен только тестам с захватом сети: такие драйверы
+    # создаются отдельно, чтобы не нагружать логированием пул и остальные тесты
+    network_capture = (
+        settings.NETWORK_CAPTURE and browser.lower() == "chrome"
+        and bool(NETWORK_FIXTURES & set(request.fixturenames))
+    )
+    pool = request.config.stash.get(BROWSER_POOL_KEY, None)
+    if pool is None or remote_url or browser != settings.BROWSER or network_capture:
+        try:
+            driver = create_driver(**browser_config, remote_url=remote_url,
+                                   network_capture=network_capture)
+        except Exception as e:
+            ui_circuit.record_failure(f"запуск браузера: {e}")
+            raise
+        yield driver
+        driver.quit()
+        return
+
+    driver = pool.acquire()
     yield driver
+    pool.release(driver)
+
+
+def _network_unavailable_reason(driver, browser: str) -> Optional[str]:
+    """Причина, по которой захват сети недоступен (None - доступен)"""
+    if not settings.NETWORK_CAPTURE or browser.lower() != "chrome":
+        return "Захват сети доступен только в Chrome с NETWORK_CAPTURE=true"
+    # webdriver.Remote (Selenium Grid, LOCAL_GRID) не поддерживает чтение performance-лога
+    if not hasattr(driver, "get_log"):
+        return "Захват сети недоступен для удаленного драйвера (нет get_log)"
+    return None
+
+
+@pytest.fixture(scope="function")
+def network_capture(driver, browser_config):
+    """Захват сети, если он доступен для драйвера, иначе None (без пропуска теста)"""
+    if _network_unavailable_reason(driver, browser_config["browser"]):
+        yield None
+        return
+    from utils.network_capture import NetworkCapture
+
+    capture = NetworkCapture(driver)
+    capture.clear()
 
-    driver.quit()
+    yield capture
+
+    allure.attach(
+        json.dumps(capture.timings(), ensure_ascii=False, indent=2),
+        name="Сетевые запросы",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+@pytest.fixture(scope="function")
+def network(network_capture, driver, browser_config):
+    """Захват сетевых запросов браузера для проверок на уровне XHR"""
+    if network_capture is None:
+        pytest.skip(_network_unavailable_reason(driver, browser_config["browser"]))
+    return network_capture
 
 
 @pytest.fixture(scope="function")
@@ -80,6 +212,75 @@ def api_client():
     return session
 
 
+@pytest.fixture(scope="session")
+def yougile_client():
+    """API клиент YouGile для подготовки предусловий UI тестов"""
+    return YougileAPIClient()
+
+
+@pytest.fixture(scope="function")
+def api_project_factory(yougile_client):
+    """Фабрика проектов через API с автоматическим удалением после теста"""
+    created_ids = []
+
+    def create(count: int = 1, title_prefix: str = "Precondition Project") -> list:
+        if count <= 0:
+            return []
+        titles = [f"{title_prefix} {uuid.uuid4().hex[:8]}" for _ in range(count)]
+        with allure.step(f"Создать через API проектов: {count}"):
+            with ThreadPoolExecutor(max_workers=min(count, 8)) as executor:
+                futures = [
+                    executor.submit(yougile_client.create_project_and_get_id, {"title": title})
+                    for title in titles
+                ]
+            # ID всех успешно созданных проектов попадают в очистку, даже если
+            # часть создания упала
+            projects, errors = [], []
+            for future, title in zip(futures, titles):
+                try:
+                    project_id = future.result()
+                except Exception as e:
+                    errors.append(str(e))
+                    continue
+                created_ids.append(project_id)
+                projects.append({"id": project_id, "title": title})
+        if errors:
+            raise Exception(f"Не удалось создать проектов: {len(errors)} из {count}: {errors[0]}")
+        return projects
+
+    yield create
+
+    with allure.step("Удалить проекты-предусловия через API"):
+        errors = []
+        for project_id in created_ids:
+            try:
+                yougile_client.delete_project(project_id)
+            except Exception as e:
+                errors.append(f"{project_id}: {e}")
+        if errors:
+            raise Exception(f"Не удалось удалить проекты-предусловия: {'; '.join(errors)}")
+
+
+@pytest.fixture(scope="function")
+def api_project(api_project_factory):
+    """Один проект, созданный через API"""
+    return api_project_factory()[0]
+
+
+@pytest.fixture(scope="function")
+def projects_page_logged_in(driver):
+    """Авторизоваться и сразу открыть страницу проектов"""
+    from pages.login_page import LoginPage
+    from pages.projects_page import ProjectsPage
+
+    login_page = LoginPage(driver)
+    login_page.login(settings.TEST_EMAIL, settings.TEST_PASSWORD)
+    assert login_page.is_login_successful(), "Авторизация не прошла успешно"
+    projects_page = ProjectsPage(driver)
+    projects_page.open_projects_page()
+    return projects_page
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Хук для создания скриншотов при падении тестов"""
@@ -105,7 +306,189 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_configure(config):
     """Конфигурация pytest"""
-    import os
+    shards, shard_index = config.getoption("shards"), config.getoption("shard_index")
+    if shards < 1 or not 0 <= shard_index < shards:
+        raise pytest.UsageError(
+            f"--shard-index должен быть в диапазоне 0..{shards - 1}, а --shards >= 1 "
+            f"(получено --shards={shards} --shard-index={shard_index})"
+        )
+
     os.makedirs(settings.SCREENSHOTS_DIR, exist_ok=True)
     os.makedirs(settings.REPORTS_DIR, exist_ok=True)
     os.makedirs(settings.ALLURE_RESULTS_DIR, exist_ok=True)
+
+    # Общий идентификатор запуска для xdist-воркеров
+    os.environ.setdefault("TEST_RUN_ID", settings.RUN_ID)
+    if settings.TRENDS_ENABLED:
+        allure_commons.plugin_manager.register(_step_timer)
+
+    # Прогрев браузеров параллельно со сбором тестов (не на xdist-контроллере)
+    is_xdist_controller = (config.getoption("numprocesses", default=None)
+                           and not hasattr(config, "workerinput"))
+    if (settings.BROWSER_POOL_SIZE > 0 and not is_xdist_controller
+            and not config.option.collectonly and _targets_ui_tests(config)):
+        from utils.browser_pool import BrowserPool
+        from utils.driver_factory import create_driver
+
+        config.stash[BROWSER_POOL_KEY] = BrowserPool(
+            lambda: create_driver(settings.BROWSER, settings.HEADLESS, settings.WINDOW_SIZE),
+            settings.BROWSER_POOL_SIZE
+        ).start()
+
+
+def _targets_ui_tests(config) -> bool:
+    """Пути запуска включают UI тесты (файлы test_ui*.py или каталоги с ними)"""
+    for arg in config.args:
+        path = config.invocation_params.dir / arg.split("::")[0]
+        if path.is_dir():
+            if next(path.rglob("test_ui*.py"), None) is not None:
+                return True
+        elif path.name.startswith("test_ui"):
+            return True
+    return False
+
+
+def pytest_collection_finish(session):
+    """Pre-flight проверка нужных отобранным тестам сервисов; остановка ненужного пула"""
+    config = session.config
+    required = {circuit for item in session.items for circuit in _required_circuits(item)}
+    config.stash[REQUIRED_CIRCUITS_KEY] = required
+    # Pre-flight: при недоступном YouGile тесты будут пропущены сразу, без таймаутов;
+    # офлайн-тесты (tests/unit) от YouGile не зависят и проверку не запускают
+    if settings.PREFLIGHT_CHECK and required and not config.option.collectonly:
+        run_preflight_checks(required)
+
+    # Пул запущен по путям запуска, но -k/-m/шардирование могли оставить только API тесты
+    pool = config.stash.get(BROWSER_POOL_KEY, None)
+    if pool is not None and not any("driver" in item.fixturenames for item in session.items):
+        pool.shutdown()
+        del config.stash[BROWSER_POOL_KEY]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Отобрать шард и упорядочить тесты по истории предыдущих запусков"""
+    shards = config.getoption("shards")
+    failed_first = config.getoption("history_failed_first")
+    if shards <= 1 and not failed_first:
+        return
+    history = load_history()
+
+    if shards > 1:
+        shard_index = config.getoption("shard_index")
+        # Data-driven варианты уже разделены по номеру в pytest_generate_tests
+        selected = set(split_into_shards(
+            [item.nodeid for item in items if not _is_data_case(item)], history, shards
+        )[shard_index])
+        deselected = [item for item in items
+                      if item.nodeid not in selected and not _is_data_case(item)]
+        items[:] = [item for item in items
+                    if item.nodeid in selected or _is_data_case(item)]
+        config.hook.pytest_deselected(items=deselected)
+
+    if failed_first:
+        items.sort(key=lambda item: failed_first_key(item.nodeid, history))
+
+
+def _is_data_case(item) -> bool:
+    """Тест параметризован вариантом данных"""
+    callspec = getattr(item, "callspec", None)
+    return callspec is not None and "payload_case" in callspec.params
+
+
+def _required_circuits(item) -> list:
+    """Предохранители, от которых зависит тест"""
+    circuits = []
+    if "driver" in item.fixturenames:
+        circuits.append(ui_circuit)
+    uses_api = "yougile_client" in item.fixturenames or (
+        item.module is not None and "YougileAPIClient" in vars(item.module)
+    )
+    if uses_api:
+        circuits.append(api_circuit)
+    return circuits
+
+
+def pytest_runtest_setup(item):
+    """Пропустить (или провалить) тест сразу, если нужный предохранитель разомкнут"""
+    for circuit in _required_circuits(item):
+        if circuit.is_open:
+            # Попадает в отчет теста, который xdist передает контроллеру
+            item.user_properties.append(("circuit_open", circuit.reason))
+            if settings.CIRCUIT_BREAKER_MODE == "fail":
+                pytest.fail(circuit.reason, pytrace=False)
+            pytest.skip(circuit.reason)
+
+
+def pytest_runtest_logstart(nodeid):
+    """Запомнить текущий тест для привязки шагов Allure"""
+    _step_timer.current_nodeid = nodeid
+
+
+def pytest_runtest_logreport(report):
+    """Накопить длительность и результат каждого теста"""
+    _circuit_skip_reasons.update(
+        value for name, value in report.user_properties if name == "circuit_open"
+    )
+    result = _run_results.setdefault(report.nodeid, {"duration": 0.0, "outcome": "passed"})
+    result["duration"] += report.duration
+    if report.failed:
+        result["outcome"] = "failed"
+    elif report.skipped and report.when != "teardown":
+        result["outcome"] = "skipped"
+
+
+def pytest_sessionfinish(session):
+    """Сохранить историю несегментированного запуска; при разомкнутом предохранителе - ошибка"""
+    is_worker = hasattr(session.config, "workerinput")
+    # Пропущенные из-за недоступности YouGile тесты не должны давать зеленый прогон;
+    # на xdist-контроллере тестов нет, и пропуски видны только по отчетам воркеров
+    required = session.config.stash.get(REQUIRED_CIRCUITS_KEY, set())
+    if ((_circuit_skip_reasons or any(circuit.is_open for circuit in required))
+            and session.exitstatus in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    # Все шарды должны делить тесты по одной и той же истории: запись из одного шарда
+    # изменила бы разбиение для следующих (тесты терялись бы или запускались дважды)
+    if _run_results and not is_worker and session.config.getoption("shards") <= 1:
+        save_history(_run_results)
+
+    if settings.TRENDS_ENABLED and (_run_results or _step_timer.steps):
+        store = TrendStore()
+        try:
+            store.record_run(settings.RUN_ID)
+            if not is_worker:
+                store.record_tests(settings.RUN_ID, _run_results)
+            store.record_steps(settings.RUN_ID, _step_timer.steps)
+        finally:
+            store.close()
+
+
+def pytest_unconfigure(config):
+    """Закрыть браузеры пула и отключить замер шагов"""
+    if allure_commons.plugin_manager.is_registered(_step_timer):
+        allure_commons.plugin_manager.unregister(_step_timer)
+    pool = config.stash.get(BROWSER_POOL_KEY, None)
+    if pool is not None:
+        pool.shutdown()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Вывести причины размыкания предохранителей, нарушения контрактов API и профиль локаторов"""
+    reasons = set(_circuit_skip_reasons)
+    reasons.update(circuit.reason for circuit in (api_circuit, ui_circuit) if circuit.is_open)
+    if reasons:
+        terminalreporter.section("Предохранители разомкнуты")
+        for reason in sorted(reasons):
+            terminalreporter.write_line(reason)
+
+    if contract_validator.violations:
+        terminalreporter.section("Нарушения контрактов API")
+        for message, count in contract_validator.violations.items():
+            terminalreporter.write_line(f"{count:>5} x {message}")
+
+    if not settings.LOCATOR_PROFILING:
+        return
+    from utils.locator_profiler import profiler
+
+    if profiler.locators or profiler.methods:
+        terminalreporter.section("Профиль локаторов Page Object")
+        terminalreporter.write_line(profiler.report())
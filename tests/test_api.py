@@ -5,6 +5,7 @@ import pytest
 import allure
 import uuid
 from utils.api_client import YougileAPIClient
+from utils.api_contract import validate_response
 
 
 @allure.feature("API тесты YouGile")
@@ -67,17 +68,11 @@ class TestYougileAPI:
                       f"Error: {error_msg}")
         assert success, error_text
 
-        with allure.step("Проверить структуру ответа"):
-            response_data = response.json()
-            has_id = "id" in response_data
-            assert has_id, "Response should contain project ID"
-            id_is_string = isinstance(response_data["id"], str)
-            assert id_is_string, "Project ID should be string"
-            id_not_empty = response_data["id"]
-            assert id_not_empty, "Project ID should not be empty"
+        with allure.step("Проверить структуру ответа по контракту"):
+            created = validate_response("POST", "/projects", response)
 
         with allure.step("Очистить созданный проект"):
-            project_id = response_data["id"]
+            project_id = created.id
             cleanup_response = self.api_client.delete_project(project_id)
             valid_codes = [200, 204, 404]
         assert cleanup_response.status_code in valid_codes
@@ -102,8 +97,8 @@ class TestYougileAPI:
         assert success, error_text
 
         with allure.step("Проверить корректность данных"):
-            response_data = response.json()
-            project_id_match = response_data["id"] == project_id
+            project = validate_response("GET", f"/projects/{project_id}", response)
+            project_id_match = project.id == project_id
         assert project_id_match, "Project ID mismatch"
 
     @allure.story("Управление проектами")
@@ -129,8 +124,8 @@ class TestYougileAPI:
         assert success, error_text
 
         with allure.step("Проверить корректность обновления"):
-            response_data = response.json()
-            project_id_match = response_data["id"] == project_id
+            updated = validate_response("PUT", f"/projects/{project_id}", response)
+            project_id_match = updated.id == project_id
         assert project_id_match, "Project ID mismatch"
 
     @allure.story("Управление проектами")
@@ -170,3 +165,55 @@ class TestYougileAPI:
             error_text = (f"Expected {expected_code} for nonexistent project, "
                           f"got {actual_code}. Error: {error_msg}")
             assert success, error_text
+
+    @allure.story("Варианты данных")
+    @allure.title("Создание проекта: вариант данных")
+    @allure.description("Создание проекта с данными из DATA_CASES (файл или генератор)")
+    def test_create_project_data_driven(self, payload_case):
+        """Тест создания проекта с вариантом данных"""
+        payload = payload_case["payload"]
+        expected_codes = [201] if payload_case["valid"] else [400, 422]
+
+        with allure.step("Создать проект"):
+            response = self.api_client.create_project(payload)
+
+        with allure.step("Проверить код ответа"):
+            actual_code = response.status_code
+            error_msg = self.api_client.get_error_message(response)
+            success = self.api_client.is_successful_response(response, expected_codes)
+            error_text = (f"Expected {expected_codes} for {payload!r}, "
+                          f"got {actual_code}. Error: {error_msg}")
+
+        if actual_code == 201:
+            with allure.step("Очистить созданный проект"):
+                project_id = validate_response("POST", "/projects", response).id
+                self.api_client.delete_project(project_id)
+        assert success, error_text
+
+    @allure.story("Варианты данных")
+    @allure.title("Обновление проекта: вариант данных")
+    @allure.description("Обновление проекта данными из DATA_CASES (файл или генератор)")
+    def test_update_project_data_driven(self, created_project, payload_case):
+        """Тест обновления проекта вариантом данных"""
+        project_id = created_project["id"]
+        payload = payload_case["payload"]
+        # Поля обновления необязательны: пустой payload - допустимое обновление без изменений
+        valid = payload_case["valid"] or "title" not in payload
+        expected_codes = [200] if valid else [400, 422]
+
+        with allure.step("Обновить проект"):
+            response = self.api_client.update_project(project_id, payload)
+
+        with allure.step("Проверить код ответа"):
+            actual_code = response.status_code
+            error_msg = self.api_client.get_error_message(response)
+            success = self.api_client.is_successful_response(response, expected_codes)
+            error_text = (f"Expected {expected_codes} for {payload!r}, "
+                          f"got {actual_code}. Error: {error_msg}")
+            assert success, error_text
+
+        if valid and "title" in payload:
+            with allure.step("Проверить сохраненное название"):
+                response = self.api_client.get_project(project_id)
+                project = validate_response("GET", f"/projects/{project_id}", response)
+                assert project.title == payload["title"], "Project title mismatch"
@@ -62,7 +62,7 @@ class TestYougileUI:
     @allure.story("Управление проектами")
     @allure.title("Создание нового проекта")
     @allure.description("Проверка создания нового проекта с валидными данными")
-    def test_create_new_project(self):
+    def test_create_new_project(self, network_capture):
         """Тест создания нового проекта"""
         with allure.step("Выполнить авторизацию"):
             self.login_page.open_login_page()
@@ -81,6 +81,15 @@ class TestYougileUI:
         with allure.step("Проверить создание проекта"):
             assert self.projects_page.find_project_by_title(project_title), "Проект не найден в списке"
 
+        # Без захвата сети (Firefox, удаленный драйвер) проверяется только UI
+        if network_capture is not None:
+            with allure.step("Проверить запрос создания проекта к API"):
+                request = network_capture.wait_for_request(
+                    ProjectsPage.CREATE_PROJECT_REQUEST, method="POST"
+                )
+                assert not request.failed and request.status < 400, \
+                    f"Запрос создания проекта завершился с ошибкой: {request.status}"
+
     @allure.story("Управление проектами")
     @allure.title("Создание проекта с пустым названием")
     @allure.description("Проверка отображения ошибки при создании проекта с пустым названием")
@@ -104,27 +113,26 @@ class TestYougileUI:
     @allure.story("Управление проектами")
     @allure.title("Редактирование существующего проекта")
     @allure.description("Проверка редактирования существующего проекта")
-    def test_edit_existing_project(self):
+    def test_edit_existing_project(self, api_project, projects_page_logged_in, network_capture):
         """Тест редактирования существующего проекта"""
-        with allure.step("Выполнить авторизацию"):
-            self.login_page.open_login_page()
-            self.login_page.login(settings.TEST_EMAIL, settings.TEST_PASSWORD)
-            assert self.login_page.is_login_successful(), "Авторизация не прошла успешно"
-
-        with allure.step("Открыть страницу проектов"):
-            self.projects_page.open_projects_page()
+        original_title = api_project["title"]
 
-        with allure.step("Создать тестовый проект"):
-            original_title = f"Original Project {uuid.uuid4().hex[:8]}"
-            success = self.projects_page.create_project(original_title)
-            assert success, "Не удалось создать тестовый проект"
-            assert self.projects_page.find_project_by_title(original_title), "Тестовый проект не найден"
+        with allure.step("Проверить наличие проекта, созданного через API"):
+            assert projects_page_logged_in.find_project_by_title(original_title), "Тестовый проект не найден"
 
         with allure.step("Редактировать проект"):
             new_title = f"Updated Project {uuid.uuid4().hex[:8]}"
             new_description = "Updated project description"
-            success = self.projects_page.edit_project(original_title, new_title, new_description)
+            success = projects_page_logged_in.edit_project(original_title, new_title, new_description)
             assert success, "Не удалось отредактировать проект"
 
         with allure.step("Проверить изменения"):
-            assert self.projects_page.find_project_by_title(new_title), "Обновленный проект не найден"
+            assert projects_page_logged_in.find_project_by_title(new_title), "Обновленный проект не найден"
+
+        if network_capture is not None:
+            with allure.step("Проверить запрос изменения проекта к API"):
+                request = network_capture.wait_for_request(
+                    ProjectsPage.UPDATE_PROJECT_REQUEST, method="PUT"
+                )
+                assert not request.failed and request.status < 400, \
+                    f"Запрос изменения проекта завершился с ошибкой: {request.status}"
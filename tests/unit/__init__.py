@@ -0,0 +1 @@
+# Офлайн-тесты вспомогательных модулей (без сети и браузера)
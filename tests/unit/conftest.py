@@ -0,0 +1,146 @@
+"""
+Общие подделки для офлайн-тестов утилит
+"""
+import itertools
+import json
+import threading
+
+import pytest
+import requests
+
+
+def make_response(status_code, payload=None):
+    """Ответ requests без сети; payload=None - пустое тело"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if payload is None else json.dumps(payload).encode()
+    return response
+
+
+class FakeYougileClient:
+    """Подделка YougileAPIClient: проекты в памяти, последовательные ID созданных сущностей"""
+
+    def __init__(self):
+        self.projects = []
+        self.fail_titles = set()
+        self.fail_deletes = set()
+        self.created = []
+        self.deleted = []
+        self.page_calls = 0
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def get_projects_page(self, limit, offset):
+        self.page_calls += 1
+        content = self.projects[offset:offset + limit]
+        return make_response(200, {
+            "paging": {"count": len(content), "limit": limit, "offset": offset,
+                       "next": offset + limit < len(self.projects)},
+            "content": content,
+        })
+
+    def __getattr__(self, name):
+        # create_board, delete_task и т.д. для всех уровней дерева
+        action, _, entity = name.partition("_")
+        if action == "create":
+            return lambda data: self._create(entity, data)
+        if action == "delete":
+            return self._delete
+        raise AttributeError(name)
+
+    def _create(self, entity, data):
+        if data["title"] in self.fail_titles:
+            return make_response(400, {"error": "Bad request"})
+        with self._lock:
+            self.created.append(data)
+            return make_response(201, {"id": f"{entity}-{next(self._ids)}"})
+
+    def _delete(self, entity_id):
+        if entity_id in self.fail_deletes:
+            raise Exception(f"API request failed: {entity_id}")
+        with self._lock:
+            self.deleted.append(entity_id)
+        return make_response(204)
+
+    def create_project_and_get_id(self, project_data):
+        return self.get_created_id(self.create_project(project_data), "project")
+
+    def is_successful_response(self, response, expected_codes):
+        return response.status_code in expected_codes
+
+    def get_error_message(self, response):
+        return f"HTTP {response.status_code}"
+
+    def get_created_id(self, response, entity):
+        if response.status_code != 201:
+            raise Exception(f"Failed to create {entity}: HTTP {response.status_code}")
+        return response.json()["id"]
+
+
+class FakeDriver:
+    """Подделка WebDriver: запоминает вызовы, может «упасть» по флагу alive"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_count = 0
+        self.capabilities = {"browserName": "chrome"}
+        self.visited = []
+        self.scripts = []
+        # Записи performance-лога, отдаваемые get_log("performance")
+        self.performance_log = []
+
+    def _check(self):
+        from selenium.common.exceptions import WebDriverException
+
+        if not self.alive:
+            raise WebDriverException("session deleted")
+
+    @property
+    def window_handles(self):
+        self._check()
+        return ["main"]
+
+    def delete_all_cookies(self):
+        self._check()
+
+    def execute_script(self, script, *args):
+        self._check()
+        self.scripts.append(script)
+
+    def get(self, url):
+        self._check()
+        self.visited.append(url)
+
+    def get_log(self, log_type):
+        self._check()
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+    def quit(self):
+        self.quit_count += 1
+
+
+@pytest.fixture
+def response_factory():
+    """Фабрика ответов requests без сети"""
+    return make_response
+
+
+@pytest.fixture
+def fake_client():
+    """Поддельный API клиент YouGile"""
+    return FakeYougileClient()
+
+
+@pytest.fixture
+def driver_factory():
+    """Фабрика поддельных драйверов; созданные драйверы доступны в driver_factory.drivers"""
+    drivers = []
+
+    def factory():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+
+    factory.drivers = drivers
+    return factory
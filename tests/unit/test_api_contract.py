@@ -0,0 +1,74 @@
+"""
+Офлайн-тесты контрактов /projects
+"""
+import allure
+import pytest
+
+from utils.api_contract import ContractValidator, ContractViolation, validate_response
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestApiContract:
+    """Маршрутизация контрактов и режимы валидатора"""
+
+    def test_created_project(self, response_factory):
+        """Ответ создания содержит непустой ID"""
+        created = validate_response("POST", "/projects", response_factory(201, {"id": "a"}))
+        assert created.id == "a"
+        with pytest.raises(ContractViolation):
+            validate_response("POST", "/projects", response_factory(201, {"id": ""}))
+
+    def test_project_list_with_query(self, response_factory):
+        """Страница списка проверяется, query-строка не мешает маршрутизации"""
+        payload = {"paging": {"count": 1, "limit": 1, "offset": 0, "next": False},
+                   "content": [{"id": "a", "title": "A", "extra": 1}]}
+        result = validate_response("GET", "/projects?limit=1&offset=0",
+                                   response_factory(200, payload))
+        assert result.content[0].title == "A"
+
+    def test_delete_204_without_body(self, response_factory):
+        """DELETE -> 204 без тела соответствует контракту"""
+        assert validate_response("DELETE", "/projects/a", response_factory(204)) is None
+        with pytest.raises(ContractViolation):
+            validate_response("DELETE", "/projects/a", response_factory(204, {"id": "a"}))
+
+    def test_client_error_body(self, response_factory):
+        """Ответы 4xx проверяются по схеме ошибки"""
+        validate_response("GET", "/projects/a", response_factory(404, {"message": "Not found"}))
+        with pytest.raises(ContractViolation):
+            validate_response("GET", "/projects/a", response_factory(404, {"error": "x"}))
+
+    def test_unknown_success_code_recorded(self, response_factory):
+        """Неописанный успешный код учитывается, но не роняет вызов"""
+        validator = ContractValidator(sample_rate=1.0, mode="fail")
+        validator.check_response("DELETE", "/projects/a", response_factory(202))
+        assert validator.summary()["checked"] == 1
+        assert len(validator.violations) == 1
+
+    def test_fail_and_warn_modes(self, response_factory):
+        """Нарушение в ответе роняет вызов в режиме fail и предупреждает в режиме warn"""
+        bad = response_factory(200, {"title": "no id"})
+        with pytest.raises(ContractViolation):
+            ContractValidator(sample_rate=1.0, mode="fail").check_response(
+                "GET", "/projects/a", bad
+            )
+        with pytest.warns(UserWarning):
+            ContractValidator(sample_rate=1.0, mode="warn").check_response(
+                "GET", "/projects/a", bad
+            )
+
+    def test_request_violation_only_recorded(self):
+        """Невалидный запрос (негативный тест) учитывается без исключения"""
+        validator = ContractValidator(sample_rate=1.0, mode="fail")
+        validator.check_request("POST", "/projects", {})
+        validator.check_request("PUT", "/projects/a", {"title": "ok"})
+        assert len(validator.violations) == 1
+
+    def test_sampling_and_foreign_paths(self, response_factory):
+        """При нулевой доле и для путей вне /projects проверки не выполняются"""
+        validator = ContractValidator(sample_rate=0.0, mode="fail")
+        validator.check_response("GET", "/projects/a", response_factory(200, {}))
+        ContractValidator(sample_rate=1.0, mode="fail").check_response(
+            "GET", "/boards/a", response_factory(200, {})
+        )
+        assert validator.summary()["checked"] == 0
@@ -0,0 +1,67 @@
+"""
+Офлайн-тесты фабрики проектов-предусловий для UI тестов
+"""
+import allure
+import pytest
+
+from tests import conftest
+
+
+def start_factory(client):
+    """Запустить фикстуру api_project_factory вне pytest: (генератор, create)"""
+    fixture = conftest.api_project_factory.__wrapped__(client)
+    return fixture, next(fixture)
+
+
+def finish_factory(fixture):
+    """Выполнить очистку фикстуры"""
+    with pytest.raises(StopIteration):
+        next(fixture)
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestApiProjectFactory:
+    """Создание и гарантированное удаление проектов-предусловий"""
+
+    def test_created_projects_deleted(self, fake_client):
+        """Созданные проекты возвращаются с названиями и удаляются после теста"""
+        fixture, create = start_factory(fake_client)
+        projects = create(3, title_prefix="Unit")
+        assert len(projects) == 3
+        assert all(project["title"].startswith("Unit ") for project in projects)
+        finish_factory(fixture)
+        assert sorted(fake_client.deleted) == sorted(project["id"] for project in projects)
+
+    def test_partial_failure_still_cleans_up(self, fake_client):
+        """При ошибке части создания уже созданные проекты все равно удаляются"""
+        original = fake_client.create_project_and_get_id
+        calls = []
+
+        def flaky(project_data):
+            calls.append(project_data)
+            if len(calls) == 2:
+                raise Exception("Failed to create project: HTTP 500")
+            return original(project_data)
+
+        fake_client.create_project_and_get_id = flaky
+        fixture, create = start_factory(fake_client)
+        with pytest.raises(Exception, match="1 из 4"):
+            create(4)
+        finish_factory(fixture)
+        assert len(fake_client.created) == len(fake_client.deleted) == 3
+
+    def test_failed_delete_does_not_stop_cleanup(self, fake_client):
+        """Ошибка удаления одного проекта не мешает удалить остальные"""
+        fixture, create = start_factory(fake_client)
+        projects = create(3)
+        fake_client.fail_deletes = {projects[0]["id"]}
+        with pytest.raises(Exception, match=projects[0]["id"]):
+            next(fixture)
+        assert sorted(fake_client.deleted) == sorted(p["id"] for p in projects[1:])
+
+    def test_zero_count(self, fake_client):
+        """count=0 не создает пул потоков и ничего не создает"""
+        fixture, create = start_factory(fake_client)
+        assert create(0) == []
+        finish_factory(fixture)
+        assert fake_client.created == []
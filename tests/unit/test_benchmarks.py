@@ -0,0 +1,31 @@
+"""
+Офлайн-тесты сохранения и сравнения базовой линии микробенчмарков
+"""
+import json
+import os
+
+import allure
+
+from benchmarks.run_benchmarks import DEFAULT_BASELINE, compare_with_baseline, save_baseline
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestBenchmarkBaseline:
+    """Базовая линия микробенчмарков"""
+
+    def test_default_baseline_outside_reports(self):
+        """Базовая линия лежит в benchmarks/ и не удаляется вместе с reports/"""
+        assert os.path.basename(os.path.dirname(DEFAULT_BASELINE)) == "benchmarks"
+
+    def test_save_creates_directories(self, tmp_path):
+        """Сохранение создает каталог и записывает результаты в мкс"""
+        path = tmp_path / "nested" / "baseline.json"
+        save_baseline({"client.get": 10.0}, str(path))
+        assert json.loads(path.read_text(encoding="utf-8"))["results_us"] == {"client.get": 10.0}
+
+    def test_compare_threshold(self, tmp_path):
+        """Регрессия - замедление строго больше порога; новые бенчмарки не сравниваются"""
+        path = str(tmp_path / "baseline.json")
+        save_baseline({"fast": 10.0, "slow": 10.0}, path)
+        assert compare_with_baseline({"fast": 11.0, "slow": 12.0, "new": 99.0}, path, 0.2)
+        assert not compare_with_baseline({"fast": 9.0, "slow": 12.5}, path, 0.2)
@@ -0,0 +1,27 @@
+"""
+Офлайн-тесты запуска матрицы браузеров
+"""
+import allure
+
+import run_tests
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestBrowserMatrix:
+    """Окружение процессов pytest матрицы"""
+
+    def test_each_process_gets_its_browser(self, monkeypatch):
+        """Каждый процесс получает свой браузер и в BROWSERS, и в BROWSER"""
+        launched = {}
+
+        def fake_run(commands, envs=None):
+            launched.update(envs)
+            return {name: True for name in commands}
+
+        monkeypatch.setattr(run_tests, "run_commands_concurrently", fake_run)
+        monkeypatch.setattr(run_tests, "merge_allure_results", lambda sources: None)
+        assert run_tests.run_browser_matrix(["chrome", "firefox"])
+        assert launched == {
+            "chrome": {"BROWSERS": "chrome", "BROWSER": "chrome"},
+            "firefox": {"BROWSERS": "firefox", "BROWSER": "firefox"},
+        }
@@ -0,0 +1,64 @@
+"""
+Офлайн-тесты пула браузеров
+"""
+import threading
+
+import allure
+
+from utils.browser_pool import BrowserPool
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestBrowserPool:
+    """Выдача, возврат и закрытие браузеров пула"""
+
+    def test_acquire_prewarmed_and_release(self, driver_factory):
+        """Выдается прогретый браузер; при возврате он очищается и снова доступен"""
+        pool = BrowserPool(driver_factory, 1).start()
+        driver = pool.acquire()
+        pool.release(driver)
+        assert driver.visited == ["about:blank"]
+        assert pool.acquire() is driver
+        assert len(driver_factory.drivers) == 1
+        pool.shutdown()
+
+    def test_unhealthy_driver_replaced(self, driver_factory):
+        """Упавшая сессия закрывается, вместо нее запускается новая"""
+        pool = BrowserPool(driver_factory, 1).start()
+        dead = pool.acquire()
+        dead.alive = False
+        pool.release(dead)
+        replacement = pool.acquire()
+        assert replacement is not dead and dead.quit_count == 1
+        pool.shutdown()
+
+    def test_empty_pool_creates_synchronously(self, driver_factory):
+        """Пустой пул без запусков в фоне создает браузер сразу"""
+        pool = BrowserPool(driver_factory, 0).start()
+        assert pool.acquire() is driver_factory.drivers[0]
+
+    def test_shutdown_waits_for_inflight_launches(self, driver_factory):
+        """Браузеры, запуск которых завершился во время shutdown, тоже закрываются"""
+        gate = threading.Event()
+
+        def slow_factory():
+            gate.wait(5)
+            return driver_factory()
+
+        pool = BrowserPool(slow_factory, 3).start()
+        shutdown = threading.Thread(target=pool.shutdown)
+        shutdown.start()
+        gate.set()
+        shutdown.join(5)
+        assert not shutdown.is_alive()
+        assert len(driver_factory.drivers) == 3
+        assert all(driver.quit_count == 1 for driver in driver_factory.drivers)
+
+    def test_release_after_shutdown_quits(self, driver_factory):
+        """Возвращенный после shutdown браузер закрывается, а не кладется в очередь"""
+        pool = BrowserPool(driver_factory, 1).start()
+        driver = pool.acquire()
+        pool.shutdown()
+        pool.release(driver)
+        assert driver.quit_count == 1
+        assert pool._ready.empty()
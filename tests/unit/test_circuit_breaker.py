@@ -0,0 +1,157 @@
+"""
+Офлайн-тесты предохранителя
+"""
+import os
+import subprocess
+import sys
+
+import allure
+import pytest
+import requests
+
+from utils import circuit_breaker
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, run_preflight_checks
+from utils.soak import SoakRunner
+
+
+class FakeClock:
+    """Управляемое время для time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestCircuitBreaker:
+    """Размыкание после K подряд сбоев"""
+
+    def test_opens_after_threshold(self):
+        """Предохранитель размыкается на K-м подряд сбое"""
+        breaker = CircuitBreaker("api", threshold=3, cooldown=0)
+        breaker.record_failure("e1")
+        breaker.record_failure("e2")
+        assert not breaker.is_open
+        breaker.record_failure("e3")
+        assert breaker.is_open
+        assert "e3" in breaker.reason
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    def test_success_resets_counter(self):
+        """Успешный вызов сбрасывает счетчик подряд идущих сбоев"""
+        breaker = CircuitBreaker("api", threshold=2)
+        breaker.record_failure("e1")
+        breaker.record_success()
+        breaker.record_failure("e2")
+        assert not breaker.is_open
+
+    def test_trip_and_success_does_not_close(self):
+        """Разомкнутый предохранитель не замыкается успешным вызовом"""
+        breaker = CircuitBreaker("ui", threshold=5, cooldown=1)
+        breaker.trip("pre-flight")
+        breaker.record_success()
+        assert breaker.is_open
+        assert breaker.reason == "ui: pre-flight"
+
+    def test_half_open_after_cooldown(self, monkeypatch):
+        """После cooldown пробный вызов проходит: успех замыкает, сбой размыкает снова"""
+        clock = FakeClock()
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+        breaker = CircuitBreaker("api", threshold=2, cooldown=30)
+        breaker.record_failure("e1")
+        breaker.record_failure("e2")
+        assert breaker.is_open
+        clock.now += 30
+        assert breaker.is_half_open
+        breaker.check()
+        breaker.record_failure("e3")
+        assert breaker.is_open and "e3" in breaker.reason
+        clock.now += 30
+        breaker.record_success()
+        assert breaker.reason is None and breaker.failures == 0
+
+    def test_tripped_stays_open(self, monkeypatch):
+        """Разомкнутый pre-flight проверкой не переходит в полуоткрытое состояние"""
+        clock = FakeClock()
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+        breaker = CircuitBreaker("api", threshold=2, cooldown=30)
+        breaker.trip("pre-flight")
+        clock.now += 3600
+        assert breaker.is_open
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestPreflight:
+    """Pre-flight проверяет только нужные отобранным тестам сервисы"""
+
+    @pytest.fixture
+    def probes(self, monkeypatch):
+        calls = []
+
+        def refuse(method):
+            def probe(url, **kwargs):
+                calls.append((method, url))
+                raise requests.exceptions.ConnectionError("refused")
+            return probe
+
+        monkeypatch.setattr(requests, "head", refuse("HEAD"))
+        monkeypatch.setattr(requests, "get", refuse("GET"))
+        monkeypatch.setattr(circuit_breaker.settings, "LOCAL_STUB", False)
+        monkeypatch.setattr(circuit_breaker.settings, "API_TOKEN", "token")
+        return calls
+
+    def test_only_required_circuits_probed(self, probes):
+        """API-only запуск не обращается к сайту и не размыкает предохранитель UI"""
+        api = CircuitBreaker("api")
+        ui = CircuitBreaker("ui")
+        original = (circuit_breaker.api_circuit, circuit_breaker.ui_circuit)
+        circuit_breaker.api_circuit, circuit_breaker.ui_circuit = api, ui
+        try:
+            run_preflight_checks({api})
+        finally:
+            circuit_breaker.api_circuit, circuit_breaker.ui_circuit = original
+        assert [method for method, _ in probes] == ["GET"]
+        assert api.is_open and not ui.is_open
+
+    def test_api_run_fails_without_ui_probe(self, tmp_path):
+        """Недоступный API: тесты пропущены, прогон с ошибкой, сайт не проверяется"""
+        env = dict(os.environ, API_URL="http://127.0.0.1:1/api-v2", YOUGILE_TOKEN="t",
+                   TRENDS="false", TEST_HISTORY_FILE=str(tmp_path / "history.json"),
+                   BASE_URL="http://127.0.0.1:1")
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "tests/test_api.py", "-q", "-p", "no:cacheprovider"],
+            capture_output=True, text=True, env=env, timeout=120
+        )
+        assert result.returncode == 1, result.stdout
+        assert "YouGile API: pre-flight" in result.stdout
+        assert "YouGile UI" not in result.stdout
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestSoakWithOpenCircuit:
+    """Soak-прогон не крутит циклы при разомкнутом предохранителе"""
+
+    def test_waits_instead_of_spinning(self):
+        """Пока предохранитель разомкнут, циклы не выполняются, время простоя в отчете"""
+        breaker = CircuitBreaker("api", cooldown=0)
+        cycles = []
+        runner = SoakRunner("unit", duration=0.3, sample_interval=10, warmup=0, circuit=breaker)
+        breaker.trip("down")
+        report = runner.run(lambda: cycles.append(1))
+        assert len(cycles) == 1  # только прогревочный цикл
+        assert report["circuit_open_s"] > 0
+        assert any("Предохранитель" in finding for finding in report["findings"])
+
+    def test_open_circuit_errors_not_timed(self):
+        """Мгновенный отказ предохранителя считается ошибкой, но не задержкой"""
+        runner = SoakRunner("unit", duration=0, warmup=0)
+
+        def rejected():
+            raise CircuitOpenError("api: down")
+
+        runner.timed("create", rejected)
+        assert runner.errors == {"create: CircuitOpenError": 1}
+        assert runner._latencies == {}
@@ -0,0 +1,65 @@
+"""
+Офлайн-тесты источников вариантов данных
+"""
+import json
+
+import allure
+import pytest
+
+from utils.data_cases import (
+    GeneratedCaseSource, case_id, make_case, open_source, shard_refs
+)
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestDataCases:
+    """Потоковое чтение, генерация и шардирование вариантов"""
+
+    def test_jsonl_skips_blank_lines(self, tmp_path):
+        """Пустые строки JSONL не становятся вариантами, смещения указывают на строки"""
+        path = tmp_path / "cases.jsonl"
+        path.write_text(
+            json.dumps({"title": "Проект"}, ensure_ascii=False) + "\n\n"
+            + json.dumps({"payload": {"title": ""}, "valid": False}) + "\n",
+            encoding="utf-8"
+        )
+        source = open_source(str(path))
+        refs = list(source.refs())
+        assert [case_id(ref) for ref in refs] == ["case0", "case1"]
+        assert source.load(refs[0]) == {"payload": {"title": "Проект"}, "valid": True}
+        assert source.load(refs[1]) == {"payload": {"title": ""}, "valid": False}
+
+    def test_csv_header_and_valid_column(self, tmp_path):
+        """Заголовок CSV задает поля payload, колонка valid разбирается как флаг"""
+        path = tmp_path / "cases.csv"
+        path.write_text("title,valid\nAlpha,true\n,нет\n", encoding="utf-8")
+        source = open_source(str(path))
+        cases = [source.load(ref) for ref in source.refs()]
+        assert cases == [
+            {"payload": {"title": "Alpha"}, "valid": True},
+            {"payload": {"title": ""}, "valid": False},
+        ]
+
+    def test_generated_is_deterministic(self):
+        """Вариант зависит только от (seed, номер), а не от порядка загрузки"""
+        first, second = GeneratedCaseSource(7, 50), GeneratedCaseSource(7, 50)
+        forward = [first.load(ref) for ref in first.refs()]
+        backward = [second.load(ref) for ref in reversed(list(second.refs()))]
+        assert forward == backward[::-1]
+        assert all(case["payload"]["title"].strip() for case in forward if case["valid"])
+        assert any(not case["valid"] for case in forward)
+
+    def test_shards_partition_cases(self):
+        """Шарды не пересекаются и вместе покрывают все варианты"""
+        shards = [list(shard_refs(iter(range(10)), 3, index)) for index in range(3)]
+        assert sorted(ref for shard in shards for ref in shard) == list(range(10))
+        assert shards[1] == [1, 4, 7]
+
+    def test_make_case_flat_record(self):
+        """Плоская запись без payload превращается в payload без поля valid"""
+        assert make_case({"title": "A", "valid": "0"}) == {"payload": {"title": "A"}, "valid": False}
+
+    def test_unsupported_source(self):
+        """Неизвестный формат источника отклоняется"""
+        with pytest.raises(ValueError):
+            open_source("cases.xml")
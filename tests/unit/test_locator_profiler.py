@@ -0,0 +1,87 @@
+"""
+Офлайн-тесты профилировщика локаторов и методов Page Object
+"""
+import threading
+
+import allure
+import pytest
+
+from utils.locator_profiler import LocatorProfiler
+
+
+class CommandDriver:
+    """Драйвер, только принимающий команды"""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {"value": None}
+
+
+@pytest.fixture
+def profiler():
+    return LocatorProfiler()
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestLocatorProfiler:
+    """Статистика локаторов, методов и команд WebDriver"""
+
+    def test_record_lookup(self, profiler):
+        """Время и таймауты копятся по паре (стратегия, значение)"""
+        profiler.record_lookup(("css selector", ".item"), 0.5, timed_out=False)
+        profiler.record_lookup(("css selector", ".item"), 1.5, timed_out=True)
+        stats = profiler.locators["css selector=.item"]
+        assert (stats.calls, stats.total, stats.max) == (2, 2.0, 1.5)
+        assert (stats.avg, stats.timeouts) == (1.0, 1)
+
+    def test_commands_counted_in_active_methods(self, profiler):
+        """Команда учитывается во всех методах стека, в рекурсивном - один раз"""
+        driver = CommandDriver()
+        profiler.instrument(driver)
+        profiler.instrument(driver)
+
+        def inner():
+            driver.execute("findElement")
+
+        def outer(depth):
+            driver.execute("get")
+            if depth:
+                profiled_outer(depth - 1)
+            profiled_inner()
+
+        profiled_inner = profiler.profile_method("Page.inner", inner)
+        profiled_outer = profiler.profile_method("Page.outer", outer)
+        profiled_outer(1)
+
+        assert driver.commands == ["get", "get", "findElement", "findElement"]
+        assert profiler.methods["Page.outer"].commands == 4
+        assert profiler.methods["Page.outer"].calls == 2
+        assert profiler.methods["Page.inner"].commands == 2
+
+    def test_stack_is_per_thread(self, profiler):
+        """Команды другого потока не приписываются методам текущего"""
+        started, release = threading.Event(), threading.Event()
+
+        def wait():
+            started.set()
+            release.wait(5)
+
+        worker = threading.Thread(target=profiler.profile_method("Page.wait", wait))
+        worker.start()
+        started.wait(5)
+        profiler.record_command()
+        release.set()
+        worker.join()
+        assert profiler.methods["Page.wait"].commands == 0
+
+    def test_report_ranked_by_total(self, profiler):
+        """Отчет упорядочен по суммарному времени и ограничен limit"""
+        profiler.record_lookup(("id", "fast"), 0.1, timed_out=False)
+        profiler.record_lookup(("id", "slow"), 2.0, timed_out=True)
+        profiler.record_lookup(("id", "medium"), 1.0, timed_out=False)
+        lines = profiler.report(limit=2).splitlines()
+        assert [line.split()[0] for line in lines[2:4]] == ["id=slow", "id=medium"]
+        assert not any(line.startswith("id=fast") for line in lines)
@@ -0,0 +1,95 @@
+"""
+Офлайн-тесты захвата сети по событиям performance-лога
+"""
+import json
+
+import allure
+import pytest
+
+from utils.network_capture import NetworkCapture
+
+
+def log_entry(method, **params):
+    """Запись performance-лога Chrome с CDP событием"""
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def request_events(request_id, url, method="GET", status=200, started=1.0, failed=False):
+    """События одного запроса: отправка, ответ и завершение (или ошибка)"""
+    events = [log_entry("Network.requestWillBeSent", requestId=request_id, type="XHR",
+                        timestamp=started, request={"url": url, "method": method})]
+    if failed:
+        events.append(log_entry("Network.loadingFailed", requestId=request_id))
+        return events
+    events.append(log_entry("Network.responseReceived", requestId=request_id,
+                            timestamp=started + 0.05, response={"status": status}))
+    events.append(log_entry("Network.loadingFinished", requestId=request_id,
+                            timestamp=started + 0.2))
+    return events
+
+
+@pytest.fixture
+def capture(driver_factory):
+    """Захват сети поддельного драйвера; события кладутся в driver.performance_log"""
+    return NetworkCapture(driver_factory())
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestNetworkCapture:
+    """Сборка запросов из CDP событий и ожидание XHR"""
+
+    def test_request_lifecycle(self, capture):
+        """Статус и тайминги собираются из событий одного requestId"""
+        capture.driver.performance_log = request_events("1", "http://stub/api-v2/projects",
+                                                        method="POST", status=201)
+        [request] = capture.find_requests(r"/api-v2/projects$")
+        assert (request.method, request.status, request.resource_type) == ("POST", 201, "XHR")
+        assert request.ttfb_ms == pytest.approx(50)
+        assert request.duration_ms == pytest.approx(200)
+
+    def test_incomplete_and_unknown_events(self, capture):
+        """Незавершенные запросы не находятся по умолчанию, чужие события игнорируются"""
+        capture.driver.performance_log = request_events("1", "http://stub/projects")[:2] + [
+            log_entry("Network.loadingFinished", requestId="unknown", timestamp=2.0)
+        ]
+        assert capture.find_requests("/projects") == []
+        [pending] = capture.find_requests("/projects", completed_only=False)
+        assert pending.status == 200 and pending.duration_ms is None
+        assert list(capture.requests) == ["1"]
+
+    def test_filter_by_method_and_failure(self, capture):
+        """Фильтр по методу без учета регистра; ошибка загрузки завершает запрос"""
+        capture.driver.performance_log = (
+            request_events("1", "http://stub/api-v2/projects/a", method="GET")
+            + request_events("2", "http://stub/api-v2/projects/a", method="PUT", failed=True)
+        )
+        [request] = capture.find_requests(r"/projects/[^/]+$", method="put")
+        assert request.request_id == "2" and request.failed and request.status is None
+
+    def test_clear_drops_previous_requests(self, capture):
+        """clear() отбрасывает и накопленные, и еще не прочитанные события"""
+        capture.driver.performance_log = request_events("1", "http://stub/login")
+        capture.clear()
+        assert capture.timings() == []
+
+    def test_wait_for_request_returns_latest(self, capture):
+        """Из нескольких подходящих запросов возвращается последний"""
+        capture.driver.performance_log = (
+            request_events("1", "http://stub/api-v2/projects", method="POST")
+            + request_events("2", "http://stub/api-v2/projects", method="POST", started=2.0)
+        )
+        assert capture.wait_for_request(r"/projects$", method="POST", timeout=0).request_id == "2"
+
+    def test_wait_for_request_timeout(self, capture):
+        """Без подходящего запроса ожидание завершается TimeoutError"""
+        capture.driver.performance_log = request_events("1", "http://stub/api-v2/projects")
+        with pytest.raises(TimeoutError, match="POST"):
+            capture.wait_for_request(r"/projects$", method="POST", timeout=0.2)
+
+    @pytest.mark.parametrize("network_capture", [False, True])
+    def test_performance_log_only_on_request(self, network_capture):
+        """Performance-лог Chrome включается только для драйверов с захватом сети"""
+        from utils.driver_factory import build_options
+
+        options = build_options("chrome", True, (800, 600), network_capture=network_capture)
+        assert ("goog:loggingPrefs" in options.to_capabilities()) is network_capture
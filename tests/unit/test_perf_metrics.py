@@ -0,0 +1,49 @@
+"""
+Офлайн-тесты бюджетов производительности страниц
+"""
+import json
+
+import allure
+import pytest
+
+from config.settings import settings
+from utils import perf_metrics
+from utils.perf_metrics import check_budget, record_page_metrics
+
+
+@pytest.fixture
+def budgets(monkeypatch, tmp_path):
+    """Бюджет страницы логина; тренд пишется во временный файл"""
+    monkeypatch.setattr(settings, "PERF_BUDGETS",
+                        {"login": {"load": 1000, "first-contentful-paint": 500}})
+    monkeypatch.setattr(settings, "PERF_TREND_FILE", str(tmp_path / "perf_trend.jsonl"))
+    monkeypatch.setattr(perf_metrics, "collect_navigation_timing",
+                        lambda driver: {"load": 1500.0, "first-contentful-paint": 400.0})
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestPerfBudget:
+    """Проверка бюджетов и запись тренда"""
+
+    def test_check_budget(self, budgets):
+        """Нарушение - значение строго больше лимита; отсутствующие метрики пропускаются"""
+        assert check_budget("login", {"load": 1500.0, "first-contentful-paint": 500.0}) == [
+            "login.load = 1500 мс > 1000 мс"
+        ]
+        assert check_budget("login", {"domContentLoaded": 9000.0}) == []
+        assert check_budget("projects", {"load": 9000.0}) == []
+
+    def test_warn_mode_records_trend(self, budgets, monkeypatch, driver_factory):
+        """В режиме warn нарушение - предупреждение, запись попадает в тренд"""
+        monkeypatch.setattr(settings, "PERF_BUDGET_MODE", "warn")
+        with pytest.warns(UserWarning, match="login.load"):
+            record_page_metrics(driver_factory(), "login", "http://stub/login")
+        with open(settings.PERF_TREND_FILE, encoding="utf-8") as trend_file:
+            [record] = [json.loads(line) for line in trend_file]
+        assert (record["page"], record["browser"], record["cdp"]) == ("login", "chrome", {})
+
+    def test_fail_mode_raises(self, budgets, monkeypatch, driver_factory):
+        """В режиме fail нарушение бюджета роняет тест"""
+        monkeypatch.setattr(settings, "PERF_BUDGET_MODE", "fail")
+        with pytest.raises(AssertionError, match="Превышен бюджет"):
+            record_page_metrics(driver_factory(), "login", "http://stub/login")
@@ -0,0 +1,59 @@
+"""
+Офлайн-тесты локальной копии проектов
+"""
+import allure
+
+from utils.project_mirror import ProjectMirror
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestProjectMirror:
+    """Индексы по ID и названию"""
+
+    def test_upsert_and_lookup(self):
+        """Проект находится по ID и по названию"""
+        mirror = ProjectMirror()
+        mirror.upsert({"id": "1", "title": "Alpha"})
+        assert "1" in mirror
+        assert mirror.get("1")["title"] == "Alpha"
+        assert [p["id"] for p in mirror.find_by_title("Alpha")] == ["1"]
+
+    def test_update_reindexes_title(self):
+        """Переименование убирает проект из старого индекса названия"""
+        mirror = ProjectMirror()
+        mirror.upsert({"id": "1", "title": "Alpha"})
+        mirror.update("1", {"title": "Beta"})
+        assert mirror.find_by_title("Alpha") == []
+        assert mirror.find_by_title("Beta")[0]["id"] == "1"
+
+    def test_duplicate_titles(self):
+        """Несколько проектов с одинаковым названием возвращаются все"""
+        mirror = ProjectMirror()
+        mirror.upsert({"id": "2", "title": "Same"})
+        mirror.upsert({"id": "1", "title": "Same"})
+        mirror.remove("2")
+        assert [p["id"] for p in mirror.find_by_title("Same")] == ["1"]
+
+    def test_deleted_flag_removes(self):
+        """Проект с deleted=true убирается из копии"""
+        mirror = ProjectMirror()
+        mirror.upsert({"id": "1", "title": "Alpha"})
+        mirror.upsert({"id": "1", "title": "Alpha", "deleted": True})
+        assert len(mirror) == 0
+
+    def test_returned_projects_are_copies(self):
+        """Изменение результата не портит копию"""
+        mirror = ProjectMirror()
+        mirror.upsert({"id": "1", "title": "Alpha"})
+        mirror.get("1")["title"] = "Changed"
+        assert mirror.get("1")["title"] == "Alpha"
+
+    def test_sync_pages_and_drops_stale(self, fake_client):
+        """Синхронизация проходит все страницы и убирает исчезнувшие проекты"""
+        fake_client.projects = [{"id": str(i), "title": f"P{i}"} for i in range(5)]
+        mirror = ProjectMirror(page_size=2)
+        mirror.upsert({"id": "stale", "title": "Old"})
+        assert mirror.sync(fake_client) == 5
+        assert fake_client.page_calls == 3
+        assert "stale" not in mirror
+        assert mirror.synced
@@ -0,0 +1,88 @@
+"""
+Офлайн-тесты шардирования по истории и записи истории запусков
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+import allure
+
+from utils.run_history import (
+    DEFAULT_DURATION, failed_first_key, load_history, save_history, split_into_shards
+)
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestRunHistory:
+    """Шардирование LPT и хранение истории"""
+
+    def test_shards_cover_all_tests_once(self):
+        """Каждый тест попадает ровно в один шард"""
+        nodeids = [f"t{i}" for i in range(10)]
+        shards = split_into_shards(nodeids, {}, 3)
+        assert sorted(sum(shards, [])) == sorted(nodeids)
+
+    def test_shards_balanced_by_duration(self):
+        """Долгий тест уходит в отдельный шард, короткие делятся между остальными"""
+        history = {"slow": {"duration": 10.0}}
+        history.update({f"fast{i}": {"duration": 1.0} for i in range(4)})
+        shards = split_into_shards(history, history, 3)
+        assert ["slow"] in shards
+        loads = sorted(sum(history[n]["duration"] for n in shard) for shard in shards)
+        assert loads == [2.0, 2.0, 10.0]
+
+    def test_unknown_tests_use_default_duration(self):
+        """Тесты без истории считаются длительностью по умолчанию"""
+        shards = split_into_shards(["a", "b"], {}, 2)
+        assert sorted(len(shard) for shard in shards) == [1, 1]
+        assert DEFAULT_DURATION > 0
+
+    def test_failed_first_key(self):
+        """Упавшие в прошлый раз тесты сортируются первыми"""
+        history = {"a": {"outcome": "passed"}, "b": {"outcome": "failed"}}
+        assert sorted(["a", "b", "c"], key=lambda n: failed_first_key(n, history)) == [
+            "b", "a", "c"
+        ]
+
+    def test_save_history_merges_with_existing(self, tmp_path):
+        """Новые результаты дописываются к сохраненным"""
+        path = str(tmp_path / "history.json")
+        save_history({"a": {"duration": 1.0, "outcome": "passed"}}, path)
+        save_history({"b": {"duration": 2.0, "outcome": "failed"}}, path)
+        assert set(load_history(path)) == {"a", "b"}
+
+    def test_concurrent_saves_keep_all_entries(self, tmp_path):
+        """Параллельные записи не теряют обновления и не оставляют временных файлов"""
+        path = str(tmp_path / "history.json")
+
+        def writer(tag):
+            for i in range(50):
+                save_history({f"{tag}{i}": {"duration": 1.0, "outcome": "passed"}}, path)
+
+        threads = [threading.Thread(target=writer, args=(tag,)) for tag in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(path, encoding="utf-8") as history_file:
+            assert len(json.load(history_file)) == 200
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_sequential_shards_run_every_test_once(self, tmp_path):
+        """Шарды, запущенные друг за другом, не теряют и не дублируют тесты"""
+        env = dict(os.environ, TEST_HISTORY_FILE=str(tmp_path / "history.json"), TRENDS="false")
+        executed = []
+        for index in range(2):
+            result = subprocess.run(
+                [sys.executable, "-m", "pytest", "tests/unit/test_data_cases.py", "-v",
+                 "-p", "no:cacheprovider", "--shards=2", f"--shard-index={index}"],
+                capture_output=True, text=True, env=env
+            )
+            assert result.returncode == 0, result.stdout
+            executed += re.findall(r"^(\S+::\S+) PASSED", result.stdout, re.MULTILINE)
+        assert len(executed) == len(set(executed)) == 6
+        assert not (tmp_path / "history.json").exists()
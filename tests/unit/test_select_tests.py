@@ -0,0 +1,107 @@
+"""
+Офлайн-тесты выбора тестов по измененным файлам (--changed-only)
+"""
+import textwrap
+
+import allure
+
+from run_tests import build_import_graph, select_tests_for_changes
+
+
+GRAPH = {
+    "tests/conftest.py": {"utils/api_client.py"},
+    "tests/test_api.py": {"tests/conftest.py", "utils/api_client.py"},
+    "tests/test_ui.py": {"tests/conftest.py", "pages/base_page.py", "utils/driver_factory.py"},
+    "pages/base_page.py": {"config/settings.py"},
+    "utils/api_client.py": {"config/settings.py"},
+    "utils/driver_factory.py": {"config/settings.py"},
+    "config/settings.py": set(),
+}
+
+# Синтетическое дерево: импорты conftest.py на уровне модуля, в фикстурах и в хуках
+TREE = {
+    "utils/shared.py": "",
+    "utils/grid.py": "",
+    "utils/page.py": "",
+    "utils/pool.py": "",
+    "utils/stub.py": "",
+    "tests/conftest.py": """
+        import pytest
+        from utils import shared
+
+        @pytest.fixture
+        def ui_page(request):
+            from utils import page
+            request.getfixturevalue("grid")
+
+        @pytest.fixture(scope="session")
+        def grid():
+            from utils import grid
+
+        @pytest.fixture(autouse=True)
+        def _stub():
+            from utils import stub
+
+        @pytest.fixture
+        def driver():
+            pass
+
+        def pytest_configure(config):
+            from utils import pool
+    """,
+    "tests/test_api.py": """
+        def test_api():
+            pass
+    """,
+    "tests/test_page.py": """
+        def test_page(ui_page):
+            pass
+    """,
+    "tests/test_driver.py": """
+        class TestDriver:
+            def test_driver(self, driver):
+                pass
+    """,
+}
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestSelectTestsForChanges:
+    """Замыкание графа импортов от измененных модулей к тестовым файлам"""
+
+    def test_direct_import(self):
+        """Изменение Page Object выбирает только UI тесты"""
+        assert select_tests_for_changes({"pages/base_page.py"}, GRAPH) == {"tests/test_ui.py"}
+
+    def test_shared_dependency(self):
+        """Модуль, импортируемый conftest.py на уровне модуля, затрагивает все тестовые файлы"""
+        assert select_tests_for_changes({"config/settings.py"}, GRAPH) == {
+            "tests/test_api.py", "tests/test_ui.py"
+        }
+
+    def test_unrelated_files(self):
+        """Файлы вне графа импортов не выбирают тесты"""
+        assert select_tests_for_changes({"README.md"}, GRAPH) == set()
+
+    def test_conftest_imports_attributed(self, tmp_path, monkeypatch):
+        """Отложенные импорты conftest.py относятся к тестам, запрашивающим фикстуру"""
+        for path, source in TREE.items():
+            (tmp_path / path).parent.mkdir(exist_ok=True)
+            (tmp_path / path).write_text(textwrap.dedent(source), encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        graph = build_import_graph(packages=("utils", "tests"))
+        everything = {"tests/test_api.py", "tests/test_page.py", "tests/test_driver.py"}
+
+        assert select_tests_for_changes({"tests/conftest.py"}, graph) == everything
+        assert select_tests_for_changes({"utils/shared.py"}, graph) == everything
+        assert select_tests_for_changes({"utils/stub.py"}, graph) == everything
+        assert select_tests_for_changes({"utils/page.py"}, graph) == {"tests/test_page.py"}
+        assert select_tests_for_changes({"utils/grid.py"}, graph) == {"tests/test_page.py"}
+        assert select_tests_for_changes({"utils/pool.py"}, graph) == {"tests/test_driver.py"}
+
+    def test_real_graph(self):
+        """На реальном дереве Page Object и пул браузеров не выбирают API тесты"""
+        graph = build_import_graph()
+        assert select_tests_for_changes({"pages/login_page.py"}, graph) == {"tests/test_ui.py"}
+        assert select_tests_for_changes({"utils/browser_pool.py"}, graph) == {"tests/test_ui.py"}
+        assert "tests/test_api.py" in select_tests_for_changes({"utils/api_client.py"}, graph)
@@ -0,0 +1,92 @@
+"""
+Офлайн-тесты статистики и отчета soak-прогона
+"""
+import allure
+import pytest
+import requests
+
+from utils.soak import SoakRunner, percentile, slope_per_hour
+from utils.stub_server import StubProcess, YougileAPIStubServer
+
+
+def sample(elapsed, heap_kb, p95, fds=10):
+    """Снимок ресурсов в формате SoakRunner"""
+    return {
+        "elapsed_s": elapsed,
+        "python_heap_kb": heap_kb,
+        "fds": fds,
+        "sockets": 2,
+        "latency_ms": {"get": {"p50": p95 / 2, "p95": p95, "p99": p95, "count": 10}},
+    }
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestSoakStatistics:
+    """Перцентили и наклон тренда"""
+
+    @pytest.mark.parametrize("p, expected", [(0, 1), (50, 5), (95, 10), (99, 10), (100, 10)])
+    def test_percentile_nearest_rank(self, p, expected):
+        """Перцентиль методом ближайшего ранга не выходит за границы выборки"""
+        assert percentile([10, 9, 8, 7, 6, 5, 4, 3, 2, 1], p) == expected
+
+    def test_percentile_empty(self):
+        assert percentile([], 95) == 0.0
+
+    def test_slope_per_hour(self):
+        """Наклон пересчитывается в час; пропуски (None) не учитываются"""
+        points = [(0, 100), (60, None), (1800, 150), (3600, 200)]
+        assert slope_per_hour(points) == pytest.approx(100)
+        assert slope_per_hour([(0, 5), (60, None)]) == 0.0
+        assert slope_per_hour([(60, 1), (60, 9)]) == 0.0
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestSoakReport:
+    """Тренды отчета без снимков периода прогрева"""
+
+    def test_warmup_excluded_from_trends(self):
+        """Рост памяти и задержек во время прогрева не дает находок"""
+        runner = SoakRunner("unit", duration=3600, warmup=600)
+        runner.samples = [sample(0, 1000, 50), sample(300, 5000, 20)] + [
+            sample(elapsed, 5000, 20) for elapsed in (600, 1800, 3600)
+        ]
+        report = runner.report(top_growth=[])
+        assert report["heap_growth_kb_per_hour"] == 0.0
+        assert report["p95_drift"] == {"get": 1.0}
+        assert report["findings"] == []
+
+    def test_steady_growth_reported(self):
+        """Рост после прогрева попадает в находки"""
+        runner = SoakRunner("unit", duration=7200, warmup=0)
+        runner.samples = [
+            sample(elapsed, 1000 + elapsed, 20 + elapsed / 180, fds=10 + elapsed // 360)
+            for elapsed in (0, 3600, 7200)
+        ]
+        findings = runner.report(top_growth=[])["findings"]
+        assert any("Python heap" in finding for finding in findings)
+        assert any("дескрипторов" in finding for finding in findings)
+        assert any("Дрейф p95 get" in finding for finding in findings)
+
+    def test_short_run_drops_first_sample(self):
+        """Если после прогрева меньше двух снимков, отбрасывается только первый"""
+        runner = SoakRunner("unit", duration=60, warmup=600)
+        runner.samples = [sample(0, 1000, 90), sample(20, 2000, 20), sample(40, 2000, 20)]
+        report = runner.report(top_growth=[])
+        assert report["heap_growth_kb_per_hour"] == 0.0
+        assert report["p95_drift"] == {"get": 1.0}
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestStubProcess:
+    """Заглушка API в отдельном процессе"""
+
+    def test_serves_and_stops(self):
+        """Процесс отдает адрес сервера, обслуживает запросы и завершается по stop()"""
+        stub = StubProcess(YougileAPIStubServer).start()
+        try:
+            response = requests.post(f"{stub.base_url}/projects", json={"title": "Soak"},
+                                     headers={"Authorization": "Bearer token"}, timeout=5)
+            assert response.status_code == 201
+        finally:
+            stub.stop()
+        assert not stub._process.is_alive()
@@ -0,0 +1,139 @@
+"""
+Офлайн-тесты локальных заглушек YouGile
+"""
+from html.parser import HTMLParser
+
+import allure
+import pytest
+import requests
+
+from utils.stub_server import YougileAPIStubServer, YougileStubServer
+
+
+class ElementCollector(HTMLParser):
+    """Собирает теги страницы с атрибутами и текстом"""
+
+    def __init__(self):
+        super().__init__()
+        self.elements = []
+
+    def handle_starttag(self, tag, attrs):
+        self.elements.append({"tag": tag, "attrs": dict(attrs), "text": ""})
+
+    def handle_data(self, data):
+        if self.elements:
+            self.elements[-1]["text"] += data.strip()
+
+    def find(self, tag, **attrs):
+        return [element for element in self.elements if element["tag"] == tag
+                and all(element["attrs"].get(key) == value for key, value in attrs.items())]
+
+    def with_class(self, class_name):
+        return [element for element in self.elements
+                if class_name in element["attrs"].get("class", "").split()]
+
+
+def parse(page):
+    collector = ElementCollector()
+    collector.feed(page)
+    return collector
+
+
+@pytest.fixture(scope="module")
+def ui_stub():
+    """Запущенная заглушка UI с тремя проектами"""
+    server = YougileStubServer(project_count=3).start()
+    yield server
+    server.stop()
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestYougileStubServer:
+    """Страницы заглушки UI под локаторы Page Object"""
+
+    def test_login_page_without_error_until_failure(self, ui_stub):
+        """Сообщение об ошибке входа не присутствует в DOM до неудачной попытки"""
+        page = parse(ui_stub.render("/login"))
+        assert page.find("input", name="email") and page.find("input", name="password")
+        assert len(page.find("button", type="submit")) == 1
+        assert page.with_class("error-message") == []
+
+    def test_projects_page_locators_unambiguous(self, ui_stub):
+        """Кнопка создания не совпадает с локаторами сохранения и отмены формы"""
+        page = parse(ui_stub.render("/projects"))
+        assert [button["text"] for button in page.find("button", type="button")] == ["Отмена"]
+        assert [button["text"] for button in page.find("button", type="submit")] == ["Сохранить"]
+        assert page.find("button", **{"data-testid": "create-project"})
+        assert page.with_class("error-message") == []
+        assert page.with_class("success-message") == []
+        assert len(page.with_class("project-item")) == 3
+
+    def test_serves_pages_over_http(self, ui_stub):
+        """Страницы отдаются по HTTP, неизвестный путь - 404"""
+        response = requests.get(f"{ui_stub.base_url}/login", timeout=5)
+        assert response.status_code == 200
+        assert "text/html" in response.headers["Content-Type"]
+        assert requests.get(f"{ui_stub.base_url}/unknown", timeout=5).status_code == 404
+
+    def test_project_xhr_endpoints(self, ui_stub):
+        """Страница проектов отправляет создание и изменение в /api-v2/projects"""
+        created = requests.post(f"{ui_stub.base_url}/api-v2/projects",
+                                json={"title": "New"}, timeout=5)
+        assert created.status_code == 201 and created.json()["id"]
+        updated = requests.put(f"{ui_stub.base_url}/api-v2/projects/stub-0",
+                               json={"title": "Renamed"}, timeout=5)
+        assert updated.status_code == 200 and updated.json() == {"id": "stub-0"}
+        assert requests.post(f"{ui_stub.base_url}/api-v2/projects",
+                             json={"title": ""}, timeout=5).status_code == 400
+        page = parse(ui_stub.render("/projects"))
+        assert page.with_class("project-item")[0]["attrs"]["data-id"] == "stub-0"
+
+    def test_padding_nodes(self):
+        """Узлы-наполнители увеличивают DOM на заданное количество"""
+        server = YougileStubServer(padding_nodes=50).start()
+        try:
+            page = parse(server.render("/projects"))
+        finally:
+            server.stop()
+        assert len(page.with_class("padding-node")) == 50
+
+
+@pytest.fixture
+def api_stub():
+    """Запущенная заглушка REST API"""
+    server = YougileAPIStubServer().start()
+    yield server
+    server.stop()
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestYougileAPIStubServer:
+    """Хранение сущностей и коды ответов заглушки API"""
+
+    def test_crud_and_paging(self, api_stub):
+        """Созданные проекты читаются страницами, изменяются и удаляются"""
+        ids = [api_stub.handle("POST", "/api-v2/projects", {}, {"title": f"P{i}"})[1]["id"]
+               for i in range(3)]
+        status, page = api_stub.handle("GET", "/api-v2/projects",
+                                       {"limit": ["2"], "offset": ["1"]}, None)
+        assert status == 200 and page["paging"]["next"] is False
+        assert [project["id"] for project in page["content"]] == ids[1:]
+        assert api_stub.handle("PUT", f"/api-v2/projects/{ids[0]}", {}, {"title": "New"})[0] == 200
+        assert api_stub.projects[ids[0]]["title"] == "New"
+        assert api_stub.handle("DELETE", f"/api-v2/projects/{ids[0]}", {}, None)[0] == 200
+        assert api_stub.handle("GET", f"/api-v2/projects/{ids[0]}", {}, None)[0] == 404
+
+    def test_validation(self, api_stub):
+        """Пустое название, несуществующий родитель и неизвестный ресурс отклоняются"""
+        assert api_stub.handle("POST", "/api-v2/projects", {}, {"title": ""})[0] == 400
+        assert api_stub.handle("POST", "/api-v2/boards", {},
+                               {"title": "B", "projectId": "missing"})[0] == 400
+        assert api_stub.handle("GET", "/api-v2/users", {}, None)[0] == 404
+        assert api_stub.handle("PATCH", "/api-v2/projects", {}, None)[0] == 405
+
+    def test_requires_authorization(self, api_stub):
+        """Запросы без заголовка Authorization получают 401"""
+        url = f"{api_stub.base_url}/projects"
+        assert requests.get(url, timeout=5).status_code == 401
+        response = requests.get(url, headers={"Authorization": "Bearer token"}, timeout=5)
+        assert response.status_code == 200 and response.json()["content"] == []
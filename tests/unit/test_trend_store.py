@@ -0,0 +1,84 @@
+"""
+Офлайн-тесты хранилища трендов и поиска замедлений
+"""
+import allure
+import pytest
+
+from config.settings import settings
+from utils.trend_store import TrendStore, detect_slowdowns
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Хранилище трендов во временном каталоге"""
+    trend_store = TrendStore(str(tmp_path / "trends.sqlite3"))
+    yield trend_store
+    trend_store.close()
+
+
+def env_key(*key):
+    """Ключ ряда в окружении по умолчанию"""
+    return (settings.BROWSER, "local-stub" if settings.LOCAL_STUB else settings.BASE_URL) + key
+
+
+def record(store, run_index, steps=(), tests=None):
+    run_id = f"run{run_index}"
+    store.record_run(run_id)
+    with store.connection:
+        store.connection.execute("UPDATE runs SET started = ? WHERE run_id = ?",
+                                 (run_index, run_id))
+    store.record_steps(run_id, list(steps))
+    if tests:
+        store.record_tests(run_id, tests)
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestTrendStore:
+    """Ряды длительностей по запускам и t-тест Уэлча"""
+
+    def test_repeated_steps_aggregated_per_run(self, store):
+        """Повторы шага внутри теста сводятся к одному значению на запуск"""
+        for i in range(3):
+            record(store, i, [("t", "step", 1.0, False), ("t", "step", 3.0, False)])
+        assert store.series("step_results") == {env_key("t", "step"): [2.0, 2.0, 2.0]}
+
+    def test_runs_with_failed_occurrence_excluded(self, store):
+        """Запуск, где шаг хотя бы раз упал, не входит в ряд"""
+        record(store, 0, [("t", "step", 1.0, False)])
+        record(store, 1, [("t", "step", 1.0, False), ("t", "step", 9.0, True)])
+        assert store.series("step_results") == {env_key("t", "step"): [1.0]}
+
+    def test_series_ordered_by_run_start(self, store):
+        """Значения упорядочены по времени начала запуска"""
+        record(store, 2, tests={"t": {"duration": 3.0, "outcome": "passed"}})
+        record(store, 1, tests={"t": {"duration": 2.0, "outcome": "passed"}})
+        record(store, 3, tests={"t": {"duration": 4.0, "outcome": "failed"}})
+        assert store.series("test_results") == {env_key("t"): [2.0, 3.0]}
+
+    def test_environments_not_mixed(self, store, monkeypatch):
+        """Запуски в другом браузере и на заглушке образуют отдельные ряды"""
+        monkeypatch.setattr(settings, "LOCAL_STUB", False)
+        monkeypatch.setattr(settings, "BROWSER", "chrome")
+        record(store, 0, tests={"t": {"duration": 1.0, "outcome": "passed"}})
+        monkeypatch.setattr(settings, "BROWSER", "firefox")
+        record(store, 1, tests={"t": {"duration": 2.0, "outcome": "passed"}})
+        monkeypatch.setattr(settings, "LOCAL_STUB", True)
+        record(store, 2, tests={"t": {"duration": 0.1, "outcome": "passed"}})
+        assert store.series("test_results") == {
+            ("chrome", settings.BASE_URL, "t"): [1.0],
+            ("firefox", settings.BASE_URL, "t"): [2.0],
+            ("firefox", "local-stub", "t"): [0.1],
+        }
+
+    def test_detects_slowdown(self):
+        """Устойчивое замедление последних запусков обнаруживается"""
+        baseline = [1.0, 1.05, 0.95, 1.02, 0.98, 1.01, 0.99]
+        slowdowns = detect_slowdowns({("t",): baseline + [2.0, 2.1, 1.9]})
+        assert [item["key"] for item in slowdowns] == ["t"]
+        assert slowdowns[0]["ratio"] == pytest.approx(2.0, rel=0.05)
+
+    def test_ignores_noise_and_short_history(self):
+        """Шум и недостаточная история не считаются замедлением"""
+        noisy = [1.0, 1.5, 0.7, 1.3, 0.8, 1.2, 0.9, 1.1, 1.2, 1.0]
+        assert detect_slowdowns({("t",): noisy}) == []
+        assert detect_slowdowns({("t",): [1.0, 1.0, 5.0, 5.0, 5.0]}) == []
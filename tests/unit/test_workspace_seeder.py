@@ -0,0 +1,114 @@
+"""
+Офлайн-тесты наполнения рабочего пространства
+"""
+import json
+
+import allure
+import pytest
+
+from config.settings import settings
+from run_tests import run_seed
+from utils.workspace_seeder import WorkspaceSeeder, WorkspaceSpec
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestWorkspaceSpec:
+    """Разбор и обход формы дерева"""
+
+    def test_parse_and_total(self):
+        """Строка '2x3x1' задает 2 проекта, 6 досок и 6 колонок"""
+        spec = WorkspaceSpec.parse("2x3x1")
+        assert str(spec) == "2x3x1x0"
+        assert spec.total == 14
+
+    def test_children_keys(self):
+        """Ключи потомков строятся из префиксов уровней"""
+        spec = WorkspaceSpec(1, 2, 0, 5)
+        assert spec.children(None) == ["p0"]
+        assert spec.children("p0") == ["p0/b0", "p0/b1"]
+        assert spec.children("p0/b1") == []
+        assert spec.children("p0/b0/c0/t0") == []
+
+    @pytest.mark.parametrize("text", ["", "1x2x3x4x5", "ax2"])
+    def test_invalid_spec(self, text):
+        """Некорректная строка отклоняется"""
+        with pytest.raises(ValueError):
+            WorkspaceSpec.parse(text)
+
+
+@allure.feature("Офлайн-тесты утилит")
+class TestWorkspaceSeeder:
+    """Создание, возобновление и удаление дерева на поддельном клиенте"""
+
+    @pytest.fixture
+    def make_seeder(self, tmp_path, fake_client):
+        def make(spec="2x2x1"):
+            return WorkspaceSeeder(WorkspaceSpec.parse(spec), "unit", workers=4,
+                                   state_path=str(tmp_path / "unit.json"),
+                                   client_factory=lambda: fake_client)
+        return make
+
+    @staticmethod
+    def created_by_key(fake_client):
+        # Название сущности: "Seed <name> <ключ>"
+        return {data["title"].split()[-1]: data for data in fake_client.created}
+
+    def test_seed_links_parents(self, tmp_path, fake_client, make_seeder):
+        """Каждый потомок создается с ID своего родителя, прогресс сохраняется"""
+        seeder = make_seeder()
+        ids = seeder.seed()
+        assert len(ids) == seeder.spec.total == 10
+        created = self.created_by_key(fake_client)
+        assert created["p0/b1"]["projectId"] == ids["p0"]
+        assert created["p1/b0/c0"]["boardId"] == ids["p1/b0"]
+        state = json.loads((tmp_path / "unit.json").read_text(encoding="utf-8"))
+        assert state["ids"] == ids and state["spec"] == "2x2x1x0"
+
+    def test_failed_subtree_resumes(self, fake_client, make_seeder):
+        """Упавший узел пропускает поддерево, повторный запуск создает только недостающее"""
+        fake_client.fail_titles = {"Seed unit p1/b0"}
+        seeder = make_seeder()
+        seeder.seed()
+        assert "p1/b0" in seeder.errors and "p1/b0/c0" not in seeder.ids
+        fake_client.fail_titles = set()
+        fake_client.created.clear()
+        make_seeder().seed()
+        assert sorted(self.created_by_key(fake_client)) == ["p1/b0", "p1/b0/c0"]
+
+    def test_spec_mismatch(self, make_seeder):
+        """Состояние от другого дерева не используется"""
+        make_seeder("1").seed()
+        with pytest.raises(ValueError):
+            make_seeder("2")
+
+    def test_teardown_children_first(self, tmp_path, fake_client, make_seeder):
+        """Удаление идет от листьев к проектам и убирает файл состояния"""
+        seeder = make_seeder()
+        ids = dict(seeder.seed())
+        seeder.teardown()
+        depth = {entity_id: key.count("/") for key, entity_id in ids.items()}
+        depths = [depth[entity_id] for entity_id in fake_client.deleted]
+        assert depths == sorted(depths, reverse=True)
+        assert len(depths) == len(ids)
+        assert not (tmp_path / "unit.json").exists()
+
+    def test_resume_disabled_ignores_state(self, tmp_path, fake_client, make_seeder):
+        """Без возобновления существующее состояние не загружается"""
+        make_seeder("1").seed()
+        seeder = WorkspaceSeeder(WorkspaceSpec.parse("2"), "unit",
+                                 state_path=str(tmp_path / "unit.json"),
+                                 client_factory=lambda: fake_client, resume=False)
+        assert seeder.ids == {}
+
+    def test_offline_run_keeps_real_state(self, tmp_path, monkeypatch):
+        """Офлайн-запуск против заглушки не читает и не удаляет состояние реального дерева"""
+        monkeypatch.setattr(settings, "SEED_STATE_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "API_URL", settings.API_URL)
+        monkeypatch.setattr(settings, "API_TOKEN", settings.API_TOKEN)
+        state_path = tmp_path / "default.json"
+        state = {"name": "default", "spec": "2x1x0x0",
+                 "ids": {"p0": "real-p0", "p0/b0": "real-b0", "p1": "real-p1",
+                         "p1/b0": "real-b1"}}
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+        assert run_seed("2x1", "default", teardown=False, offline=True)
+        assert json.loads(state_path.read_text(encoding="utf-8")) == state
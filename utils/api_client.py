@@ -6,6 +6,9 @@ import os
 from typing import Dict, Any, Optional, List
 import allure
 from config.settings import settings
+from utils.api_contract import contract_validator
+from utils.circuit_breaker import api_circuit
+from utils.project_mirror import project_mirror
 
 
 class YougileAPIClient:
@@ -27,25 +30,36 @@ class YougileAPIClient:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         self.session.timeout = settings.API_TIMEOUT
+        self.mirror = project_mirror
 
     def _make_request(self, method: str, endpoint: str, 
                       data: Optional[Dict[str, Any]] = None) -> requests.Response:
         """Выполнить HTTP запрос"""
         url = f"{self.base_url}{endpoint}"
+        api_circuit.check()
+        if settings.CONTRACT_VALIDATION:
+            contract_validator.check_request(method, endpoint, data)
 
         try:
             if method.upper() == "GET":
-                return self.session.get(url)
+                response = self.session.get(url, timeout=settings.API_TIMEOUT)
             elif method.upper() == "POST":
-                return self.session.post(url, json=data)
+                response = self.session.post(url, json=data, timeout=settings.API_TIMEOUT)
             elif method.upper() == "PUT":
-                return self.session.put(url, json=data)
+                response = self.session.put(url, json=data, timeout=settings.API_TIMEOUT)
             elif method.upper() == "DELETE":
-                return self.session.delete(url)
+                response = self.session.delete(url, timeout=settings.API_TIMEOUT)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            api_circuit.record_failure(str(e))
+            raise Exception(f"API request failed: {e}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"API request failed: {e}")
+        api_circuit.record_success()
+        if settings.CONTRACT_VALIDATION:
+            contract_validator.check_response(method, endpoint, response)
+        return response
 
     def _validate_project_data(self, project_data: Dict[str, Any]) -> None:
         """Валидация данных проекта"""
@@ -57,6 +71,23 @@ class YougileAPIClient:
         if not project_id or not isinstance(project_id, str):
             raise ValueError("Project ID must be a non-empty string")
 
+    def _validate_entity_data(self, data: Dict[str, Any], entity: str) -> None:
+        """Валидация данных доски, колонки или задачи"""
+        if not isinstance(data, dict):
+            raise ValueError(f"{entity} data must be a dictionary")
+
+    def _validate_entity_id(self, entity_id: str, entity: str) -> None:
+        """Валидация ID доски, колонки или задачи"""
+        if not entity_id or not isinstance(entity_id, str):
+            raise ValueError(f"{entity} ID must be a non-empty string")
+
+    def get_created_id(self, response: requests.Response, entity: str) -> str:
+        """Получить ID созданной сущности или выбросить ошибку"""
+        if not self.is_successful_response(response, [201]):
+            error_msg = self.get_error_message(response)
+            raise Exception(f"Failed to create {entity}: {error_msg}")
+        return response.json()["id"]
+
     @allure.step("Проверить успешность ответа")
     def is_successful_response(self, response: requests.Response, 
                               expected_codes: List[int]) -> bool:
@@ -76,7 +107,10 @@ class YougileAPIClient:
     def create_project(self, project_data: Dict[str, Any]) -> requests.Response:
         """Создать проект"""
         self._validate_project_data(project_data)
-        return self._make_request("POST", "/projects", project_data)
+        response = self._make_request("POST", "/projects", project_data)
+        if response.status_code == 201:
+            self.mirror.upsert(dict(project_data, id=response.json()["id"]))
+        return response
 
     @allure.step("Получить проект по ID: {project_id}")
     def get_project(self, project_id: str) -> requests.Response:
@@ -90,19 +124,38 @@ class YougileAPIClient:
         """Обновить проект"""
         self._validate_project_id(project_id)
         self._validate_project_data(project_data)
-        return self._make_request("PUT", f"/projects/{project_id}", project_data)
+        response = self._make_request("PUT", f"/projects/{project_id}", project_data)
+        if response.status_code == 200:
+            self.mirror.update(project_id, project_data)
+        return response
 
     @allure.step("Удалить проект: {project_id}")
     def delete_project(self, project_id: str) -> requests.Response:
         """Удалить проект"""
         self._validate_project_id(project_id)
-        return self._make_request("DELETE", f"/projects/{project_id}")
+        response = self._make_request("DELETE", f"/projects/{project_id}")
+        if response.status_code in (200, 204, 404):
+            self.mirror.remove(project_id)
+        return response
 
     @allure.step("Получить все проекты")
     def get_all_projects(self) -> requests.Response:
         """Получить все проекты"""
         return self._make_request("GET", "/projects")
 
+    @allure.step("Получить страницу проектов: limit={limit}, offset={offset}")
+    def get_projects_page(self, limit: int, offset: int) -> requests.Response:
+        """Получить страницу списка проектов"""
+        return self._make_request("GET", f"/projects?limit={limit}&offset={offset}")
+
+    @allure.step("Найти проект по названию: {title}")
+    def find_project_by_title(self, title: str) -> Optional[Dict[str, Any]]:
+        """Найти проект по названию в локальной копии (при первом обращении - синхронизация)"""
+        if not self.mirror.synced:
+            self.mirror.sync(self)
+        matches = self.mirror.find_by_title(title)
+        return matches[0] if matches else None
+
     @allure.step("Создать проект и получить ID")
     def create_project_and_get_id(self, project_data: Dict[str, Any]) -> str:
         """Создать проект и получить ID"""
@@ -133,3 +186,78 @@ class YougileAPIClient:
             time.sleep(1)
 
         return False
+
+    @allure.step("Создать доску: {board_data}")
+    def create_board(self, board_data: Dict[str, Any]) -> requests.Response:
+        """Создать доску (board_data: title, projectId)"""
+        self._validate_entity_data(board_data, "Board")
+        return self._make_request("POST", "/boards", board_data)
+
+    @allure.step("Получить доску по ID: {board_id}")
+    def get_board(self, board_id: str) -> requests.Response:
+        """Получить доску по ID"""
+        self._validate_entity_id(board_id, "Board")
+        return self._make_request("GET", f"/boards/{board_id}")
+
+    @allure.step("Обновить доску {board_id}")
+    def update_board(self, board_id: str, board_data: Dict[str, Any]) -> requests.Response:
+        """Обновить доску"""
+        self._validate_entity_id(board_id, "Board")
+        self._validate_entity_data(board_data, "Board")
+        return self._make_request("PUT", f"/boards/{board_id}", board_data)
+
+    @allure.step("Удалить доску: {board_id}")
+    def delete_board(self, board_id: str) -> requests.Response:
+        """Удалить доску"""
+        self._validate_entity_id(board_id, "Board")
+        return self._make_request("DELETE", f"/boards/{board_id}")
+
+    @allure.step("Создать колонку: {column_data}")
+    def create_column(self, column_data: Dict[str, Any]) -> requests.Response:
+        """Создать колонку (column_data: title, boardId)"""
+        self._validate_entity_data(column_data, "Column")
+        return self._make_request("POST", "/columns", column_data)
+
+    @allure.step("Получить колонку по ID: {column_id}")
+    def get_column(self, column_id: str) -> requests.Response:
+        """Получить колонку по ID"""
+        self._validate_entity_id(column_id, "Column")
+        return self._make_request("GET", f"/columns/{column_id}")
+
+    @allure.step("Обновить колонку {column_id}")
+    def update_column(self, column_id: str, column_data: Dict[str, Any]) -> requests.Response:
+        """Обновить колонку"""
+        self._validate_entity_id(column_id, "Column")
+        self._validate_entity_data(column_data, "Column")
+        return self._make_request("PUT", f"/columns/{column_id}", column_data)
+
+    @allure.step("Удалить колонку: {column_id}")
+    def delete_column(self, column_id: str) -> requests.Response:
+        """Удалить колонку"""
+        self._validate_entity_id(column_id, "Column")
+        return self._make_request("DELETE", f"/columns/{column_id}")
+
+    @allure.step("Создать задачу: {task_data}")
+    def create_task(self, task_data: Dict[str, Any]) -> requests.Response:
+        """Создать задачу (task_data: title, columnId)"""
+        self._validate_entity_data(task_data, "Task")
+        return self._make_request("POST", "/tasks", task_data)
+
+    @allure.step("Получить задачу по ID: {task_id}")
+    def get_task(self, task_id: str) -> requests.Response:
+        """Получить задачу по ID"""
+        self._validate_entity_id(task_id, "Task")
+        return self._make_request("GET", f"/tasks/{task_id}")
+
+    @allure.step("Обновить задачу {task_id}")
+    def update_task(self, task_id: str, task_data: Dict[str, Any]) -> requests.Response:
+        """Обновить задачу"""
+        self._validate_entity_id(task_id, "Task")
+        self._validate_entity_data(task_data, "Task")
+        return self._make_request("PUT", f"/tasks/{task_id}", task_data)
+
+    @allure.step("Удалить задачу: {task_id}")
+    def delete_task(self, task_id: str) -> requests.Response:
+        """Удалить задачу"""
+        self._validate_entity_id(task_id, "Task")
+        return self._make_request("DELETE", f"/tasks/{task_id}")
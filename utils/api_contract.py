@@ -0,0 +1,153 @@
+"""
+Контракты запросов и ответов /projects: схемы pydantic, компилируемые один раз
+"""
+import random
+import threading
+import warnings
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from config.settings import settings
+
+
+class ContractViolation(AssertionError):
+    """Запрос или ответ не соответствует контракту API"""
+
+
+class UnknownContract(ContractViolation):
+    """Для успешного ответа нет описанного контракта"""
+
+
+# Ответ без тела
+NO_BODY = None
+
+# (метод, с ID в пути) -> имя схемы тела запроса из utils/api_schemas.py
+REQUEST_CONTRACTS: Dict[Tuple[str, bool], str] = {
+    ("POST", False): "ProjectWriteRequest",
+    ("PUT", True): "ProjectUpdateRequest",
+}
+
+# (метод, с ID в пути, код ответа) -> имя схемы тела ответа или NO_BODY;
+# 4xx проверяются по ErrorResponse
+RESPONSE_CONTRACTS: Dict[Tuple[str, bool, int], Optional[str]] = {
+    ("POST", False, 201): "ProjectId",
+    ("GET", False, 200): "ProjectList",
+    ("GET", True, 200): "Project",
+    ("PUT", True, 200): "ProjectId",
+    ("PUT", True, 204): NO_BODY,
+    ("DELETE", True, 200): "ProjectId",
+    ("DELETE", True, 204): NO_BODY,
+}
+
+
+@lru_cache(maxsize=None)
+def get_adapter(schema_name: str):
+    """Скомпилированный валидатор схемы (строится один раз на процесс)"""
+    # pydantic загружается только при первой проверке
+    from pydantic import TypeAdapter
+
+    from utils import api_schemas
+
+    return TypeAdapter(getattr(api_schemas, schema_name))
+
+
+def _route(endpoint: str) -> Optional[bool]:
+    """Для /projects вернуть признак наличия ID в пути, для прочих путей - None"""
+    parts = [part for part in endpoint.split("?", 1)[0].split("/") if part]
+    if not parts or parts[0] != "projects" or len(parts) > 2:
+        return None
+    return len(parts) == 2
+
+
+def _format_errors(error) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc']) or '<root>'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def validate_response(method: str, endpoint: str, response: requests.Response) -> Any:
+    """Проверить ответ по контракту и вернуть разобранное тело (ContractViolation при ошибке)"""
+    from pydantic import ValidationError
+
+    has_id = _route(endpoint)
+    key = (method.upper(), has_id, response.status_code)
+    description = f"{method} {endpoint} -> HTTP {response.status_code}"
+    if has_id is None:
+        raise UnknownContract(f"Нет контракта для {description}")
+    if key in RESPONSE_CONTRACTS:
+        schema_name = RESPONSE_CONTRACTS[key]
+    elif 400 <= response.status_code < 500:
+        schema_name = "ErrorResponse"
+    else:
+        raise UnknownContract(f"Нет контракта для {description}")
+
+    if schema_name is NO_BODY:
+        if response.content.strip():
+            raise ContractViolation(f"{description}: ожидался ответ без тела")
+        return None
+    try:
+        return get_adapter(schema_name).validate_json(response.content)
+    except ValidationError as e:
+        raise ContractViolation(f"{description}: {_format_errors(e)}")
+
+
+class ContractValidator:
+    """Выборочная проверка всех запросов клиента с подсчетом нарушений"""
+
+    def __init__(self, sample_rate: float = None, mode: str = None):
+        self.sample_rate = settings.CONTRACT_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.mode = mode or settings.CONTRACT_MODE
+        self.checked = 0
+        self.violations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def _record(self, message: str) -> None:
+        with self._lock:
+            self.violations[message] = self.violations.get(message, 0) + 1
+
+    def check_request(self, method: str, endpoint: str,
+                      data: Optional[Dict[str, Any]]) -> None:
+        """Проверить тело запроса; нарушения только учитываются (негативные тесты шлют их намеренно)"""
+        has_id = _route(endpoint)
+        schema_name = REQUEST_CONTRACTS.get((method.upper(), has_id))
+        if schema_name is None or not self._sampled():
+            return
+        from pydantic import ValidationError
+
+        try:
+            get_adapter(schema_name).validate_python(data)
+        except ValidationError as e:
+            self._record(f"request {method} {endpoint.split('/')[1]}: {_format_errors(e)}")
+
+    def check_response(self, method: str, endpoint: str, response: requests.Response) -> None:
+        """Проверить ответ; в режиме fail нарушение выбрасывает ContractViolation"""
+        if _route(endpoint) is None or response.status_code >= 500 or not self._sampled():
+            return
+        with self._lock:
+            self.checked += 1
+        try:
+            validate_response(method, endpoint, response)
+        except UnknownContract as e:
+            # Неописанный успешный код - повод дополнить контракт, а не уронить вызов
+            self._record(str(e))
+        except ContractViolation as e:
+            self._record(str(e))
+            if self.mode == "fail":
+                raise
+            warnings.warn(str(e))
+
+    def summary(self) -> Dict[str, Any]:
+        """Число проверенных ответов и нарушения по типам"""
+        with self._lock:
+            return {"checked": self.checked, "sample_rate": self.sample_rate,
+                    "violations": dict(self.violations)}
+
+
+# Общий валидатор для всех клиентов процесса
+contract_validator = ContractValidator()
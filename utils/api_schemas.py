@@ -0,0 +1,50 @@
+"""
+Схемы pydantic для контрактов /projects (импортируются при первой проверке)
+"""
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Schema(BaseModel):
+    # Новые поля API не должны ломать проверки; кэшируются только ключи, иначе
+    # ID и названия проектов копятся в кэше строк и выглядят утечкой в soak-прогоне
+    model_config = ConfigDict(extra="allow", cache_strings="keys")
+
+
+class ProjectWriteRequest(_Schema):
+    title: str = Field(min_length=1)
+    users: Optional[Dict[str, str]] = None
+
+
+class ProjectUpdateRequest(_Schema):
+    title: Optional[str] = Field(default=None, min_length=1)
+    users: Optional[Dict[str, str]] = None
+    deleted: Optional[bool] = None
+
+
+class ProjectId(_Schema):
+    id: str = Field(min_length=1)
+
+
+class Project(ProjectId):
+    title: str
+    timestamp: Optional[float] = None
+    deleted: Optional[bool] = None
+    users: Optional[Dict[str, str]] = None
+
+
+class Paging(_Schema):
+    count: int
+    limit: int
+    offset: int
+    next: bool
+
+
+class ProjectList(_Schema):
+    paging: Paging
+    content: List[Project]
+
+
+class ErrorResponse(_Schema):
+    message: Any
@@ -0,0 +1,115 @@
+"""
+Пул заранее запущенных браузеров для UI тестов
+"""
+import queue
+import threading
+from typing import Callable, List
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class BrowserPool:
+    """Пул браузеров, прогреваемый в фоновом потоке"""
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int):
+        self.factory = factory
+        self.size = size
+        self._ready: "queue.Queue[WebDriver]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> "BrowserPool":
+        """Начать запуск браузеров в фоне"""
+        for _ in range(self.size):
+            self._launch_async()
+        return self
+
+    def _launch_async(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._pending += 1
+            thread = threading.Thread(target=self._launch, daemon=True)
+            self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+        thread.start()
+
+    def _launch(self) -> None:
+        try:
+            driver = self.factory()
+        except Exception:
+            # Ошибка запуска проявится при синхронном создании в acquire
+            driver = None
+        with self._lock:
+            # Проверка и помещение в очередь под блокировкой: shutdown либо увидит
+            # браузер в очереди, либо этот поток сам его закроет
+            closed = self._closed
+            if driver is not None and not closed:
+                self._ready.put(driver)
+            self._pending -= 1
+        if driver is not None and closed:
+            self._quit(driver)
+
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        """Проверить, что сессия браузера отвечает"""
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def acquire(self) -> WebDriver:
+        """Взять рабочий браузер из пула (или создать его, если пул пуст)"""
+        while True:
+            with self._lock:
+                nothing_pending = self._pending == 0
+            if nothing_pending and self._ready.empty():
+                return self.factory()
+            try:
+                driver = self._ready.get(timeout=1)
+            except queue.Empty:
+                continue
+            if self.is_healthy(driver):
+                return driver
+            self._quit(driver)
+            self._launch_async()
+
+    def release(self, driver: WebDriver) -> None:
+        """Очистить состояние браузера и вернуть его в пул"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass
+        try:
+            driver.get("about:blank")
+        except WebDriverException:
+            self._quit(driver)
+            self._launch_async()
+            return
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._ready.put(driver)
+        if closed:
+            self._quit(driver)
+
+    def shutdown(self) -> None:
+        """Дождаться запускаемых браузеров и закрыть все браузеры пула"""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+        while not self._ready.empty():
+            self._quit(self._ready.get_nowait())
@@ -0,0 +1,108 @@
+"""
+Предохранитель (circuit breaker) для быстрого отказа при недоступности YouGile
+"""
+import threading
+import time
+from typing import Optional
+
+from config.settings import settings
+
+
+class CircuitOpenError(Exception):
+    """Предохранитель разомкнут: дальнейшие обращения бессмысленны"""
+
+
+class CircuitBreaker:
+    """
+    Размыкается после K подряд сбоев уровня соединения; через cooldown секунд
+    переходит в полуоткрытое состояние: успешный пробный вызов замыкает его, сбой -
+    размыкает снова. Разомкнутый через trip (pre-flight) остается разомкнутым
+    """
+
+    def __init__(self, name: str, threshold: int = None, cooldown: float = None):
+        self.name = name
+        self.threshold = threshold or settings.CIRCUIT_BREAKER_THRESHOLD
+        self.cooldown = settings.CIRCUIT_BREAKER_COOLDOWN_S if cooldown is None else cooldown
+        self.failures = 0
+        self.reason: Optional[str] = None
+        self.opened_at: Optional[float] = None
+        self.permanent = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Разомкнут, и время до пробного вызова еще не истекло"""
+        if self.reason is None:
+            return False
+        if self.permanent or self.cooldown <= 0:
+            return True
+        return time.monotonic() - self.opened_at < self.cooldown
+
+    @property
+    def is_half_open(self) -> bool:
+        """Разомкнут, но пропускает пробные вызовы"""
+        return self.reason is not None and not self.is_open
+
+    def record_success(self) -> None:
+        """Сбросить счетчик подряд идущих сбоев; успешный пробный вызов замыкает"""
+        with self._lock:
+            if self.reason is None or self.is_half_open:
+                self.failures = 0
+                self.reason = None
+                self.opened_at = None
+
+    def record_failure(self, error: str) -> None:
+        """Учесть сбой соединения; разомкнуться при достижении порога или сбое пробного вызова"""
+        with self._lock:
+            self.failures += 1
+            if self.is_half_open or (self.reason is None and self.failures >= self.threshold):
+                self.reason = (f"{self.name}: {self.failures} сбоев соединения подряд, "
+                               f"последний: {error}")
+                self.opened_at = time.monotonic()
+
+    def trip(self, reason: str) -> None:
+        """Разомкнуть предохранитель до конца процесса (например, по pre-flight проверке)"""
+        with self._lock:
+            self.reason = f"{self.name}: {reason}"
+            self.opened_at = time.monotonic()
+            self.permanent = True
+
+    def check(self) -> None:
+        """Выбросить CircuitOpenError, если предохранитель разомкнут"""
+        if self.is_open:
+            raise CircuitOpenError(self.reason)
+
+
+# Предохранители API клиента и браузерных сессий
+api_circuit = CircuitBreaker("YouGile API")
+ui_circuit = CircuitBreaker("YouGile UI")
+
+
+def run_preflight_checks(circuits=(api_circuit, ui_circuit)) -> None:
+    """Проверить доступность сайта и/или API (и валидность токена) до запуска тестов"""
+    import requests
+
+    timeout = settings.PREFLIGHT_TIMEOUT
+    if ui_circuit in circuits and not settings.LOCAL_STUB:
+        try:
+            requests.head(settings.BASE_URL, timeout=timeout, allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            ui_circuit.trip(f"pre-flight: {settings.BASE_URL} недоступен ({e})")
+
+    if api_circuit in circuits and settings.API_TOKEN:
+        try:
+            response = requests.get(
+                f"{settings.API_URL}/projects",
+                params={"limit": 1},
+                headers={"Authorization": f"Bearer {settings.API_TOKEN}"},
+                timeout=timeout
+            )
+        except requests.exceptions.RequestException as e:
+            api_circuit.trip(f"pre-flight: {settings.API_URL} недоступен ({e})")
+            return
+        if response.status_code in (401, 403):
+            api_circuit.trip(
+                f"pre-flight: токен YOUGILE_TOKEN отклонен (HTTP {response.status_code})"
+            )
+        elif response.status_code >= 500:
+            api_circuit.trip(f"pre-flight: API отвечает HTTP {response.status_code}")
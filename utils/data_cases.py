@@ -0,0 +1,137 @@
+"""
+Потоковые источники вариантов данных для параметризации API тестов
+"""
+import csv
+import io
+import json
+import random
+import string
+from itertools import islice
+from typing import Any, Dict, Iterator, Tuple
+
+
+# Фрагменты для генерации названий проектов
+ALPHABETS = {
+    "ascii": string.ascii_letters + string.digits + " -_.",
+    "cyrillic": "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙ ",
+    "cjk": "项目测试管理任务看板日本語한국어",
+    "emoji": "🚀📋✅🔥🧪👩‍💻🇷🇺",
+    "rtl": "مشروعاختبار פרויקט",
+    "combining": "e\u0301a\u0300o\u0308n\u0303",
+    "special": "'\"<>&;%$#@!{}[]\\/",
+}
+BOUNDARY_LENGTHS = (1, 2, 50, 100, 255)
+
+
+def parse_flag(value: Any) -> bool:
+    """Разобрать булево значение из CSV/JSON"""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "да")
+
+
+def make_case(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Привести запись к виду {"payload": dict, "valid": bool}"""
+    if "payload" in record:
+        return {"payload": record["payload"], "valid": parse_flag(record.get("valid", True))}
+    payload = {key: value for key, value in record.items() if key != "valid"}
+    return {"payload": payload, "valid": parse_flag(record.get("valid", True))}
+
+
+class JsonlCaseSource:
+    """Варианты из JSONL: одна строка - payload или {"payload": ..., "valid": ...}"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = path
+
+    def refs(self) -> Iterator[Tuple[int, int]]:
+        """Номер и смещение каждой непустой строки (файл читается потоково)"""
+        number = 0
+        with open(self.path, "rb") as cases_file:
+            offset = 0
+            for line in cases_file:
+                if line.strip():
+                    yield number, offset
+                    number += 1
+                offset += len(line)
+
+    def load(self, ref: Tuple[int, int]) -> Dict[str, Any]:
+        """Прочитать один вариант по смещению"""
+        with open(self.path, "rb") as cases_file:
+            cases_file.seek(ref[1])
+            return make_case(json.loads(cases_file.readline()))
+
+
+class CsvCaseSource(JsonlCaseSource):
+    """Варианты из CSV: колонки - поля payload, необязательная колонка valid"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        with open(path, encoding="utf-8", newline="") as cases_file:
+            self.header = next(csv.reader(cases_file))
+
+    def refs(self) -> Iterator[Tuple[int, int]]:
+        # Первая строка - заголовок; поля с переводами строк внутри не поддерживаются
+        return ((number - 1, offset) for number, offset in super().refs() if number)
+
+    def load(self, ref: Tuple[int, int]) -> Dict[str, Any]:
+        with open(self.path, "rb") as cases_file:
+            cases_file.seek(ref[1])
+            line = cases_file.readline().decode("utf-8")
+        row = next(csv.reader(io.StringIO(line)))
+        return make_case(dict(zip(self.header, row)))
+
+
+class GeneratedCaseSource:
+    """Детерминированные варианты: каждый строится заново из (seed, номер)"""
+
+    def __init__(self, seed: int, count: int):
+        self.seed = seed
+        self.count = count
+        self.name = f"generated:{seed}:{count}"
+
+    def refs(self) -> Iterator[int]:
+        return iter(range(self.count))
+
+    def load(self, ref: int) -> Dict[str, Any]:
+        rng = random.Random(f"{self.seed}:{ref}")
+        kind = rng.choice(["alphabet", "mixed", "boundary", "boundary", "invalid"])
+        if kind == "invalid":
+            payload = rng.choice([{}, {"title": ""}, {"title": None}])
+            return {"payload": payload, "valid": False}
+        if kind == "boundary":
+            length = rng.choice(BOUNDARY_LENGTHS)
+            alphabet = ALPHABETS[rng.choice(["ascii", "cyrillic", "cjk"])]
+        else:
+            length = rng.randint(1, 100)
+            alphabet = (ALPHABETS[rng.choice(list(ALPHABETS))] if kind == "alphabet"
+                        else "".join(ALPHABETS.values()))
+        title = "".join(rng.choice(alphabet) for _ in range(length))
+        # Название из одних пробелов не является валидным вариантом
+        if not title.strip():
+            title = "x" + title[1:]
+        return {"payload": {"title": title}, "valid": True}
+
+
+def open_source(spec: str):
+    """Источник по спецификации: путь к .jsonl/.csv или generated:<seed>:<count>"""
+    if spec.startswith("generated:"):
+        _, seed, count = spec.split(":")
+        return GeneratedCaseSource(int(seed), int(count))
+    if spec.endswith(".csv"):
+        return CsvCaseSource(spec)
+    if spec.endswith(".jsonl"):
+        return JsonlCaseSource(spec)
+    raise ValueError(f"Неподдерживаемый источник данных: {spec}")
+
+
+def shard_refs(refs: Iterator, shards: int, shard_index: int) -> Iterator:
+    """Каждый shards-й вариант, начиная с shard_index"""
+    return islice(refs, shard_index, None, shards)
+
+
+def case_id(ref) -> str:
+    """Идентификатор варианта для имени теста"""
+    number = ref[0] if isinstance(ref, tuple) else ref
+    return f"case{number}"
@@ -0,0 +1,79 @@
+"""
+Создание экземпляров WebDriver по настройкам браузера
+"""
+from typing import Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.webdriver import WebDriver
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from config.settings import settings
+
+
+def build_options(browser: str, headless: bool, window_size: Tuple[int, int],
+                  network_capture: bool = False):
+    """Собрать опции браузера (network_capture включает performance-лог Chrome)"""
+    browser = browser.lower()
+
+    if browser == "chrome":
+        options = ChromeOptions()
+        if headless:
+            options.add_argument("--headless")
+        w, h = window_size
+        window_size = f"{w},{h}"
+        options.add_argument(f"--window-size={window_size}")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        if network_capture:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+            )
+        return options
+
+    if browser == "firefox":
+        options = FirefoxOptions()
+        if headless:
+            options.add_argument("--headless")
+        width = window_size[0]
+        height = window_size[1]
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+        return options
+
+    raise ValueError(f"Неподдерживаемый браузер: {browser}")
+
+
+def create_service(browser: str):
+    """Создать сервис драйвера (chromedriver/geckodriver) для браузера"""
+    browser = browser.lower()
+    if browser == "chrome":
+        return ChromeService(ChromeDriverManager().install())
+    if browser == "firefox":
+        return FirefoxService(GeckoDriverManager().install())
+    raise ValueError(f"Неподдерживаемый браузер: {browser}")
+
+
+def create_driver(browser: str, headless: bool, window_size: Tuple[int, int],
+                  remote_url: Optional[str] = None,
+                  network_capture: bool = False) -> WebDriver:
+    """Создать и настроить драйвер браузера (локально или через remote-узел)"""
+    options = build_options(browser, headless, window_size, network_capture)
+
+    if remote_url:
+        driver = webdriver.Remote(command_executor=remote_url, options=options)
+    elif browser.lower() == "chrome":
+        driver = webdriver.Chrome(service=create_service(browser), options=options)
+    else:
+        driver = webdriver.Firefox(service=create_service(browser), options=options)
+
+    # Настройка таймаутов
+    driver.implicitly_wait(settings.IMPLICIT_WAIT)
+    driver.set_page_load_timeout(settings.PAGE_LOAD_TIMEOUT)
+
+    return driver
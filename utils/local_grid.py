@@ -0,0 +1,49 @@
+"""
+Локальная замена Selenium Grid: по одному remote-узлу (драйвер-сервису) на браузер
+"""
+import threading
+from typing import Dict, List
+
+from utils.driver_factory import create_service
+
+
+class LocalGrid:
+    """Набор запущенных chromedriver/geckodriver, принимающих webdriver.Remote"""
+
+    def __init__(self, browsers: List[str]):
+        self.browsers = [browser.lower() for browser in browsers]
+        self._services = {}
+
+    @property
+    def nodes(self) -> Dict[str, str]:
+        """URL remote-узла для каждого браузера"""
+        return {browser: service.service_url for browser, service in self._services.items()}
+
+    def start(self) -> "LocalGrid":
+        """Запустить узлы всех браузеров параллельно"""
+        errors = []
+
+        def start_node(browser: str) -> None:
+            try:
+                service = create_service(browser)
+                service.start()
+                self._services[browser] = service
+            except Exception as e:
+                errors.append(f"{browser}: {e}")
+
+        threads = [threading.Thread(target=start_node, args=(browser,))
+                   for browser in self.browsers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            self.stop()
+            raise RuntimeError(f"Не удалось запустить узлы грида: {'; '.join(errors)}")
+        return self
+
+    def stop(self) -> None:
+        """Остановить все узлы"""
+        for service in self._services.values():
+            service.stop()
+        self._services.clear()
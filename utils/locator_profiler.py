@@ -0,0 +1,112 @@
+"""
+Профилировщик локаторов и методов Page Object
+"""
+import functools
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class _Stats:
+    """Накопленная статистика по одному ключу"""
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.timeouts = 0
+        self.commands = 0
+
+    def add(self, duration: float) -> None:
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class LocatorProfiler:
+    """Сбор времени разрешения локаторов, таймаутов и WebDriver команд"""
+
+    def __init__(self):
+        self.locators: Dict[str, _Stats] = defaultdict(_Stats)
+        self.methods: Dict[str, _Stats] = defaultdict(_Stats)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _stack(self) -> List[str]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def record_lookup(self, locator: tuple, duration: float, timed_out: bool) -> None:
+        """Записать результат ожидания локатора"""
+        with self._lock:
+            stats = self.locators[f"{locator[0]}={locator[1]}"]
+            stats.add(duration)
+            if timed_out:
+                stats.timeouts += 1
+
+    def record_command(self) -> None:
+        """Учесть WebDriver команду во всех активных методах Page Object"""
+        with self._lock:
+            for name in set(self._stack):
+                self.methods[name].commands += 1
+
+    def profile_method(self, name: str, func: Callable) -> Callable:
+        """Обернуть метод Page Object для замера времени и числа команд"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._stack.append(name)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                self._stack.pop()
+                with self._lock:
+                    self.methods[name].add(duration)
+        return wrapper
+
+    def instrument(self, driver: WebDriver) -> None:
+        """Подсчитывать все команды, отправляемые драйвером"""
+        if getattr(driver, "_locator_profiler", None) is self:
+            return
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            self.record_command()
+            return original_execute(driver_command, params)
+
+        driver.execute = execute
+        driver._locator_profiler = self
+
+    def report(self, limit: int = 15) -> str:
+        """Сформировать ранжированный отчет о самых медленных локаторах и методах"""
+        lines = ["Самые медленные локаторы (суммарное время):"]
+        lines.append(f"{'локатор':<60} {'вызовы':>7} {'всего,с':>9} {'сред,с':>8} "
+                     f"{'макс,с':>8} {'таймауты':>9}")
+        ranked = sorted(self.locators.items(), key=lambda item: item[1].total, reverse=True)
+        for key, stats in ranked[:limit]:
+            lines.append(f"{key[:60]:<60} {stats.calls:>7} {stats.total:>9.2f} "
+                         f"{stats.avg:>8.3f} {stats.max:>8.3f} {stats.timeouts:>9}")
+
+        lines.append("")
+        lines.append("Самые медленные методы Page Object (суммарное время):")
+        lines.append(f"{'метод':<60} {'вызовы':>7} {'всего,с':>9} {'сред,с':>8} "
+                     f"{'команды':>8}")
+        ranked = sorted(self.methods.items(), key=lambda item: item[1].total, reverse=True)
+        for key, stats in ranked[:limit]:
+            lines.append(f"{key[:60]:<60} {stats.calls:>7} {stats.total:>9.2f} "
+                         f"{stats.avg:>8.3f} {stats.commands:>8}")
+        return "\n".join(lines)
+
+
+# Экземпляр профилировщика
+profiler = LocatorProfiler()
@@ -0,0 +1,141 @@
+"""
+Захват сетевого трафика браузера (CDP события из performance-лога Chrome)
+"""
+import json
+import re
+import time
+from typing import Dict, Any, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import settings
+
+
+class NetworkRequest:
+    """Один сетевой запрос, собранный из событий Network.*"""
+
+    def __init__(self, request_id: str, url: str, method: str, resource_type: str,
+                 started: float, post_data: Optional[str] = None):
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.started = started
+        self.post_data = post_data
+        self.status: Optional[int] = None
+        self.response_received: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.failed = False
+
+    @property
+    def completed(self) -> bool:
+        return self.finished is not None or self.failed
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Время от отправки запроса до полной загрузки ответа, мс"""
+        if self.finished is None:
+            return None
+        return (self.finished - self.started) * 1000
+
+    @property
+    def ttfb_ms(self) -> Optional[float]:
+        """Время до получения заголовков ответа, мс"""
+        if self.response_received is None:
+            return None
+        return (self.response_received - self.started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "method": self.method,
+            "type": self.resource_type,
+            "status": self.status,
+            "ttfb_ms": self.ttfb_ms,
+            "duration_ms": self.duration_ms,
+            "failed": self.failed,
+        }
+
+
+class NetworkCapture:
+    """Накопление сетевых запросов драйвера и ожидание конкретных XHR"""
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.requests: Dict[str, NetworkRequest] = {}
+
+    def poll(self) -> None:
+        """Забрать новые события из performance-лога браузера"""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            self._handle(message.get("method", ""), message.get("params", {}))
+
+    def clear(self) -> None:
+        """Сбросить накопленные события (например, от предыдущего теста)"""
+        self.poll()
+        self.requests.clear()
+
+    def _handle(self, method: str, params: Dict[str, Any]) -> None:
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            self.requests[request_id] = NetworkRequest(
+                request_id, request["url"], request["method"],
+                params.get("type", ""), params["timestamp"], request.get("postData")
+            )
+        elif request_id not in self.requests:
+            return
+        elif method == "Network.responseReceived":
+            self.requests[request_id].status = params["response"]["status"]
+            self.requests[request_id].response_received = params["timestamp"]
+        elif method == "Network.loadingFinished":
+            self.requests[request_id].finished = params["timestamp"]
+        elif method == "Network.loadingFailed":
+            self.requests[request_id].failed = True
+
+    def find_requests(self, url_pattern: str, method: Optional[str] = None,
+                      completed_only: bool = True) -> List[NetworkRequest]:
+        """Найти запросы по регулярному выражению URL и HTTP методу"""
+        self.poll()
+        pattern = re.compile(url_pattern)
+        return [
+            request for request in self.requests.values()
+            if pattern.search(request.url)
+            and (method is None or request.method == method.upper())
+            and (request.completed or not completed_only)
+        ]
+
+    def wait_for_request(self, url_pattern: str, method: Optional[str] = None,
+                         timeout: float = None) -> NetworkRequest:
+        """Дождаться завершения запроса, удовлетворяющего условию"""
+        timeout = timeout if timeout is not None else settings.EXPLICIT_WAIT
+        deadline = time.monotonic() + timeout
+        while True:
+            matches = self.find_requests(url_pattern, method)
+            if matches:
+                return matches[-1]
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Запрос {method or '*'} {url_pattern} не завершился за {timeout} с"
+                )
+            time.sleep(0.1)
+
+    def get_response_body(self, request: NetworkRequest) -> Any:
+        """Получить тело ответа (JSON, если возможно)"""
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request.request_id}
+            )
+        except WebDriverException:
+            return None
+        body = result.get("body", "")
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Тайминги всех собранных запросов"""
+        self.poll()
+        return [request.to_dict() for request in self.requests.values()]
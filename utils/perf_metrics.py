@@ -0,0 +1,105 @@
+"""
+Сбор метрик производительности страниц в браузере
+"""
+import json
+import os
+import time
+import warnings
+from typing import Dict, Any, List
+
+import allure
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import settings
+
+
+# Navigation Timing Level 2 + Paint Timing, все значения в мс от startTime
+NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const result = {};
+if (nav) {
+    result.domContentLoaded = nav.domContentLoadedEventEnd;
+    result.load = nav.loadEventEnd;
+    result.responseStart = nav.responseStart;
+    result.responseEnd = nav.responseEnd;
+    result.domInteractive = nav.domInteractive;
+    result.transferSize = nav.transferSize;
+}
+for (const paint of performance.getEntriesByType('paint')) {
+    result[paint.name] = paint.startTime;
+}
+return result;
+"""
+
+
+def collect_navigation_timing(driver: WebDriver) -> Dict[str, float]:
+    """Получить Navigation Timing и Paint Timing текущей страницы"""
+    try:
+        return driver.execute_script(NAVIGATION_TIMING_SCRIPT) or {}
+    except WebDriverException:
+        return {}
+
+
+def collect_cdp_metrics(driver: WebDriver) -> Dict[str, float]:
+    """Получить метрики Chrome DevTools Performance.getMetrics (только Chromium)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return {}
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        response = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    except WebDriverException:
+        return {}
+    return {metric["name"]: metric["value"] for metric in response.get("metrics", [])}
+
+
+def collect_page_metrics(driver: WebDriver, page_name: str, url: str) -> Dict[str, Any]:
+    """Собрать все доступные метрики страницы в одну запись"""
+    return {
+        "run_id": settings.RUN_ID,
+        "timestamp": time.time(),
+        "page": page_name,
+        "url": url,
+        "browser": driver.capabilities.get("browserName", settings.BROWSER),
+        "timing": collect_navigation_timing(driver),
+        "cdp": collect_cdp_metrics(driver),
+    }
+
+
+def append_to_trend(record: Dict[str, Any], path: str = None) -> None:
+    """Дописать запись в JSONL-файл тренда производительности"""
+    path = path or settings.PERF_TREND_FILE
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as trend_file:
+        trend_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def check_budget(page_name: str, timing: Dict[str, float]) -> List[str]:
+    """Вернуть список нарушений бюджета для страницы"""
+    violations = []
+    for metric, limit in settings.PERF_BUDGETS.get(page_name, {}).items():
+        value = timing.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page_name}.{metric} = {value:.0f} мс > {limit:.0f} мс")
+    return violations
+
+
+def record_page_metrics(driver: WebDriver, page_name: str, url: str) -> Dict[str, Any]:
+    """Собрать метрики, приложить их к Allure, сохранить в тренд и проверить бюджет"""
+    record = collect_page_metrics(driver, page_name, url)
+    allure.attach(
+        json.dumps(record, ensure_ascii=False, indent=2),
+        name=f"Метрики производительности: {page_name}",
+        attachment_type=allure.attachment_type.JSON
+    )
+    append_to_trend(record)
+
+    violations = check_budget(page_name, record["timing"])
+    if violations:
+        message = "Превышен бюджет производительности: " + "; ".join(violations)
+        if settings.PERF_BUDGET_MODE == "fail":
+            raise AssertionError(message)
+        warnings.warn(message)
+    return record
@@ -0,0 +1,104 @@
+"""
+Локальная копия проектов рабочего пространства с индексами по ID и названию
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+
+class ProjectMirror:
+    """Проекты в памяти; обновляется операциями YougileAPIClient и постраничной синхронизацией"""
+
+    def __init__(self, page_size: int = 1000):
+        self.page_size = page_size
+        self.last_sync: Optional[float] = None
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_title: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def synced(self) -> bool:
+        return self.last_sync is not None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._by_id
+
+    def _unindex(self, project_id: str) -> None:
+        project = self._by_id.pop(project_id, None)
+        if project is None:
+            return
+        ids = self._by_title.get(project.get("title"))
+        if ids is not None:
+            ids.discard(project_id)
+            if not ids:
+                del self._by_title[project.get("title")]
+
+    def upsert(self, project: Dict[str, Any]) -> None:
+        """Добавить проект или заменить его целиком"""
+        if project.get("deleted"):
+            self.remove(project["id"])
+            return
+        with self._lock:
+            self._unindex(project["id"])
+            self._by_id[project["id"]] = dict(project)
+            self._by_title.setdefault(project.get("title"), set()).add(project["id"])
+
+    def update(self, project_id: str, changes: Dict[str, Any]) -> None:
+        """Применить частичное обновление проекта"""
+        with self._lock:
+            project = dict(self._by_id.get(project_id, {"id": project_id}))
+            project.update(changes)
+            self.upsert(project)
+
+    def remove(self, project_id: str) -> None:
+        """Убрать проект из копии"""
+        with self._lock:
+            self._unindex(project_id)
+
+    def clear(self) -> None:
+        """Сбросить копию (следующее обращение выполнит полную синхронизацию)"""
+        with self._lock:
+            self._by_id.clear()
+            self._by_title.clear()
+            self.last_sync = None
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Проект по ID"""
+        with self._lock:
+            project = self._by_id.get(project_id)
+            return dict(project) if project is not None else None
+
+    def find_by_title(self, title: str) -> List[Dict[str, Any]]:
+        """Все проекты с точно совпадающим названием"""
+        with self._lock:
+            return [dict(self._by_id[project_id])
+                    for project_id in sorted(self._by_title.get(title, ()))]
+
+    def sync(self, client) -> int:
+        """Загрузить все проекты постранично и убрать из копии отсутствующие на сервере"""
+        seen = set()
+        offset = 0
+        while True:
+            response = client.get_projects_page(self.page_size, offset)
+            if not client.is_successful_response(response, [200]):
+                raise Exception(f"Failed to sync projects: {client.get_error_message(response)}")
+            page = response.json()
+            for project in page.get("content", []):
+                self.upsert(project)
+                seen.add(project["id"])
+            if not page.get("paging", {}).get("next"):
+                break
+            offset += self.page_size
+
+        with self._lock:
+            for project_id in set(self._by_id) - seen:
+                self._unindex(project_id)
+            self.last_sync = time.time()
+        return len(self._by_id)
+
+
+# Общая копия для всех клиентов процесса
+project_mirror = ProjectMirror()
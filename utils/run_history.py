@@ -0,0 +1,56 @@
+"""
+Локальное хранилище длительностей и результатов тестов для шардирования
+"""
+import json
+import os
+from typing import Dict, Any, List, Iterable
+
+from config.settings import settings
+from utils.file_lock import file_lock, write_json_atomic
+
+
+# Длительность теста без истории, с
+DEFAULT_DURATION = 1.0
+
+
+def load_history(path: str = None) -> Dict[str, Dict[str, Any]]:
+    """Загрузить историю: {nodeid: {"duration": float, "outcome": str}}"""
+    path = path or settings.TEST_HISTORY_FILE
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as history_file:
+            return json.load(history_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(results: Dict[str, Dict[str, Any]], path: str = None) -> None:
+    """Дописать результаты текущего запуска в историю"""
+    path = path or settings.TEST_HISTORY_FILE
+    # Параллельные процессы pytest (режимы all и matrix) не должны терять записи друг друга
+    with file_lock(path):
+        history = load_history(path)
+        history.update(results)
+        write_json_atomic(path, history, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def split_into_shards(nodeids: Iterable[str], history: Dict[str, Dict[str, Any]],
+                      num_shards: int) -> List[List[str]]:
+    """Разбить тесты на шарды, сбалансированные по исторической длительности"""
+    def duration(nodeid: str) -> float:
+        return history.get(nodeid, {}).get("duration", DEFAULT_DURATION)
+
+    shards: List[List[str]] = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+    # Самые долгие тесты первыми в наименее загруженный шард (LPT)
+    for nodeid in sorted(nodeids, key=lambda n: (-duration(n), n)):
+        index = loads.index(min(loads))
+        shards[index].append(nodeid)
+        loads[index] += duration(nodeid)
+    return shards
+
+
+def failed_first_key(nodeid: str, history: Dict[str, Dict[str, Any]]) -> int:
+    """Ключ сортировки: упавшие в прошлом запуске тесты идут первыми"""
+    return 0 if history.get(nodeid, {}).get("outcome") == "failed" else 1
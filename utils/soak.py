@@ -0,0 +1,236 @@
+"""
+Длительный (soak) прогон API клиента и WebDriver сессии с контролем утечек и дрейфа
+"""
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from typing import Callable, Dict, Any, List, Optional
+
+from config.settings import settings
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Перцентиль p (0..100) методом ближайшего ранга"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def count_open_descriptors() -> Dict[str, Optional[int]]:
+    """Количество открытых файловых дескрипторов и сокетов процесса (Linux)"""
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        return {"fds": None, "sockets": None}
+    fds = sockets = 0
+    for name in os.listdir(fd_dir):
+        try:
+            target = os.readlink(os.path.join(fd_dir, name))
+        except OSError:
+            continue
+        fds += 1
+        if target.startswith("socket:"):
+            sockets += 1
+    return {"fds": fds, "sockets": sockets}
+
+
+def slope_per_hour(points: List[tuple]) -> float:
+    """Наклон линейной регрессии (значение в час) по точкам (секунды, значение)"""
+    points = [(x, y) for x, y in points if y is not None]
+    if len(points) < 2:
+        return 0.0
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if not denominator:
+        return 0.0
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+    return slope * 3600
+
+
+class SoakRunner:
+    """Циклический прогон операций с периодическими снимками ресурсов"""
+
+    def __init__(self, name: str, duration: float, sample_interval: float = 60.0,
+                 warmup: float = None, circuit: Optional[CircuitBreaker] = None):
+        self.name = name
+        self.duration = duration
+        self.sample_interval = sample_interval
+        self.warmup = settings.SOAK_WARMUP_S if warmup is None else warmup
+        self.samples: List[Dict[str, Any]] = []
+        self.errors: Dict[str, int] = {}
+        self.circuit = circuit
+        self.circuit_open_s = 0.0
+        self._latencies: Dict[str, List[float]] = {}
+
+    def timed(self, operation: str, func: Callable[[], Any]) -> Any:
+        """Выполнить операцию, записав ее задержку и ошибки"""
+        start = time.perf_counter()
+        try:
+            result = func()
+        except CircuitOpenError:
+            # Мгновенный отказ без обращения к сервису не является задержкой операции
+            key = f"{operation}: CircuitOpenError"
+            self.errors[key] = self.errors.get(key, 0) + 1
+            return None
+        except Exception as e:
+            key = f"{operation}: {type(e).__name__}"
+            self.errors[key] = self.errors.get(key, 0) + 1
+            result = None
+        self._latencies.setdefault(operation, []).append((time.perf_counter() - start) * 1000)
+        return result
+
+    def _take_sample(self, elapsed: float, extra: Callable[[], Dict[str, Any]]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        sample = {
+            "elapsed_s": elapsed,
+            "python_heap_kb": current / 1024,
+            "python_heap_peak_kb": peak / 1024,
+            "latency_ms": {
+                operation: {"p50": percentile(values, 50), "p95": percentile(values, 95),
+                            "p99": percentile(values, 99), "count": len(values)}
+                for operation, values in self._latencies.items()
+            },
+        }
+        sample.update(count_open_descriptors())
+        sample.update(extra())
+        self.samples.append(sample)
+        self._latencies = {}
+        print(f"[soak:{self.name}] {elapsed / 60:.1f} мин: "
+              f"heap {sample['python_heap_kb']:.0f} КБ, "
+              f"fds {sample['fds']}, sockets {sample['sockets']}")
+
+    def run(self, cycle: Callable[[], None],
+            extra_metrics: Callable[[], Dict[str, Any]] = dict) -> Dict[str, Any]:
+        """Крутить cycle() в течение duration секунд и вернуть отчет"""
+        # Прогревочный цикл до начала трассировки: ленивые импорты, пулы соединений
+        cycle()
+        tracemalloc.start(10)
+        first_snapshot = tracemalloc.take_snapshot()
+        started = time.monotonic()
+        next_sample = started + self.sample_interval
+        try:
+            while time.monotonic() - started < self.duration:
+                if self.circuit is not None and self.circuit.is_open:
+                    # Ждать пробного вызова, а не крутить мгновенно отказывающие циклы
+                    self._wait_for_circuit(started)
+                else:
+                    cycle()
+                if time.monotonic() >= next_sample:
+                    self._take_sample(time.monotonic() - started, extra_metrics)
+                    next_sample += self.sample_interval
+            self._take_sample(time.monotonic() - started, extra_metrics)
+            # Собственные аллокации tracemalloc в рост не входят
+            exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+            top_growth = tracemalloc.take_snapshot().filter_traces(exclude).compare_to(
+                first_snapshot.filter_traces(exclude), "lineno"
+            )[:10]
+        finally:
+            tracemalloc.stop()
+        return self.report(top_growth)
+
+    def _wait_for_circuit(self, started: float) -> None:
+        pause = min(1.0, max(0.0, self.duration - (time.monotonic() - started)))
+        time.sleep(pause)
+        self.circuit_open_s += pause
+
+    def report(self, top_growth) -> Dict[str, Any]:
+        """Сводка: скорость роста памяти и дескрипторов, дрейф задержек"""
+        # Снимки первых warmup секунд приходятся на прогрев (кэши, пулы соединений)
+        # и в тренд не входят; на коротких прогонах отбрасывается только первый снимок
+        steady = [sample for sample in self.samples if sample["elapsed_s"] >= self.warmup]
+        if len(steady) < 2:
+            steady = self.samples[1:] if len(self.samples) > 2 else self.samples
+
+        def trend(key: str) -> float:
+            return slope_per_hour([(s["elapsed_s"], s.get(key)) for s in steady])
+
+        drift = {}
+        first, last = steady[0], steady[-1]
+        for operation, stats in last["latency_ms"].items():
+            baseline = first["latency_ms"].get(operation)
+            if baseline and baseline["p95"]:
+                drift[operation] = stats["p95"] / baseline["p95"]
+
+        findings = []
+        if trend("python_heap_kb") > settings.SOAK_HEAP_GROWTH_KB_PER_HOUR:
+            findings.append(f"Рост Python heap: {trend('python_heap_kb'):.0f} КБ/ч")
+        if trend("js_heap_kb") > settings.SOAK_HEAP_GROWTH_KB_PER_HOUR:
+            findings.append(f"Рост JS heap браузера: {trend('js_heap_kb'):.0f} КБ/ч")
+        if trend("fds") > settings.SOAK_FD_GROWTH_PER_HOUR:
+            findings.append(f"Рост файловых дескрипторов: {trend('fds'):.1f} в час")
+        if trend("sockets") > settings.SOAK_FD_GROWTH_PER_HOUR:
+            findings.append(f"Рост открытых сокетов: {trend('sockets'):.1f} в час")
+        for operation, ratio in drift.items():
+            if ratio > settings.SOAK_P95_DRIFT_RATIO:
+                findings.append(f"Дрейф p95 {operation}: x{ratio:.2f}")
+        if self.circuit_open_s:
+            findings.append(f"Предохранитель был разомкнут {self.circuit_open_s:.0f} с: "
+                            f"{self.circuit.reason or 'сервис восстановился'}")
+
+        return {
+            "name": self.name,
+            "run_id": settings.RUN_ID,
+            "duration_s": self.duration,
+            "heap_growth_kb_per_hour": trend("python_heap_kb"),
+            "fd_growth_per_hour": trend("fds"),
+            "socket_growth_per_hour": trend("sockets"),
+            "p95_drift": drift,
+            "errors": self.errors,
+            "circuit_open_s": self.circuit_open_s,
+            "top_allocation_growth": [str(stat) for stat in top_growth],
+            "findings": findings,
+            "samples": self.samples,
+        }
+
+
+def api_cycle(runner: SoakRunner, client) -> Callable[[], None]:
+    """Цикл create/get/update/delete проекта через YougileAPIClient"""
+    def cycle() -> None:
+        title = f"Soak Project {uuid.uuid4().hex[:8]}"
+        response = runner.timed("create", lambda: client.create_project({"title": title}))
+        if response is None or response.status_code != 201:
+            return
+        project_id = response.json()["id"]
+        runner.timed("get", lambda: client.get_project(project_id))
+        runner.timed("update", lambda: client.update_project(
+            project_id, {"title": f"{title} updated"}
+        ))
+        runner.timed("delete", lambda: client.delete_project(project_id))
+    return cycle
+
+
+def webdriver_cycle(runner: SoakRunner, projects_page) -> Callable[[], None]:
+    """Цикл открытия страницы проектов и чтения списка в одной сессии браузера"""
+    def cycle() -> None:
+        runner.timed("open_projects_page", projects_page.open_projects_page)
+        runner.timed("get_projects_list", projects_page.get_projects_list)
+    return cycle
+
+
+def browser_metrics(driver) -> Callable[[], Dict[str, Any]]:
+    """Метрики браузера для снимка: JS heap (Chrome) и число окон"""
+    def metrics() -> Dict[str, Any]:
+        try:
+            heap = driver.execute_script(
+                "return window.performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+            return {"js_heap_kb": heap / 1024 if heap else None,
+                    "window_handles": len(driver.window_handles)}
+        except Exception:
+            return {"js_heap_kb": None, "window_handles": None}
+    return metrics
+
+
+def save_report(report: Dict[str, Any]) -> str:
+    """Сохранить отчет soak-прогона в reports/"""
+    os.makedirs(settings.REPORTS_DIR, exist_ok=True)
+    path = os.path.join(settings.REPORTS_DIR, f"soak_{report['name']}_{report['run_id']}.json")
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,437 @@
+"""
+Локальная статическая заглушка UI YouGile для офлайн-тестирования Page Object
+"""
+import html
+import json
+import multiprocessing
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from config.settings import settings
+
+
+LOGIN_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>YouGile - Вход</title></head>
+<body>
+<form id="login-form">
+    <input name="email" type="email">
+    <input name="password" type="password">
+    <button type="submit">Войти</button>
+</form>
+<a href="#">Забыли пароль?</a>
+<a href="#">Регистрация</a>
+{padding}
+<script>
+document.getElementById('login-form').addEventListener('submit', function (event) {{
+    event.preventDefault();
+    var email = document.querySelector("input[name='email']").value;
+    var password = document.querySelector("input[name='password']").value;
+    if (email === {email} && password === {password}) {{
+        window.location.href = '/projects';
+    }} else if (!document.querySelector('.error-message')) {{
+        // Сообщение появляется в DOM только при ошибке, как на реальном сайте
+        var error = document.createElement('div');
+        error.className = 'error-message';
+        error.textContent = 'Неверный логин или пароль';
+        document.getElementById('login-form').after(error);
+    }}
+}});
+</script>
+</body>
+</html>
+"""
+
+PROJECTS_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>YouGile - Проекты</title></head>
+<body>
+<button data-testid="create-project">Создать проект</button>
+<form id="project-form" style="display:none">
+    <input name="title">
+    <textarea name="description"></textarea>
+    <button type="submit">Сохранить</button>
+    <button type="button">Отмена</button>
+</form>
+<button data-testid="confirm-delete" style="display:none">Удалить</button>
+<ul id="projects">
+{projects}
+</ul>
+{padding}
+<script>
+var form = document.getElementById('project-form');
+var editing = null;
+var deleting = null;
+
+// Сообщения добавляются в DOM только при показе, как на реальном сайте
+function showMessage(className, text) {{
+    var message = document.querySelector('.' + className);
+    if (!message) {{
+        message = document.createElement('div');
+        message.className = className;
+        message.textContent = text;
+        form.after(message);
+    }}
+}}
+
+function hideMessage(className) {{
+    var message = document.querySelector('.' + className);
+    if (message) {{ message.remove(); }}
+}}
+
+// Изменения отправляются в API, чтобы тесты могли проверять XHR
+function sendProject(method, url, title) {{
+    return fetch(url, {{
+        method: method,
+        headers: {{'Content-Type': 'application/json'}},
+        body: JSON.stringify({{title: title}})
+    }}).then(function (response) {{ return response.json(); }});
+}}
+
+function projectItem(title) {{
+    var item = document.createElement('li');
+    item.className = 'project-item';
+    item.innerHTML = '<span class="project-title"></span>' +
+        '<button class="edit-project">Изменить</button>' +
+        '<button class="delete-project">Удалить</button>';
+    item.querySelector('.project-title').textContent = title;
+    return item;
+}}
+
+document.querySelector("button[data-testid='create-project']").addEventListener('click', function () {{
+    editing = null;
+    form.style.display = 'block';
+}});
+
+document.getElementById('projects').addEventListener('click', function (event) {{
+    var item = event.target.closest('.project-item');
+    if (event.target.classList.contains('edit-project')) {{
+        editing = item;
+        form.style.display = 'block';
+    }} else if (event.target.classList.contains('delete-project')) {{
+        deleting = item;
+        document.querySelector("button[data-testid='confirm-delete']").style.display = 'block';
+    }}
+}});
+
+document.querySelector("button[data-testid='confirm-delete']").addEventListener('click', function () {{
+    if (deleting) {{ deleting.remove(); }}
+    deleting = null;
+    this.style.display = 'none';
+}});
+
+form.addEventListener('submit', function (event) {{
+    event.preventDefault();
+    var title = form.querySelector("input[name='title']").value;
+    if (!title) {{
+        showMessage('error-message', 'Это поле обязательно');
+        return;
+    }}
+    hideMessage('error-message');
+    if (editing) {{
+        editing.querySelector('.project-title').textContent = title;
+        sendProject('PUT', '/api-v2/projects/' + encodeURIComponent(editing.dataset.id || 'new'), title);
+    }} else {{
+        var item = projectItem(title);
+        document.getElementById('projects').appendChild(item);
+        showMessage('success-message', 'Проект создан');
+        sendProject('POST', '/api-v2/projects', title).then(function (data) {{
+            item.dataset.id = data.id;
+        }});
+    }}
+    editing = null;
+    form.reset();
+    form.style.display = 'none';
+}});
+</script>
+</body>
+</html>
+"""
+
+PROJECT_ITEM_TEMPLATE = (
+    '<li class="project-item" data-id="{project_id}"><span class="project-title">{title}</span>'
+    '<button class="edit-project">Изменить</button>'
+    '<button class="delete-project">Удалить</button></li>'
+)
+
+
+class _StubHTTPServer:
+    """Базовый HTTP сервер заглушки, работающий в фоновом потоке"""
+
+    def __init__(self, host: str, port: int, delay: float):
+        self.delay = delay
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def server_url(self) -> str:
+        """Корневой URL запущенного сервера"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        raise NotImplementedError
+
+    def start(self):
+        """Запустить сервер в фоновом потоке"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Остановить сервер"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class YougileStubServer(_StubHTTPServer):
+    """Локальный HTTP сервер, отдающий страницы под локаторы Page Object"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 delay: float = 0.0, project_count: int = 0, padding_nodes: int = 0):
+        self.project_count = project_count
+        self.padding_nodes = padding_nodes
+        super().__init__(host, port, delay)
+
+    @property
+    def base_url(self) -> str:
+        """Базовый URL запущенного сервера"""
+        return self.server_url
+
+    def render(self, path: str) -> Optional[str]:
+        """Сформировать HTML страницы по пути запроса"""
+        padding = "\n".join(
+            f'<div class="padding-node">{i}</div>' for i in range(self.padding_nodes)
+        )
+        if path.startswith("/login"):
+            return LOGIN_TEMPLATE.format(
+                email=json.dumps(settings.TEST_EMAIL),
+                password=json.dumps(settings.TEST_PASSWORD),
+                padding=padding
+            )
+        if path.startswith("/projects"):
+            projects = "\n".join(
+                PROJECT_ITEM_TEMPLATE.format(
+                    project_id=f"stub-{i}", title=html.escape(f"Stub Project {i}")
+                )
+                for i in range(self.project_count)
+            )
+            return PROJECTS_TEMPLATE.format(projects=projects, padding=padding)
+        return None
+
+    def handle_api(self, method: str, path: str,
+                   body: Optional[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        """Ответить на XHR страницы проектов (создание и изменение проекта)"""
+        parts = [part for part in path.split("/") if part]
+        if parts[:2] != ["api-v2", "projects"] or len(parts) > 3:
+            return 404, {"message": "Not found"}
+        if not body or not body.get("title"):
+            return 400, {"message": "title is required"}
+        if method == "POST" and len(parts) == 2:
+            return 201, {"id": str(uuid.uuid4())}
+        if method == "PUT" and len(parts) == 3:
+            return 200, {"id": parts[2]}
+        return 405, {"message": "Method not allowed"}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond_api(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                body = json.loads(raw_body) if raw_body else None
+                status, payload = server.handle_api(self.command, urlsplit(self.path).path, body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_POST = do_PUT = _respond_api
+
+            def do_GET(self):
+                if server.delay:
+                    time.sleep(server.delay)
+                body = server.render(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class YougileAPIStubServer(_StubHTTPServer):
+    """Локальная заглушка REST API YouGile с хранением в памяти"""
+
+    API_PREFIX = "/api-v2"
+    # Коллекция -> поле ссылки на родителя, которое должно существовать
+    RESOURCES = {
+        "projects": None,
+        "boards": ("projectId", "projects"),
+        "columns": ("boardId", "boards"),
+        "tasks": ("columnId", "columns"),
+    }
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0):
+        self.storage: Dict[str, Dict[str, Dict[str, Any]]] = {
+            resource: {} for resource in self.RESOURCES
+        }
+        self._lock = threading.Lock()
+        super().__init__(host, port, delay)
+
+    @property
+    def projects(self) -> Dict[str, Dict[str, Any]]:
+        """Проекты, хранящиеся в заглушке"""
+        return self.storage["projects"]
+
+    @property
+    def base_url(self) -> str:
+        """URL API, подставляемый вместо Settings.API_URL"""
+        return f"{self.server_url}{self.API_PREFIX}"
+
+    def handle(self, method: str, path: str, query: Dict[str, list],
+               body: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        """Обработать запрос к API и вернуть (код, тело ответа)"""
+        parts = [part for part in path[len(self.API_PREFIX):].split("/") if part]
+        if not parts or parts[0] not in self.RESOURCES or len(parts) > 2:
+            return 404, {"message": "Not found"}
+        items = self.storage[parts[0]]
+
+        with self._lock:
+            if len(parts) == 1:
+                if method == "GET":
+                    limit = int(query.get("limit", ["50"])[0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    values = list(items.values())
+                    content = values[offset:offset + limit]
+                    return 200, {
+                        "paging": {"count": len(content), "limit": limit, "offset": offset,
+                                   "next": offset + limit < len(values)},
+                        "content": content,
+                    }
+                if method == "POST":
+                    if not body or not body.get("title"):
+                        return 400, {"message": "title is required"}
+                    parent = self.RESOURCES[parts[0]]
+                    if parent and body.get(parent[0]) not in self.storage[parent[1]]:
+                        return 400, {"message": f"{parent[0]} is invalid"}
+                    item_id = str(uuid.uuid4())
+                    items[item_id] = dict(body, id=item_id)
+                    return 201, {"id": item_id}
+                return 405, {"message": "Method not allowed"}
+
+            item_id = parts[1]
+            if item_id not in items:
+                return 404, {"message": "Not found"}
+            if method == "GET":
+                return 200, items[item_id]
+            if method == "PUT":
+                if body and "title" in body and not body["title"]:
+                    return 400, {"message": "title must not be empty"}
+                items[item_id].update(body or {})
+                return 200, {"id": item_id}
+            if method == "DELETE":
+                del items[item_id]
+                return 200, {"id": item_id}
+            return 405, {"message": "Method not allowed"}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                if server.delay:
+                    time.sleep(server.delay)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                if not self.headers.get("Authorization"):
+                    status, payload = 401, {"message": "Unauthorized"}
+                else:
+                    url = urlsplit(self.path)
+                    body = json.loads(raw_body) if raw_body else None
+                    status, payload = server.handle(
+                        self.command, url.path, parse_qs(url.query), body
+                    )
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _serve_in_subprocess(server_class, kwargs: Dict[str, Any], connection) -> None:
+    server = server_class(**kwargs).start()
+    connection.send(server.base_url)
+    # Работать, пока родитель не попросит остановиться (или не закроет канал)
+    try:
+        connection.recv()
+    except EOFError:
+        pass
+    server.stop()
+
+
+class StubProcess:
+    """Заглушка в отдельном процессе: ее память и сокеты не попадают в замеры клиента"""
+
+    def __init__(self, server_class, **kwargs):
+        self.server_class = server_class
+        self.kwargs = kwargs
+        self.base_url: Optional[str] = None
+        self._process = None
+        self._connection = None
+
+    def start(self) -> "StubProcess":
+        """Запустить процесс и дождаться адреса сервера"""
+        context = multiprocessing.get_context("spawn")
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve_in_subprocess,
+            args=(self.server_class, self.kwargs, child_connection),
+            daemon=True
+        )
+        self._process.start()
+        child_connection.close()
+        if not self._connection.poll(30):
+            self.stop()
+            raise RuntimeError(f"Заглушка {self.server_class.__name__} не запустилась")
+        self.base_url = self._connection.recv()
+        return self
+
+    def stop(self) -> None:
+        """Остановить процесс заглушки"""
+        try:
+            self._connection.send("stop")
+        except (OSError, ValueError):
+            pass
+        self._process.join(5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._connection.close()
@@ -0,0 +1,167 @@
+"""
+Хранилище истории длительностей тестов и шагов Allure (SQLite) и поиск замедлений
+"""
+import math
+import os
+import platform
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import allure_commons
+
+from config.settings import settings
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL,
+    browser TEXT,
+    base_url TEXT,
+    python TEXT,
+    platform TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id TEXT,
+    nodeid TEXT,
+    duration REAL,
+    outcome TEXT
+);
+CREATE TABLE IF NOT EXISTS step_results (
+    run_id TEXT,
+    nodeid TEXT,
+    step TEXT,
+    duration REAL,
+    failed INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results (nodeid);
+CREATE INDEX IF NOT EXISTS idx_step_results_key ON step_results (nodeid, step);
+CREATE INDEX IF NOT EXISTS idx_step_results_run ON step_results (run_id, nodeid, step);
+"""
+
+
+class TrendStore:
+    """SQLite-хранилище результатов запусков"""
+
+    def __init__(self, path: str = None):
+        self.path = path or settings.TRENDS_DB
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def record_run(self, run_id: str) -> None:
+        """Записать окружение запуска"""
+        # Порт заглушки меняется от запуска к запуску, а к концу сессии BASE_URL уже
+        # восстановлен - поэтому офлайн-запуски помечаются отдельно
+        base_url = "local-stub" if settings.LOCAL_STUB else settings.BASE_URL
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, time.time(), settings.BROWSER, base_url,
+                 platform.python_version(), platform.platform())
+            )
+
+    def record_tests(self, run_id: str, results: Dict[str, Dict[str, Any]]) -> None:
+        """Записать длительности и результаты тестов"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO test_results VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, result["duration"], result["outcome"])
+                 for nodeid, result in results.items()]
+            )
+
+    def record_steps(self, run_id: str, steps: List[Tuple[str, str, float, bool]]) -> None:
+        """Записать длительности шагов Allure: (nodeid, шаг, длительность, упал)"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO step_results VALUES (?, ?, ?, ?, ?)",
+                [(run_id, nodeid, step, duration, int(failed))
+                 for nodeid, step, duration, failed in steps]
+            )
+
+    def series(self, table: str) -> Dict[Tuple[str, ...], List[float]]:
+        """
+        Средняя длительность по ключу за каждый успешный запуск, в порядке запусков;
+        ключ - (браузер, base_url, nodeid[, шаг]): запуски в разных окружениях
+        не смешиваются в одной базовой линии
+        """
+        if table == "test_results":
+            key_columns, success = "t.nodeid", "MIN(t.outcome = 'passed') = 1"
+        else:
+            key_columns, success = "t.nodeid, t.step", "MAX(t.failed) = 0"
+        # Шаг с одним названием может выполняться в тесте несколько раз: окна трендов
+        # считаются в запусках, поэтому повторы внутри запуска сводятся к одному значению
+        rows = self.connection.execute(
+            f"SELECT r.browser, r.base_url, {key_columns}, AVG(t.duration) FROM {table} t "
+            f"JOIN runs r ON r.run_id = t.run_id "
+            f"GROUP BY t.run_id, r.browser, r.base_url, {key_columns} HAVING {success} "
+            f"ORDER BY MIN(r.started), t.run_id"
+        )
+        series: Dict[Tuple[str, ...], List[float]] = {}
+        for row in rows:
+            series.setdefault(tuple(row[:-1]), []).append(row[-1])
+        return series
+
+
+class AllureStepTimer:
+    """Слушатель allure-commons, замеряющий длительность каждого шага"""
+
+    def __init__(self):
+        self.current_nodeid: Optional[str] = None
+        self.steps: List[Tuple[str, str, float, bool]] = []
+        self._started: Dict[str, Tuple[str, float]] = {}
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._started[uuid] = (title, time.perf_counter())
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title, started = self._started.pop(uuid, (None, None))
+        if title is not None and self.current_nodeid:
+            self.steps.append(
+                (self.current_nodeid, title, time.perf_counter() - started, exc_type is not None)
+            )
+
+
+def _mean_var(values: List[float]) -> Tuple[float, float]:
+    mean = sum(values) / len(values)
+    var = sum((v - mean) ** 2 for v in values) / (len(values) - 1) if len(values) > 1 else 0.0
+    return mean, var
+
+
+def detect_slowdowns(series: Dict[Tuple[str, ...], List[float]], recent: int = 3,
+                     baseline: int = 20, min_baseline: int = 5, t_threshold: float = 3.0,
+                     min_ratio: float = 1.1) -> List[Dict[str, Any]]:
+    """
+    Найти значимые замедления: последние `recent` запусков против
+    скользящего базового окна из `baseline` предыдущих (односторонний t-тест Уэлча);
+    series - одно значение на запуск, как возвращает TrendStore.series
+    """
+    slowdowns = []
+    for key, durations in series.items():
+        recent_values = durations[-recent:]
+        baseline_values = durations[-(recent + baseline):-recent]
+        if len(recent_values) < recent or len(baseline_values) < min_baseline:
+            continue
+        recent_mean, recent_var = _mean_var(recent_values)
+        base_mean, base_var = _mean_var(baseline_values)
+        if base_mean <= 0 or recent_mean < base_mean * min_ratio:
+            continue
+        stderr = math.sqrt(recent_var / len(recent_values) + base_var / len(baseline_values))
+        t_stat = (recent_mean - base_mean) / stderr if stderr else math.inf
+        if t_stat >= t_threshold:
+            slowdowns.append({
+                "key": " :: ".join(key),
+                "baseline_mean": base_mean,
+                "recent_mean": recent_mean,
+                "ratio": recent_mean / base_mean,
+                "t": t_stat,
+            })
+    return sorted(slowdowns, key=lambda item: item["ratio"], reverse=True)
@@ -0,0 +1,210 @@
+"""
+Параллельное наполнение рабочего пространства: проекты -> доски -> колонки -> задачи
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from config.settings import settings
+from utils.api_client import YougileAPIClient
+from utils.file_lock import file_lock, write_json_atomic
+
+
+# Уровни дерева: (префикс ключа, сущность, метод создания, метод удаления, поле родителя)
+LEVELS = [
+    ("p", "project", "create_project", "delete_project", None),
+    ("b", "board", "create_board", "delete_board", "projectId"),
+    ("c", "column", "create_column", "delete_column", "boardId"),
+    ("t", "task", "create_task", "delete_task", "columnId"),
+]
+
+# Коды ответа, после которых запрос имеет смысл повторить
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class WorkspaceSpec:
+    """Форма дерева: количество проектов, досок на проект, колонок на доску, задач на колонку"""
+
+    def __init__(self, projects: int, boards: int = 0, columns: int = 0, tasks: int = 0):
+        self.counts = [projects, boards, columns, tasks]
+
+    @classmethod
+    def parse(cls, text: str) -> "WorkspaceSpec":
+        """Разобрать строку вида '200x5x1x50'"""
+        counts = [int(part) for part in text.lower().split("x")]
+        if not 1 <= len(counts) <= len(LEVELS):
+            raise ValueError(f"Некорректная спецификация дерева: {text}")
+        return cls(*counts)
+
+    def __str__(self) -> str:
+        return "x".join(str(count) for count in self.counts)
+
+    def children(self, key: Optional[str]) -> List[str]:
+        """Ключи дочерних узлов (для None - корневые проекты)"""
+        depth = 0 if key is None else key.count("/") + 1
+        if depth >= len(LEVELS) or not self.counts[depth]:
+            return []
+        prefix = "" if key is None else f"{key}/"
+        return [f"{prefix}{LEVELS[depth][0]}{i}" for i in range(self.counts[depth])]
+
+    @property
+    def total(self) -> int:
+        total, level_size = 0, 1
+        for count in self.counts:
+            level_size *= count
+            total += level_size
+        return total
+
+
+class WorkspaceSeeder:
+    """Создание и удаление дерева сущностей с сохранением прогресса для возобновления"""
+
+    def __init__(self, spec: WorkspaceSpec, name: str, workers: int = None,
+                 state_path: str = None,
+                 client_factory: Callable[[], YougileAPIClient] = YougileAPIClient,
+                 resume: bool = True):
+        self.spec = spec
+        self.name = name
+        self.workers = workers or settings.SEED_WORKERS
+        self.state_path = state_path or os.path.join(settings.SEED_STATE_DIR, f"{name}.json")
+        self.client_factory = client_factory
+        self.ids: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self._local = threading.local()
+        self._state_lock = threading.Lock()
+        self._last_flush = 0.0
+        if resume:
+            self._load_state()
+
+    def _client(self) -> YougileAPIClient:
+        # У каждого потока своя requests.Session
+        if not hasattr(self._local, "client"):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _load_state(self) -> None:
+        if not os.path.exists(self.state_path):
+            return
+        with open(self.state_path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        if state["spec"] != str(self.spec):
+            raise ValueError(
+                f"Состояние {self.state_path} создано для дерева {state['spec']}, "
+                f"а запрошено {self.spec}"
+            )
+        self.ids = state["ids"]
+
+    def flush_state(self, force: bool = False) -> None:
+        """Сохранить прогресс (не чаще раза в 2 секунды, если не force)"""
+        now = time.monotonic()
+        if not force and now - self._last_flush < 2:
+            return
+        with self._state_lock, file_lock(self.state_path):
+            write_json_atomic(self.state_path, {"name": self.name, "spec": str(self.spec),
+                                                "ids": dict(self.ids)})
+            self._last_flush = now
+
+    @staticmethod
+    def _level(key: str):
+        return LEVELS[key.count("/")]
+
+    def _call_with_retry(self, func: Callable, *args, attempts: int = 5):
+        for attempt in range(attempts):
+            response = func(*args)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            time.sleep(float(retry_after) if retry_after else 0.5 * 2 ** attempt)
+        return response
+
+    def _create(self, key: str, parent_id: Optional[str]) -> str:
+        _, entity, create_method, _, parent_field = self._level(key)
+        data = {"title": f"Seed {self.name} {key}"}
+        if parent_field:
+            data[parent_field] = parent_id
+        client = self._client()
+        response = self._call_with_retry(getattr(client, create_method), data)
+        return client.get_created_id(response, entity)
+
+    def _delete(self, key: str) -> None:
+        _, entity, _, delete_method, _ = self._level(key)
+        response = self._call_with_retry(getattr(self._client(), delete_method), self.ids[key])
+        if response.status_code not in (200, 204, 404):
+            raise Exception(f"Failed to delete {entity}: HTTP {response.status_code}")
+
+    def _drain(self, pending: Dict) -> None:
+        """Отменить еще не начатые создания и записать результаты уже начатых"""
+        running = {future: key for future, key in pending.items() if not future.cancel()}
+        for future, key in running.items():
+            try:
+                self.ids[key] = future.result()
+            except Exception as e:
+                self.errors[key] = str(e)
+        pending.clear()
+
+    def seed(self) -> Dict[str, str]:
+        """Создать дерево; уже созданные (по состоянию) узлы пропускаются"""
+        started = time.monotonic()
+        pending = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def schedule(key: str, parent_id: Optional[str]) -> None:
+                if key in self.ids:
+                    for child in self.spec.children(key):
+                        schedule(child, self.ids[key])
+                else:
+                    pending[executor.submit(self._create, key, parent_id)] = key
+
+            try:
+                for root in self.spec.children(None):
+                    schedule(root, None)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = pending.pop(future)
+                        try:
+                            self.ids[key] = future.result()
+                        except Exception as e:
+                            # Поддерево пропускается; повторный запуск продолжит с этого места
+                            self.errors[key] = str(e)
+                            continue
+                        for child in self.spec.children(key):
+                            schedule(child, self.ids[key])
+                    self.flush_state()
+            finally:
+                # И при ошибке, и при KeyboardInterrupt: уже выполняющиеся запросы могут
+                # создать сущности - дождаться их и сохранить ID, чтобы не оставить сирот
+                try:
+                    self._drain(pending)
+                finally:
+                    self.flush_state(force=True)
+
+        print(f"[seed:{self.name}] создано {len(self.ids)}/{self.spec.total} "
+              f"за {time.monotonic() - started:.1f} с, ошибок: {len(self.errors)}")
+        return self.ids
+
+    def teardown(self) -> None:
+        """Удалить дерево параллельно, от задач к проектам"""
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for depth in reversed(range(len(LEVELS))):
+                    keys = [key for key in self.ids if key.count("/") == depth]
+                    futures = {executor.submit(self._delete, key): key for key in keys}
+                    for future, key in futures.items():
+                        try:
+                            future.result()
+                            del self.ids[key]
+                        except Exception as e:
+                            self.errors[key] = str(e)
+                    self.flush_state(force=True)
+            finally:
+                self.flush_state(force=True)
+
+        if not self.ids and os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        print(f"[seed:{self.name}] удаление за {time.monotonic() - started:.1f} с, "
+              f"осталось {len(self.ids)}, ошибок: {len(self.errors)}")